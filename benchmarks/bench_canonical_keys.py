@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Canonical key profiling benchmark for Grazer deduplication.
+
+Measures the per-item cost of grazer._canonical_source_keys (precompiled
+patterns, memoized URL normalization, selectable digest) against the
+previous implementation. The workload is the mirror-heavy synthetic
+discovery batch from bench_dedup. Runs:
+
+- cold: the URL memo is cleared before the batch
+- warm: the same batch again, as on the next poll
+- blake2b: warm, with the cheaper digest
+
+The previous and current sha256 keys must be identical. Pass --profile to
+print the hottest functions of a cold run.
+
+Usage:
+    python benchmarks/bench_canonical_keys.py [--items 6000] [--profile]
+"""
+
+import argparse
+import cProfile
+import hashlib
+import json
+import os
+import pstats
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import grazer  # noqa: E402
+from grazer import (  # noqa: E402
+    _CONTENT_FIELDS, _CREATOR_FIELDS, _TIMESTAMP_FIELDS, _TRACKING_QUERY_KEYS, _URL_FIELDS,
+    _canonical_source_keys, _scalar_text,
+)
+
+from bench_dedup import synthetic_results  # noqa: E402
+
+
+def legacy_normalize_identity_text(value):
+    text = _scalar_text(value).casefold()
+    return re.sub(r"\W+", " ", text, flags=re.UNICODE).strip()
+
+
+def legacy_normalize_source_url(value):
+    raw = _scalar_text(value)
+    if not raw:
+        return ""
+    try:
+        parts = urlsplit(raw)
+    except ValueError:
+        return ""
+    if parts.scheme.casefold() not in {"http", "https"} or not parts.netloc:
+        return ""
+    host = parts.hostname.casefold() if parts.hostname else ""
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        return ""
+    if port and not (
+        (parts.scheme.casefold() == "http" and port == 80)
+        or (parts.scheme.casefold() == "https" and port == 443)
+    ):
+        host = f"{host}:{port}"
+    path = re.sub(r"/+", "/", parts.path or "/")
+    if path != "/":
+        path = path.rstrip("/")
+    query = urlencode(
+        sorted(
+            (key, query_value)
+            for key, query_value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.casefold().startswith("utm_") and key.casefold() not in _TRACKING_QUERY_KEYS
+        )
+    )
+    return urlunsplit((parts.scheme.casefold(), host, path, query, ""))
+
+
+def legacy_timestamp_bucket(value):
+    if isinstance(value, (int, float)):
+        try:
+            return datetime.fromtimestamp(value, timezone.utc).date().isoformat()
+        except (OSError, OverflowError, ValueError):
+            return ""
+    match = re.match(r"^\d{4}-\d{2}-\d{2}", _scalar_text(value))
+    return match.group(0) if match else ""
+
+
+def legacy_canonical_source_keys(platform, item):
+    """The pre-memoization implementation."""
+    keys = []
+    for field in _URL_FIELDS:
+        normalized_url = legacy_normalize_source_url(item.get(field))
+        if normalized_url:
+            keys.append(f"url:{hashlib.sha256(normalized_url.encode('utf-8')).hexdigest()[:24]}")
+            break
+    content = next((n for f in _CONTENT_FIELDS if (n := legacy_normalize_identity_text(item.get(f)))), "")
+    creator = next((n for f in _CREATOR_FIELDS if (n := legacy_normalize_identity_text(item.get(f)))), "")
+    bucket = next((n for f in _TIMESTAMP_FIELDS if (n := legacy_timestamp_bucket(item.get(f)))), "")
+    if content and (creator or bucket):
+        identity = "\n".join((content, creator, bucket))
+        keys.append(f"content:{hashlib.sha256(identity.encode('utf-8')).hexdigest()[:24]}")
+    if not keys:
+        stable_item = json.dumps(item, sort_keys=True, default=str, separators=(",", ":"))
+        keys.append(f"item:{platform}:{hashlib.sha256(stable_item.encode('utf-8')).hexdigest()[:24]}")
+    return keys
+
+
+def observations(items: int):
+    """Flatten a synthetic discovery batch into (platform, item) pairs."""
+    results = synthetic_results(items)
+    # Items without a URL exercise the content-only path.
+    for item in results["moltx"][::4]:
+        item.pop("url")
+    return [(platform, item) for platform, batch in results.items() if isinstance(batch, list) for item in batch]
+
+
+def per_item_us(fn, batch) -> float:
+    started = time.perf_counter()
+    for platform, item in batch:
+        fn(platform, item)
+    return (time.perf_counter() - started) / len(batch) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=6000, help="Observations in the batch (a sweep or two)")
+    parser.add_argument("--profile", action="store_true", help="Print a cProfile of a cold run")
+    args = parser.parse_args()
+
+    batch = observations(args.items)
+    mismatches = sum(
+        legacy_canonical_source_keys(platform, item) != _canonical_source_keys(platform, item)
+        for platform, item in batch
+    )
+
+    legacy = per_item_us(legacy_canonical_source_keys, batch)
+    grazer._normalize_url_text.cache_clear()
+    cold = per_item_us(_canonical_source_keys, batch)
+    warm = per_item_us(_canonical_source_keys, batch)
+    blake = per_item_us(lambda platform, item: _canonical_source_keys(platform, item, "blake2b"), batch)
+
+    print(f"{len(batch):,} observations, sha256 keys identical to previous: "
+          f"{'yes' if not mismatches else f'no ({mismatches} differ)'}")
+    print(f"{'run':>16}  {'us/item':>8}  {'speedup':>8}")
+    print(f"{'previous':>16}  {legacy:>8.2f}  {'1.0x':>8}")
+    for label, value in (("cold memo", cold), ("warm memo", warm), ("warm + blake2b", blake)):
+        print(f"{label:>16}  {value:>8.2f}  {legacy / value:>7.1f}x")
+    print(f"URL memo: {grazer._normalize_url_text.cache_info()}")
+
+    if args.profile:
+        grazer._normalize_url_text.cache_clear()
+        profiler = cProfile.Profile()
+        profiler.runcall(per_item_us, _canonical_source_keys, batch)
+        pstats.Stats(profiler).sort_stats("tottime").print_stats(12)
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
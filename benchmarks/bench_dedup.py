@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Cross-platform deduplication benchmark for Grazer.
+
+Times GrazerClient.deduplicate_discoveries (disjoint-set grouping) against
+the previous list-based implementation on synthetic discovery results full
+of mirrors. A third of the items reach two separate groups, by URL and
+by content, and so force a merge. Both implementations must return the
+same groups. The list-based version is quadratic in the number of merges,
+so by default it only runs up to --legacy-max items.
+
+Usage:
+    python benchmarks/bench_dedup.py [--items 10000 100000] [--legacy-max 20000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from grazer import GrazerClient, _canonical_source_keys  # noqa: E402
+
+
+def legacy_deduplicate_discoveries(results: Dict[str, List[Dict]]) -> List[Dict]:
+    """The pre-union-find implementation: list removal and key rewrites per merge."""
+    groups: List[Dict] = []
+    groups_by_key: Dict[str, Dict] = {}
+    for platform, items in results.items():
+        if platform.startswith("_") or not isinstance(items, list):
+            continue
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            keys = _canonical_source_keys(platform, item)
+            matching_groups: List[Dict] = []
+            for key in keys:
+                group = groups_by_key.get(key)
+                if group is not None and all(group is not known for known in matching_groups):
+                    matching_groups.append(group)
+            if matching_groups:
+                group = matching_groups[0]
+                for duplicate_group in matching_groups[1:]:
+                    group["variants"].extend(duplicate_group["variants"])
+                    for observed in duplicate_group["observed_platforms"]:
+                        if observed not in group["observed_platforms"]:
+                            group["observed_platforms"].append(observed)
+                    for known_key, known_group in list(groups_by_key.items()):
+                        if known_group is duplicate_group:
+                            groups_by_key[known_key] = group
+                    groups.remove(duplicate_group)
+            else:
+                group = {
+                    "canonical_key": keys[0],
+                    "canonical": {"platform": platform, "item": item},
+                    "observed_platforms": [],
+                    "variants": [],
+                }
+                groups.append(group)
+            if platform not in group["observed_platforms"]:
+                group["observed_platforms"].append(platform)
+            group["variants"].append({"platform": platform, "item": item})
+            for key in keys:
+                groups_by_key[key] = group
+    return groups
+
+
+PLATFORMS = ["bottube", "moltbook", "moltx", "fourclaw", "clawsta", "bluesky", "mastodon", "farcaster"]
+
+
+def synthetic_results(items: int) -> Dict[str, List[Dict]]:
+    """Discovery results of ``items`` posts in clusters of three observations.
+
+    In each cluster, the first post and a post on another platform are
+    unrelated by key. A third post shares the first one's URL and the
+    second one's title, and merges the two groups.
+    """
+    results: Dict[str, List[Dict]] = {platform: [] for platform in PLATFORMS}
+    clusters = max(1, items // 3)
+    for phase in range(3):
+        for cluster in range(clusters):
+            platform = PLATFORMS[(cluster + phase) % len(PLATFORMS)]
+            url = f"https://mirror.example.com/posts/{cluster}" if phase != 1 else f"https://origin.example.com/{cluster}"
+            title = f"Release notes {cluster}" if phase == 0 else f"Agent update number {cluster}"
+            results[platform].append({
+                "title": title,
+                "url": f"{url}?utm_source={platform}",
+                "author": f"agent{cluster % 997}",
+                "created_at": f"2024-05-{cluster % 28 + 1:02d}T10:00:00Z",
+            })
+    results["_errors"] = {}
+    return results
+
+
+def timed(fn, results):
+    started = time.perf_counter()
+    groups = fn(results)
+    return groups, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[10000, 100000], help="Observation counts to test")
+    parser.add_argument("--legacy-max", type=int, default=20000,
+                        help="Largest observation count the list-based version is run on")
+    args = parser.parse_args()
+
+    print(f"{'items':>8}  {'groups':>7}  {'union-find (s)':>15}  {'list-based (s)':>15}  {'speedup':>8}")
+    for items in args.items:
+        results = synthetic_results(items)
+        groups, current = timed(GrazerClient.deduplicate_discoveries, results)
+        if items <= args.legacy_max:
+            legacy_groups, legacy = timed(legacy_deduplicate_discoveries, results)
+            if legacy_groups != groups:
+                print(f"{items:>8}  output differs from the list-based implementation")
+                sys.exit(1)
+            print(f"{items:>8}  {len(groups):>7}  {current:>15.2f}  {legacy:>15.2f}  {legacy / current:>7.1f}x")
+        else:
+            print(f"{items:>8}  {len(groups):>7}  {current:>15.2f}  {'(skipped)':>15}  {'':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Feed parser micro-benchmark suite for Grazer.
+
+Runs the arXiv Atom and podcast RSS parsers (streamed through
+grazer.feeds.iter_feed_items) and the YouTube Atom parser (one combined
+field regex per entry, grazer.feeds.iter_entry_fields) over the saved
+fixtures in benchmarks/fixtures/. Each parser is timed on the whole feed
+and with ``--limit``, and compared with the previous per-field regex
+implementation. The suite also checks that both implementations give
+identical output on every fixture once the regex output's character and
+entity references (``&amp;``, ``&#39;``, ...) are decoded: the previous
+parsers returned them verbatim, the current ones decode them as any XML
+parser does. Every fixture has entries with such references.
+
+Usage:
+    python benchmarks/bench_feed_parsers.py [--limit 5] [--number 200]
+"""
+
+import argparse
+import html
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from grazer.arxiv_grazer import _parse_atom_entries  # noqa: E402
+from grazer.podcast_grazer import _parse_podcast_rss  # noqa: E402
+from grazer.youtube_grazer import _parse_youtube_rss  # noqa: E402
+
+from bench_arxiv_parser import regex_parse_atom_entries  # noqa: E402
+from bench_podcast_parser import regex_parse_podcast_rss  # noqa: E402
+
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def regex_parse_youtube_rss(xml_text: str):
+    """The previous implementation: one findall plus 7 searches per entry."""
+    entries = []
+    for raw in re.findall(r"<entry>(.*?)</entry>", xml_text, re.DOTALL):
+        video = {}
+        vid_match = re.search(r"<yt:videoId>(.*?)</yt:videoId>", raw)
+        if vid_match:
+            video["id"] = vid_match.group(1).strip()
+            video["url"] = f"https://www.youtube.com/watch?v={video['id']}"
+        title_match = re.search(r"<title>(.*?)</title>", raw, re.DOTALL)
+        if title_match:
+            video["title"] = " ".join(title_match.group(1).split())
+        author_match = re.search(r"<author>\s*<name>(.*?)</name>", raw)
+        if author_match:
+            video["channel"] = author_match.group(1).strip()
+        published_match = re.search(r"<published>(.*?)</published>", raw)
+        if published_match:
+            video["published"] = published_match.group(1).strip()
+        desc_match = re.search(r"<media:description>(.*?)</media:description>", raw, re.DOTALL)
+        if desc_match:
+            video["description"] = " ".join(desc_match.group(1).split())
+        thumb_match = re.search(r'<media:thumbnail[^>]+url="([^"]+)"', raw)
+        if thumb_match:
+            video["thumbnail"] = thumb_match.group(1)
+        views_match = re.search(r'<media:statistics[^>]+views="(\d+)"', raw)
+        if views_match:
+            video["views"] = int(views_match.group(1))
+        entries.append(video)
+    return entries
+
+
+def decoded(value):
+    """``value`` with the character and entity references in its strings decoded."""
+    if isinstance(value, str):
+        return html.unescape(value)
+    if isinstance(value, list):
+        return [decoded(item) for item in value]
+    if isinstance(value, dict):
+        return {key: decoded(item) for key, item in value.items()}
+    return value
+
+
+# (label, fixture file, current parser, previous regex parser)
+SUITE = [
+    ("arxiv", "arxiv_cs_ai.xml", _parse_atom_entries, regex_parse_atom_entries),
+    ("youtube", "youtube_channel.xml", _parse_youtube_rss, regex_parse_youtube_rss),
+    ("podcast", "podcast_show.xml", _parse_podcast_rss, regex_parse_podcast_rss),
+]
+
+
+def per_call_us(fn, number: int) -> float:
+    """Best of three runs of ``number`` calls, in microseconds per call."""
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--limit", type=int, default=5, help="Entries wanted in the limited runs")
+    parser.add_argument("--number", type=int, default=200, help="Parses per timing run")
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'feed':>8}  {'entries':>7}  {'run':>9}  {'current (us)':>12}  {'regex (us)':>11}  {'speedup':>8}  identical")
+    for label, filename, current, legacy in SUITE:
+        with open(os.path.join(FIXTURES, filename), "rb") as fh:
+            raw = fh.read()
+        text = raw.decode("utf-8")
+
+        entries = current(raw)
+        identical = entries == decoded(legacy(text))
+        failures += not identical
+        runs = [
+            ("full", lambda: current(raw), lambda: legacy(text)),
+            (f"limit={args.limit}", lambda: current(raw, args.limit), lambda: legacy(text)[:args.limit]),
+        ]
+        for run, current_fn, legacy_fn in runs:
+            new_us = per_call_us(current_fn, args.number)
+            old_us = per_call_us(legacy_fn, args.number)
+            print(f"{label:>8}  {len(entries):>7}  {run:>9}  {new_us:>12,.0f}  {old_us:>11,.0f}  "
+                  f"{old_us / new_us:>7.1f}x  {'yes' if identical else 'NO'}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
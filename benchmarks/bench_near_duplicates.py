@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate deduplication benchmark for Grazer.
+
+Times GrazerClient.deduplicate_discoveries with near_duplicates=True
+(MinHash + LSH banding) against the exact-key mode, on synthetic social
+posts where each story is reposted with light edits across Moltbook, MoltX
+and 4claw by different agents. It also reports how well the groups recover
+the stories:
+
+- recall: share of same-story item pairs that end up in the same group
+- precision: share of grouped pairs that really are the same story
+
+For batches up to --pairwise-max items, it also runs an all-pairs Jaccard
+comparison with the same threshold, to show what the LSH banding misses
+and how much time it saves.
+
+Usage:
+    python benchmarks/bench_near_duplicates.py [--items 50000] [--pairwise-max 3000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from grazer import GrazerClient, _DisjointSet, _near_duplicate_text  # noqa: E402
+from grazer.neardup import DEFAULT_SIMILARITY, MIN_SHINGLES, jaccard, shingles  # noqa: E402
+
+
+PLATFORMS = ["moltbook", "moltx", "fourclaw"]
+
+VOCABULARY = (
+    "agent agents rustchain release node nodes sync ledger wallet bridge validator proof stake "
+    "epoch block blocks index indexed utxo pagination faster lower fees latency update patch "
+    "network relay feed model models inference prompt reply thread vintage hardware mining "
+    "reward rewards governance proposal vote testnet mainnet launch today tonight weekly"
+).split()
+
+
+def _swap_word(words, rng):
+    words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    return words
+
+
+# Light edits a reposting agent makes: a tag appended, one word swapped,
+# different casing, the last word dropped.
+EDITS = [
+    lambda words, rng: words + [rng.choice(["🚀", "#rustchain", "via @relay", "(repost)"])],
+    _swap_word,
+    lambda words, rng: [words[0].upper()] + words[1:],
+    lambda words, rng: words[:-1],
+]
+
+
+def synthetic_reposts(items: int, copies: int = 3, seed: int = 7) -> Tuple[Dict[str, List[Dict]], List[int]]:
+    """Discovery results of ``items`` posts, about ``copies`` per story.
+
+    Returns the results and, in iteration order, the story id of each item.
+    """
+    rng = random.Random(seed)
+    results: Dict[str, List[Dict]] = {platform: [] for platform in PLATFORMS}
+    stories: Dict[str, List[int]] = {platform: [] for platform in PLATFORMS}
+    for story in range(max(1, items // copies)):
+        words = [rng.choice(VOCABULARY) for _ in range(rng.randint(14, 40))]
+        for copy in range(copies):
+            platform = PLATFORMS[(story + copy) % len(PLATFORMS)]
+            text = words if copy == 0 else rng.choice(EDITS)(list(words), rng)
+            results[platform].append({
+                "content": " ".join(text),
+                "author": f"agent{rng.randrange(5000)}",
+                "created_at": f"2024-05-{rng.randrange(1, 29):02d}T10:00:00Z",
+                "url": f"https://{platform}.example/p/{story}-{copy}",
+            })
+            stories[platform].append(story)
+    return results, [story for platform in PLATFORMS for story in stories[platform]]
+
+
+def pairwise_groups(results: Dict[str, List[Dict]], similarity: float) -> List[int]:
+    """Group label per item from comparing every pair of items."""
+    sets = _DisjointSet()
+    texts = []
+    for platform in PLATFORMS:
+        for item in results[platform]:
+            sets.add()
+            texts.append(shingles(_near_duplicate_text(item)))
+    for i, a in enumerate(texts):
+        if len(a) < MIN_SHINGLES:
+            continue
+        for j in range(i):
+            if len(texts[j]) >= MIN_SHINGLES and jaccard(a, texts[j]) >= similarity:
+                root_i, root_j = sets.find(i), sets.find(j)
+                if root_i != root_j:
+                    sets.union(root_i, root_j)
+    return [sets.find(node) for node in range(len(texts))]
+
+
+def labels_from_groups(groups: List[Dict]) -> Dict[int, int]:
+    """Group label per item, keyed by ``id(item)``."""
+    label_by_item = {
+        id(variant["item"]): label for label, group in enumerate(groups) for variant in group["variants"]
+    }
+    return label_by_item
+
+
+def pair_scores(labels: List[int], stories: List[int]) -> Tuple[float, float]:
+    """Pairwise recall and precision of ``labels`` against the true stories."""
+    def pairs(counter):
+        return sum(n * (n - 1) // 2 for n in counter.values())
+
+    true_pairs = pairs(Counter(stories))
+    grouped_pairs = pairs(Counter(labels))
+    correct_pairs = pairs(Counter(zip(labels, stories)))
+    return correct_pairs / max(true_pairs, 1), correct_pairs / max(grouped_pairs, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[50000], help="Observation counts to test")
+    parser.add_argument("--similarity", type=float, default=DEFAULT_SIMILARITY, help="Jaccard threshold")
+    parser.add_argument("--pairwise-max", type=int, default=3000,
+                        help="Largest observation count the all-pairs comparison is run on")
+    args = parser.parse_args()
+
+    print(f"{'items':>7}  {'mode':>9}  {'groups':>7}  {'seconds':>8}  {'recall':>7}  {'precision':>9}")
+    for items in args.items:
+        results, stories = synthetic_reposts(items)
+        ordered = [item for platform in PLATFORMS for item in results[platform]]
+        for mode, near in (("exact", False), ("near", True)):
+            started = time.perf_counter()
+            groups = GrazerClient.deduplicate_discoveries(
+                results, near_duplicates=near, similarity=args.similarity
+            )
+            elapsed = time.perf_counter() - started
+            label_by_item = labels_from_groups(groups)
+            recall, precision = pair_scores([label_by_item[id(item)] for item in ordered], stories)
+            print(f"{items:>7}  {mode:>9}  {len(groups):>7}  {elapsed:>8.2f}  {recall:>7.3f}  {precision:>9.3f}")
+        if items <= args.pairwise_max:
+            started = time.perf_counter()
+            labels = pairwise_groups(results, args.similarity)
+            elapsed = time.perf_counter() - started
+            recall, precision = pair_scores(labels, stories)
+            print(f"{items:>7}  {'all-pairs':>9}  {len(set(labels)):>7}  {elapsed:>8.2f}  "
+                  f"{recall:>7.3f}  {precision:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
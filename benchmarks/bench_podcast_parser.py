@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Podcast RSS fetch+parse benchmark for Grazer.
+
+Compares the streaming parser in grazer.podcast_grazer, fed from a
+streamed response body and stopping after ``limit`` episodes, against the
+previous path: read the whole body via ``resp.text``, run the regex parser
+over every item and slice afterwards. Reports wall time, peak traced
+memory and bytes read from the body on a large synthetic feed, and checks
+that both parsers agree on the full feed.
+
+Usage:
+    python benchmarks/bench_podcast_parser.py [--items 3000] [--limit 10] [--repeat 5]
+"""
+
+import argparse
+import io
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from grazer.podcast_grazer import DEFAULT_MAX_FEED_BYTES, _parse_podcast_rss  # noqa: E402
+
+
+def regex_parse_podcast_rss(xml_text: str):
+    """The pre-streaming implementation: regex scans over every item."""
+    episodes = []
+    for raw in re.findall(r"<item>(.*?)</item>", xml_text, re.DOTALL):
+        ep = {}
+        title_match = re.search(r"<title>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</title>", raw, re.DOTALL)
+        if title_match:
+            ep["title"] = " ".join(title_match.group(1).split())
+        desc_match = re.search(r"<description>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</description>", raw, re.DOTALL)
+        if desc_match:
+            ep["description"] = " ".join(desc_match.group(1).split())[:500]
+        pub_match = re.search(r"<pubDate>(.*?)</pubDate>", raw)
+        if pub_match:
+            ep["published"] = pub_match.group(1).strip()
+        enc_match = re.search(r'<enclosure[^>]+url="([^"]+)"', raw)
+        if enc_match:
+            ep["audio_url"] = enc_match.group(1)
+        dur_match = re.search(r"<itunes:duration>(.*?)</itunes:duration>", raw)
+        if dur_match:
+            ep["duration"] = dur_match.group(1).strip()
+        link_match = re.search(r"<link>(.*?)</link>", raw)
+        if link_match:
+            ep["url"] = link_match.group(1).strip()
+        ep_num_match = re.search(r"<itunes:episode>(.*?)</itunes:episode>", raw)
+        if ep_num_match:
+            ep["episode_number"] = ep_num_match.group(1).strip()
+        episodes.append(ep)
+    return episodes
+
+
+ITEM = """    <item>
+      <title><![CDATA[Episode {n}: Agents, Tools and Long Context]]></title>
+      <description><![CDATA[{notes}]]></description>
+      <pubDate>Mon, 01 Jan 2024 {hour:02d}:00:00 +0000</pubDate>
+      <enclosure url="https://cdn.example.com/show/ep{n}.mp3" type="audio/mpeg" length="48000000"/>
+      <itunes:duration>01:{minute:02d}:00</itunes:duration>
+      <itunes:episode>{n}</itunes:episode>
+      <itunes:explicit>false</itunes:explicit>
+      <link>https://show.example.com/episodes/{n}</link>
+      <guid isPermaLink="false">show-ep-{n}</guid>
+    </item>
+"""
+
+SHOW_NOTES = (
+    "In this episode we talk with researchers about agent architectures, tool use, "
+    "evaluation harnesses and what long context windows change for retrieval. "
+) * 12
+
+
+def synthetic_feed(items: int) -> bytes:
+    """Build a podcast RSS feed with ``items`` episodes and long show notes."""
+    body = "".join(
+        ITEM.format(n=items - n, notes=SHOW_NOTES, hour=n % 24, minute=n % 60) for n in range(items)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0" xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd">\n'
+        "  <channel>\n"
+        "    <title>Benchmark Show</title>\n"
+        "    <link>https://show.example.com</link>\n"
+        f"{body}  </channel>\n</rss>\n"
+    ).encode()
+
+
+def streamed_response(feed: bytes):
+    """A ``requests.Response`` whose body is read incrementally from memory."""
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.raw = io.BytesIO(feed)
+    resp.headers["Content-Type"] = "application/rss+xml; charset=utf-8"
+    return resp
+
+
+def fetch_streaming(feed: bytes, limit: int):
+    resp = streamed_response(feed)
+    episodes = _parse_podcast_rss(resp, limit, max_bytes=DEFAULT_MAX_FEED_BYTES)
+    return episodes, resp.raw.tell()
+
+
+def fetch_legacy(feed: bytes, limit: int):
+    resp = streamed_response(feed)
+    episodes = regex_parse_podcast_rss(resp.text)[:limit]
+    return episodes, resp.raw.tell()
+
+
+def measure(fn, feed: bytes, limit: int, repeat: int):
+    """Return (best ms, peak traced KiB, bytes read) for ``fn(feed, limit)``."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(feed, limit)
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    _, read = fn(feed, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings) * 1000, peak / 1024, read
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=3000, help="Episodes in the synthetic feed")
+    parser.add_argument("--limit", type=int, default=10, help="Episodes wanted")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    feed = synthetic_feed(args.items)
+    identical = _parse_podcast_rss(feed) == regex_parse_podcast_rss(feed.decode())
+    print(f"feed: {len(feed) / 1024 / 1024:.1f} MiB, {args.items} items, "
+          f"identical output on full feed: {'yes' if identical else 'no'}")
+
+    print(f"{'path':>10}  {'time (ms)':>10}  {'peak mem (KiB)':>15}  {'body read (KiB)':>16}")
+    for label, fn in (("streaming", fetch_streaming), ("regex", fetch_legacy)):
+        ms, peak, read = measure(fn, feed, args.limit, args.repeat)
+        print(f"{label:>10}  {ms:>10.1f}  {peak:>15,.0f}  {read / 1024:>16,.0f}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Rate limiter contention benchmark for Grazer.
+
+Measures ThreadSafeRateLimiter.acquire() throughput with 1, 8 and 64
+threads against the previous list-rebuilding implementation. The budget is
+large enough that nothing blocks, so the numbers isolate lock and pruning
+overhead with a big, densely populated window.
+
+Usage:
+    python benchmarks/bench_rate_limiter.py [--acquires 20000] [--threads 1 8 64]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from grazer.ratelimit import ThreadSafeRateLimiter  # noqa: E402
+
+
+class ListRateLimiter:
+    """The pre-deque implementation: rebuilds the timestamp list on every call."""
+
+    def __init__(self, max_requests: int = 60, window_seconds: float = 60.0):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._condition = threading.Condition()
+        self._requests = []
+
+    def _prune(self, now):
+        self._requests = [t for t in self._requests if now - t < self.window_seconds]
+
+    def acquire(self):
+        with self._condition:
+            now = time.time()
+            self._prune(now)
+            while len(self._requests) >= self.max_requests:
+                wait_time = self._requests[0] + self.window_seconds - time.time()
+                if wait_time > 0:
+                    self._condition.wait(timeout=wait_time)
+                self._prune(time.time())
+            self._requests.append(time.time())
+            self._condition.notify_all()
+
+
+def run(limiter_cls, threads: int, acquires: int) -> float:
+    """Return acquires per second for ``acquires`` calls split over ``threads``."""
+    limiter = limiter_cls(max_requests=acquires * 2, window_seconds=3600.0)
+    per_thread = acquires // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        for _ in range(per_thread):
+            limiter.acquire()
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return per_thread * threads / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--acquires", type=int, default=20000, help="Total acquire() calls per run")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8, 64], help="Thread counts to test")
+    args = parser.parse_args()
+
+    print(f"{'threads':>8}  {'deque (acq/s)':>14}  {'list (acq/s)':>13}  {'speedup':>8}")
+    for threads in args.threads:
+        current = run(ThreadSafeRateLimiter, threads, args.acquires)
+        legacy = run(ListRateLimiter, threads, args.acquires)
+        print(f"{threads:>8}  {current:>14,.0f}  {legacy:>13,.0f}  {current / legacy:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Cross-process rate limiter benchmark for Grazer.
+
+Spawns N worker processes that all call SQLiteRateLimiter.acquire() on
+the same database file and key, and reports per-acquire latency
+percentiles. The budget is large enough that nothing blocks, so the
+numbers show locking and transaction overhead under contention.
+
+Usage:
+    python benchmarks/bench_shared_rate_limiter.py [--acquires 500] [--processes 1 4 16]
+"""
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from grazer.ratelimit import SQLiteRateLimiter  # noqa: E402
+
+
+def worker(path: str, acquires: int, start_event, queue) -> None:
+    limiter = SQLiteRateLimiter(path, "bench", max_requests=10_000_000, window_seconds=3600.0)
+    start_event.wait()
+    latencies = []
+    for _ in range(acquires):
+        started = time.perf_counter()
+        limiter.acquire()
+        latencies.append(time.perf_counter() - started)
+    queue.put(latencies)
+
+
+def run(processes: int, acquires: int) -> list:
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ratelimit.db")
+        SQLiteRateLimiter(path, "bench")  # Create the schema before the race
+        start_event = context.Event()
+        queue = context.Queue()
+        pool = [context.Process(target=worker, args=(path, acquires, start_event, queue)) for _ in range(processes)]
+        for proc in pool:
+            proc.start()
+        start_event.set()
+        latencies = []
+        for _ in pool:
+            latencies.extend(queue.get())
+        for proc in pool:
+            proc.join()
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--acquires", type=int, default=500, help="acquire() calls per process")
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 4, 16], help="Process counts to test")
+    args = parser.parse_args()
+
+    print(f"{'procs':>6}  {'mean (ms)':>9}  {'p50 (ms)':>9}  {'p95 (ms)':>9}  {'p99 (ms)':>9}")
+    for processes in args.processes:
+        latencies = sorted(run(processes, args.acquires))
+        mean = statistics.mean(latencies) * 1000
+        p50 = statistics.median(latencies) * 1000
+        p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+        p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+        print(f"{processes:>6}  {mean:>9.3f}  {p50:>9.3f}  {p95:>9.3f}  {p99:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
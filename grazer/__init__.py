@@ -8,8 +8,11 @@ import json
 import re
 import threading
 import time as _time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
-from typing import Any, List, Dict, Optional
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Iterator, List, Dict, Optional, Union
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
@@ -26,8 +29,16 @@ from grazer.openreview_grazer import OpenReviewGrazer
 from grazer.mastodon_grazer import MastodonGrazer
 from grazer.nostr_grazer import NostrGrazer
 from grazer.bottube_grazer import BoTTubeGrazer
-
-# Platform registry — canonical names, URLs, and auth requirements
+from grazer.ratelimit import RateLimiterRegistry, SQLiteRateLimiter, ThreadSafeRateLimiter
+from grazer.cache import ResponseCache, SQLiteResponseCache
+from grazer.circuit import CircuitBreakerRegistry, CircuitOpen
+from grazer.cursors import CursorStore, SQLiteCursorStore
+from grazer.neardup import DEFAULT_SIMILARITY, NearDuplicateIndex, lsh_keys, shingles
+from grazer.seen import SeenIndex, SQLiteSeenIndex
+from grazer.transport import DEFAULT_POOL_MAXSIZE, DeadlineExceeded, HttpTransport, RetryPolicy
+
+# Platform registry — canonical names, URLs, auth requirements, and optional
+# rate_limit budgets (platforms without one get 60 requests per 60 seconds)
 PLATFORMS = {
     "bottube":    {"url": "https://bottube.ai/api/stats",              "auth": False},
     "moltbook":   {"url": "https://www.moltbook.com/api/v1/posts",     "auth": False},
@@ -44,15 +55,60 @@ PLATFORMS = {
     "thecolony":  {"url": "https://thecolony.cc/api/v1/colonies",     "auth": True},
     "moltx":      {"url": "https://moltx.io/v1/posts",                 "auth": True},
     "moltexchange": {"url": "https://moltexchange.ai/v1/questions",   "auth": True},
-    "bluesky":      {"url": "https://public.api.bsky.app/xrpc/",      "auth": False},
+    "bluesky":      {"url": "https://public.api.bsky.app/xrpc/",      "auth": False,
+                     "rate_limit": {"max_requests": 3000, "window_seconds": 300.0}},
     "farcaster":    {"url": "https://api.neynar.com/v2/farcaster/",    "auth": False},
-    "semantic_scholar": {"url": "https://api.semanticscholar.org/graph/v1/", "auth": False},
+    "semantic_scholar": {"url": "https://api.semanticscholar.org/graph/v1/", "auth": False,
+                         "rate_limit": {"max_requests": 100, "window_seconds": 300.0}},
     "openreview":   {"url": "https://api2.openreview.net/",            "auth": False},
-    "mastodon":     {"url": "https://mastodon.social/api/v1/",         "auth": False},
+    "mastodon":     {"url": "https://mastodon.social/api/v1/",         "auth": False,
+                     "rate_limit": {"max_requests": 300, "window_seconds": 300.0}},
     "nostr":        {"url": "https://api.nostr.band/",                 "auth": False},
 }
 
+# Discovery hosts outside PLATFORMS, mapped to the platform name used for
+# rate limiting and transport metrics, plus their budgets.
+_DISCOVERY_HOSTS = {
+    "bottube.ai": "bottube",
+    "export.arxiv.org": "arxiv",
+    "www.youtube.com": "youtube",
+    "www.googleapis.com": "youtube",
+    "itunes.apple.com": "podcasts",
+    "api2.openreview.net": "openreview",
+}
+_DISCOVERY_RATE_LIMITS = {
+    # arXiv asks API clients for at most one request every three seconds.
+    "arxiv": {"max_requests": 1, "window_seconds": 3.0},
+}
+
+# Worker threads used by discover_all to fan out platform calls concurrently
+DEFAULT_DISCOVERY_WORKERS = 8
+
+# How often the sweep re-checks per-platform soft deadlines while waiting
+_DEADLINE_POLL_SECONDS = 0.05
+
+# Health probes: per-probe timeout, concurrent probes, and how long a probe
+# result is reused by discover_all(include_health=True).
+HEALTH_PROBE_TIMEOUT = 5.0
+HEALTH_PROBE_WORKERS = 16
+DEFAULT_HEALTH_TTL = 60.0
+
 _TRACKING_QUERY_KEYS = {"fbclid", "gclid", "mc_cid", "mc_eid"}
+_NON_WORD_PATTERN = re.compile(r"\W+")
+_REPEATED_SLASHES_PATTERN = re.compile(r"/+")
+_DATE_PREFIX_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Normalized source URLs memoized per process; discovery feeds keep
+# returning the same hosts and URLs from one poll to the next.
+_URL_MEMO_SIZE = 8192
+
+# Digests for canonical keys. sha256 is the default and what earlier
+# releases produced; blake2b is cheaper for these short inputs but yields
+# different keys, so use one digest consistently per stored index.
+_KEY_DIGESTS = {
+    "sha256": lambda data: hashlib.sha256(data).hexdigest()[:24],
+    "blake2b": lambda data: hashlib.blake2b(data, digest_size=12).hexdigest(),
+}
 _URL_FIELDS = (
     "canonical_url",
     "source_url",
@@ -92,6 +148,18 @@ _TIMESTAMP_FIELDS = (
     "updated_at",
 )
 
+# discover_all(incremental=True): the discover_* argument each platform's
+# API accepts for "newer than the cursor", and the cursor field it takes.
+# Every other platform is filtered client-side by timestamp only.
+_SINCE_PARAMETERS = {
+    "arxiv": ("since", "timestamp"),
+    "bluesky": ("since", "timestamp"),
+    "farcaster": ("since", "timestamp"),
+    "mastodon": ("since_id", "id"),
+}
+# Platforms whose item ids increase over time.
+_ID_CURSOR_PLATFORMS = frozenset({"mastodon"})
+
 
 def _scalar_text(value: Any) -> str:
     if value is None:
@@ -109,46 +177,51 @@ def _scalar_text(value: Any) -> str:
 
 def _normalize_identity_text(value: Any) -> str:
     text = _scalar_text(value).casefold()
-    return re.sub(r"\W+", " ", text, flags=re.UNICODE).strip()
+    return _NON_WORD_PATTERN.sub(" ", text).strip()
 
 
 def _normalize_source_url(value: Any) -> str:
     raw = _scalar_text(value)
     if not raw:
         return ""
+    return _normalize_url_text(raw)
 
+
+@lru_cache(maxsize=_URL_MEMO_SIZE)
+def _normalize_url_text(raw: str) -> str:
     try:
         parts = urlsplit(raw)
     except ValueError:
         return ""
-    if parts.scheme.casefold() not in {"http", "https"} or not parts.netloc:
+    scheme = parts.scheme.casefold()
+    if scheme not in {"http", "https"} or not parts.netloc:
         return ""
 
-    host = parts.hostname.casefold() if parts.hostname else ""
+    hostname = parts.hostname
+    host = hostname.casefold() if hostname else ""
     if host.startswith("www."):
         host = host[4:]
     try:
         port = parts.port
     except ValueError:
         return ""
-    if port and not (
-        (parts.scheme.casefold() == "http" and port == 80)
-        or (parts.scheme.casefold() == "https" and port == 443)
-    ):
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
         host = f"{host}:{port}"
 
-    path = re.sub(r"/+", "/", parts.path or "/")
+    path = _REPEATED_SLASHES_PATTERN.sub("/", parts.path or "/")
     if path != "/":
         path = path.rstrip("/")
-    query = urlencode(
-        sorted(
-            (key, query_value)
-            for key, query_value in parse_qsl(parts.query, keep_blank_values=True)
-            if not key.casefold().startswith("utm_")
-            and key.casefold() not in _TRACKING_QUERY_KEYS
+    query = ""
+    if parts.query:
+        query = urlencode(
+            sorted(
+                (key, query_value)
+                for key, query_value in parse_qsl(parts.query, keep_blank_values=True)
+                if not key.casefold().startswith("utm_")
+                and key.casefold() not in _TRACKING_QUERY_KEYS
+            )
         )
-    )
-    return urlunsplit((parts.scheme.casefold(), host, path, query, ""))
+    return urlunsplit((scheme, host, path, query, ""))
 
 
 def _timestamp_bucket(value: Any) -> str:
@@ -159,18 +232,131 @@ def _timestamp_bucket(value: Any) -> str:
             return ""
 
     text = _scalar_text(value)
-    match = re.match(r"^\d{4}-\d{2}-\d{2}", text)
+    match = _DATE_PREFIX_PATTERN.match(text)
     return match.group(0) if match else ""
 
 
-def _canonical_source_keys(platform: str, item: Dict) -> List[str]:
+def _item_timestamp(item: Dict) -> Optional[datetime]:
+    """The first parseable timestamp field of ``item``, as an aware UTC datetime."""
+    for field in _TIMESTAMP_FIELDS:
+        value = item.get(field)
+        if not value or isinstance(value, bool):
+            continue
+        try:
+            if isinstance(value, (int, float)):
+                return datetime.fromtimestamp(value, timezone.utc)
+            text = _scalar_text(value)
+            # ISO-8601 from JSON APIs and Atom, RFC 2822 from RSS pubDate.
+            if text[:1].isdigit():
+                stamp = datetime.fromisoformat(text.replace("Z", "+00:00"))
+            else:
+                stamp = parsedate_to_datetime(text)
+        except (OSError, OverflowError, TypeError, ValueError):
+            continue
+        if stamp.tzinfo is None:
+            return stamp.replace(tzinfo=timezone.utc)
+        return stamp.astimezone(timezone.utc)
+    return None
+
+
+def _newer_than_cursor(platform: str, item: Dict, cursor: Dict) -> bool:
+    """True unless ``item`` is at or before the platform's discovery cursor.
+
+    Items without a parseable timestamp are kept. Items at exactly the
+    cursor timestamp are dropped only if their key was recorded there.
+    Mastodon items are also compared by status id.
+    """
+    if "id" in cursor and platform in _ID_CURSOR_PLATFORMS:
+        try:
+            if int(item.get("id")) <= int(cursor["id"]):
+                return False
+        except (TypeError, ValueError):
+            pass
+    stamp = _item_timestamp(item)
+    if stamp is None or not cursor.get("timestamp"):
+        return True
+    since = datetime.fromisoformat(cursor["timestamp"])
+    if stamp != since:
+        return stamp > since
+    return _canonical_source_keys(platform, item)[0] not in cursor.get("keys", ())
+
+
+def _advance_cursor(platform: str, items: List[Dict], cursor: Dict) -> Dict:
+    """The discovery cursor after ``items``, starting from ``cursor``.
+
+    The cursor holds the newest item timestamp (ISO-8601 UTC), the first
+    canonical key of each item at exactly that timestamp and, for Mastodon,
+    the newest status id.
+    """
+    advanced = dict(cursor)
+    newest = datetime.fromisoformat(cursor["timestamp"]) if cursor.get("timestamp") else None
+    keys = list(cursor.get("keys", ()))
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        if platform in _ID_CURSOR_PLATFORMS:
+            try:
+                if "id" not in advanced or int(item.get("id")) > int(advanced["id"]):
+                    advanced["id"] = str(int(item.get("id")))
+            except (TypeError, ValueError):
+                pass
+        stamp = _item_timestamp(item)
+        if stamp is None or (newest is not None and stamp < newest):
+            continue
+        if newest is None or stamp > newest:
+            newest, keys = stamp, []
+        key = _canonical_source_keys(platform, item)[0]
+        if key not in keys:
+            keys.append(key)
+    if newest is not None:
+        advanced["timestamp"] = newest.isoformat()
+        advanced["keys"] = keys
+    return advanced
+
+
+def _since_arguments(cursors: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Server-side "newer than" arguments for the platforms whose APIs take one."""
+    arguments: Dict[str, Dict] = {}
+    for platform, (argument, field) in _SINCE_PARAMETERS.items():
+        value = cursors.get(platform, {}).get(field)
+        if value:
+            arguments[platform] = {argument: value}
+    return arguments
+
+
+def _is_transport_failure(outcome: Any) -> bool:
+    """Whether a discovery outcome says the platform itself is unhealthy.
+
+    Only connection errors, timeouts (including deadlines) and HTTP 5xx/429
+    responses count; a parsing error or a 4xx means the platform answered.
+    """
+    if isinstance(outcome, (requests.ConnectionError, requests.Timeout, DeadlineExceeded)):
+        return True
+    if isinstance(outcome, requests.HTTPError) and outcome.response is not None:
+        status = outcome.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+def _near_duplicate_text(item: Dict) -> str:
+    """Every distinct normalized content field of ``item``, joined."""
+    texts = dict.fromkeys(
+        normalized for field in _CONTENT_FIELDS if (normalized := _normalize_identity_text(item.get(field)))
+    )
+    return " ".join(texts)
+
+
+def _canonical_source_keys(platform: str, item: Dict, digest: str = "sha256") -> List[str]:
+    try:
+        hexdigest = _KEY_DIGESTS[digest]
+    except KeyError:
+        raise ValueError(f"Unknown key digest {digest!r}; expected one of {sorted(_KEY_DIGESTS)}") from None
     keys: List[str] = []
 
     for field in _URL_FIELDS:
         normalized_url = _normalize_source_url(item.get(field))
         if normalized_url:
-            digest = hashlib.sha256(normalized_url.encode("utf-8")).hexdigest()[:24]
-            keys.append(f"url:{digest}")
+            keys.append(f"url:{hexdigest(normalized_url.encode('utf-8'))}")
             break
 
     content = next(
@@ -181,97 +367,64 @@ def _canonical_source_keys(platform: str, item: Dict) -> List[str]:
         ),
         "",
     )
-    creator = next(
-        (
-            normalized
-            for field in _CREATOR_FIELDS
-            if (normalized := _normalize_identity_text(item.get(field)))
-        ),
-        "",
-    )
-    bucket = next(
-        (
-            normalized
-            for field in _TIMESTAMP_FIELDS
-            if (normalized := _timestamp_bucket(item.get(field)))
-        ),
-        "",
-    )
+    creator = ""
+    bucket = ""
+    if content:
+        creator = next(
+            (
+                normalized
+                for field in _CREATOR_FIELDS
+                if (normalized := _normalize_identity_text(item.get(field)))
+            ),
+            "",
+        )
+        bucket = next(
+            (
+                normalized
+                for field in _TIMESTAMP_FIELDS
+                if (normalized := _timestamp_bucket(item.get(field)))
+            ),
+            "",
+        )
     if content and (creator or bucket):
         identity = "\n".join((content, creator, bucket))
-        digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:24]
-        keys.append(f"content:{digest}")
+        keys.append(f"content:{hexdigest(identity.encode('utf-8'))}")
 
     if not keys:
         stable_item = json.dumps(item, sort_keys=True, default=str, separators=(",", ":"))
-        digest = hashlib.sha256(stable_item.encode("utf-8")).hexdigest()[:24]
-        keys.append(f"item:{platform}:{digest}")
+        keys.append(f"item:{platform}:{hexdigest(stable_item.encode('utf-8'))}")
 
     return keys
 
 
-class ThreadSafeRateLimiter:
-    """Thread-safe rate limiter using sliding window algorithm.
-    
-    Prevents race conditions when multiple threads make concurrent requests.
-    Uses threading.Condition so threads deterministically queue and wake
-    without the lock-release-then-sleep concurrency hole.
-    """
-    
-    def __init__(self, max_requests: int = 60, window_seconds: float = 60.0):
-        """Initialize rate limiter.
-        
-        Args:
-            max_requests: Maximum requests allowed in the time window.
-            window_seconds: Time window in seconds.
-        """
-        self.max_requests = max_requests
-        self.window_seconds = window_seconds
-        self._condition = threading.Condition()
-        self._requests: List[float] = []  # Timestamps of recent requests
-    
-    def _prune(self, now: float) -> None:
-        """Remove timestamps outside the current window. Must hold self._condition."""
-        self._requests = [t for t in self._requests if now - t < self.window_seconds]
-    
-    def acquire(self) -> None:
-        """Acquire permission to make a request. Blocks if rate limit exceeded.
-        
-        Uses Condition.wait_for so only one thread at a time progresses past
-        the wait. After recording a request, notify_all() wakes waiting threads
-        so they can re-evaluate availability.
-        """
-        with self._condition:
-            now = _time.time()
-            self._prune(now)
-            
-            # Deterministically compute when a slot will be available.
-            # If we are at capacity, the earliest slot opens when the oldest
-            # timestamp falls outside the window.
-            while len(self._requests) >= self.max_requests:
-                oldest = self._requests[0]
-                wait_until = oldest + self.window_seconds
-                wait_time = wait_until - _time.time()
-                if wait_time > 0:
-                    self._condition.wait(timeout=wait_time)
-                now = _time.time()
-                self._prune(now)
-            
-            # Record this request
-            self._requests.append(_time.time())
-            self._condition.notify_all()
-    
-    def get_stats(self) -> Dict:
-        """Get current rate limiter statistics."""
-        with self._condition:
-            now = _time.time()
-            recent = [t for t in self._requests if now - t < self.window_seconds]
-            return {
-                "requests_in_window": len(recent),
-                "max_requests": self.max_requests,
-                "window_seconds": self.window_seconds,
-                "available": max(0, self.max_requests - len(recent)),
-            }
+class _DisjointSet:
+    """Union-find over dense integer ids, with path halving and union by size."""
+
+    def __init__(self):
+        self.parent: List[int] = []
+        self.size: List[int] = []
+
+    def add(self) -> int:
+        """Create a singleton set and return its id."""
+        node = len(self.parent)
+        self.parent.append(node)
+        self.size.append(1)
+        return node
+
+    def find(self, node: int) -> int:
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, a: int, b: int) -> int:
+        """Merge the sets rooted at ``a`` and ``b``; return the new root."""
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return a
 
 
 class GrazerClient:
@@ -299,6 +452,17 @@ class GrazerClient:
         llm_model: str = "gpt-oss-120b",
         llm_api_key: Optional[str] = None,
         timeout: int = 15,
+        max_workers: int = DEFAULT_DISCOVERY_WORKERS,
+        rate_limits: Optional[Dict[str, Dict]] = None,
+        rate_limit_db: Optional[str] = None,
+        transport: Optional[HttpTransport] = None,
+        cache: Optional[ResponseCache] = None,
+        health_ttl: float = DEFAULT_HEALTH_TTL,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        retry: Optional[RetryPolicy] = None,
+        hedge_platforms: Optional[List[str]] = None,
+        seen_index: Optional[SeenIndex] = None,
+        cursor_store: Optional[CursorStore] = None,
     ):
         self.bottube_key = bottube_key
         self.moltbook_key = moltbook_key
@@ -317,29 +481,72 @@ class GrazerClient:
         self.farcaster_api_key = farcaster_api_key
         self.semantic_scholar_api_key = semantic_scholar_api_key
         self._colony_jwt = None  # Cached JWT from API key exchange
-        self._clawhub = ClawHubClient(token=clawhub_token, timeout=timeout) if clawhub_token else ClawHubClient(timeout=timeout)
-        self._bottube = BoTTubeGrazer(api_key=bottube_key, timeout=timeout)
-        self._arxiv = ArxivGrazer(timeout=timeout)
-        self._youtube = YouTubeGrazer(api_key=youtube_api_key, timeout=timeout)
-        self._podcast = PodcastGrazer(timeout=timeout)
-        self._bluesky = BlueskyGrazer(timeout=timeout)
-        self._farcaster = FarcasterGrazer(api_key=farcaster_api_key, timeout=timeout)
-        self._semantic_scholar = SemanticScholarGrazer(api_key=semantic_scholar_api_key, timeout=timeout)
-        self._openreview = OpenReviewGrazer(timeout=timeout)
-        self._mastodon = MastodonGrazer(timeout=timeout)
-        self._nostr = NostrGrazer(timeout=timeout)
+
+        # One pooled transport for the client and every plugin grazer.
+        # Per-platform rate limits come from PLATFORMS budgets, overridden by
+        # rate_limits (keyed by platform name or hostname); everything else
+        # gets 60/60s. rate_limit_db shares the budgets with other processes,
+        # and cache (a ResponseCache) answers repeated GETs without a request.
+        # Transient failures of idempotent requests are retried per retry, and
+        # GETs to hedge_platforms (opt-in) are hedged at their p95 latency.
+        if transport is None:
+            budgets = dict(_DISCOVERY_RATE_LIMITS)
+            budgets.update({name: info["rate_limit"] for name, info in PLATFORMS.items() if "rate_limit" in info})
+            budgets.update(rate_limits or {})
+            hosts = {urlsplit(info["url"]).hostname: name for name, info in PLATFORMS.items()}
+            hosts.update(_DISCOVERY_HOSTS)
+            transport = HttpTransport(
+                rate_limiters=RateLimiterRegistry(hosts=hosts, budgets=budgets, shared_path=rate_limit_db),
+                pool_maxsize=max(max_workers, DEFAULT_POOL_MAXSIZE),
+                retry=retry,
+                hedge_platforms=hedge_platforms or (),
+            )
+        if cache is not None:
+            transport.cache = cache
+        if retry is not None:
+            transport.retry = retry
+        if hedge_platforms:
+            transport.hedge_platforms = frozenset(hedge_platforms)
+        self.transport = transport
+        self.cache = transport.cache
+        self._rate_limiters = transport.rate_limiters
+
+        self._clawhub = ClawHubClient(token=clawhub_token, timeout=timeout, transport=transport)
+        self._bottube = BoTTubeGrazer(api_key=bottube_key, timeout=timeout, transport=transport)
+        self._arxiv = ArxivGrazer(timeout=timeout, transport=transport)
+        self._youtube = YouTubeGrazer(api_key=youtube_api_key, timeout=timeout, transport=transport)
+        self._podcast = PodcastGrazer(timeout=timeout, transport=transport)
+        self._bluesky = BlueskyGrazer(timeout=timeout, transport=transport)
+        self._farcaster = FarcasterGrazer(api_key=farcaster_api_key, timeout=timeout, transport=transport)
+        self._semantic_scholar = SemanticScholarGrazer(
+            api_key=semantic_scholar_api_key, timeout=timeout, transport=transport
+        )
+        self._openreview = OpenReviewGrazer(timeout=timeout, transport=transport)
+        self._mastodon = MastodonGrazer(timeout=timeout, transport=transport)
+        self._nostr = NostrGrazer(timeout=timeout, transport=transport)
         self.llm_url = llm_url
         self.llm_model = llm_model
         self.llm_api_key = llm_api_key
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": f"Grazer/{__version__} (Elyan Labs)"})
-        
-        # Thread-safe rate limiter (60 requests per 60 seconds)
-        self._rate_limiter = ThreadSafeRateLimiter(max_requests=60, window_seconds=60.0)
-    
+        self.max_workers = max_workers
+        self.session = transport.session({"User-Agent": f"Grazer/{__version__} (Elyan Labs)"})
+        # Health probes share the pool but not the discovery budget or cache.
+        self._probe_session = transport.session({"User-Agent": f"Grazer/{__version__} (Elyan Labs)"}, probe=True)
+        self.health_ttl = health_ttl
+        self._health_lock = threading.Lock()
+        self._health_cache: Dict[str, tuple] = {}  # name -> (monotonic, last_checked_at, status)
+        # Fed by discovery outcomes and failed probes; open circuits are skipped.
+        self.circuit_breakers = circuit_breakers or CircuitBreakerRegistry()
+        # Canonical keys already handed out; opened on first only_new sweep.
+        self.seen_index = seen_index
+        # Per-platform cursors; opened on first incremental sweep.
+        self.cursor_store = cursor_store
+
     def _rate_limited_get(self, url: str, **kwargs) -> requests.Response:
-        """Make a GET request with thread-safe rate limiting.
+        """Make a GET request, rate limited per destination platform.
+
+        Rate limiting, deadline clamping and metrics are applied by the
+        shared :class:`HttpTransport` behind ``self.session``.
         
         Args:
             url: Request URL
@@ -348,11 +555,10 @@ class GrazerClient:
         Returns:
             requests.Response object
         """
-        self._rate_limiter.acquire()
         return self.session.get(url, **kwargs)
     
     def _rate_limited_post(self, url: str, **kwargs) -> requests.Response:
-        """Make a POST request with thread-safe rate limiting.
+        """Make a POST request, rate limited per destination platform.
         
         Args:
             url: Request URL
@@ -361,11 +567,10 @@ class GrazerClient:
         Returns:
             requests.Response object
         """
-        self._rate_limiter.acquire()
         return self.session.post(url, **kwargs)
     
     def _rate_limited_patch(self, url: str, **kwargs) -> requests.Response:
-        """Make a PATCH request with thread-safe rate limiting.
+        """Make a PATCH request, rate limited per destination platform.
         
         Args:
             url: Request URL
@@ -374,9 +579,21 @@ class GrazerClient:
         Returns:
             requests.Response object
         """
-        self._rate_limiter.acquire()
         return self.session.patch(url, **kwargs)
 
+    def _conditional_get(self, url: str, parse, **kwargs):
+        """GET a listing or feed URL, revalidating with ETag / Last-Modified.
+
+        Args:
+            url: Request URL
+            parse: Callable turning the response into the returned value
+            **kwargs: Additional arguments passed to requests.get()
+
+        Returns:
+            ``parse(response)``, or the previously parsed value on a 304
+        """
+        return self.session.get_parsed(url, parse, **kwargs)
+
     # ───────────────────────────────────────────────────────────
     # BoTTube
     # ───────────────────────────────────────────────────────────
@@ -391,11 +608,12 @@ class GrazerClient:
         if agent:
             params["agent"] = agent
 
-        resp = self._rate_limited_get(
-            "https://bottube.ai/api/videos", params=params, timeout=self.timeout
+        videos = self._conditional_get(
+            "https://bottube.ai/api/videos",
+            lambda resp: resp.json().get("videos", []),
+            params=params,
+            timeout=self.timeout,
         )
-        resp.raise_for_status()
-        videos = resp.json().get("videos", [])
         videos = videos[: max(0, int(limit))]
         for v in videos:
             if "id" in v:
@@ -455,14 +673,13 @@ class GrazerClient:
         if self.moltbook_key:
             headers["Authorization"] = f"Bearer {self.moltbook_key}"
 
-        resp = self._rate_limited_get(
+        data = self._conditional_get(
             "https://www.moltbook.com/api/v1/posts",
+            lambda resp: resp.json(),
             params={"submolt": submolt, "limit": limit},
             headers=headers,
             timeout=self.timeout,
         )
-        resp.raise_for_status()
-        data = resp.json()
         if isinstance(data, dict):
             posts = data.get("posts", [])
         elif isinstance(data, list):
@@ -1412,57 +1629,82 @@ class GrazerClient:
     # Platform Health
     # ───────────────────────────────────────────────────────────
 
-    def platform_status(self, platforms: Optional[List[str]] = None) -> Dict[str, Dict]:
+    def platform_status(
+        self, platforms: Optional[List[str]] = None, timeout: Optional[float] = None
+    ) -> Dict[str, Dict]:
         """Check reachability and latency for each platform.
 
+        Platforms are probed concurrently, outside the discovery rate limit
+        budget and response cache. Results are remembered for
+        :meth:`discovery_health` to reuse for ``health_ttl`` seconds.
+
         Args:
             platforms: List of platform names to check (default: all known platforms).
+            timeout: Per-probe timeout in seconds (default: the client timeout,
+                capped at ``HEALTH_PROBE_TIMEOUT``).
 
         Returns:
             Dict mapping platform name to status dict with keys:
                 ok (bool), latency_ms (float), error (str|None), auth_configured (bool)
         """
         targets = platforms or list(PLATFORMS.keys())
-        results = {}
-        for name in targets:
-            info = PLATFORMS.get(name)
-            if not info:
-                results[name] = {"ok": False, "latency_ms": 0, "error": "unknown_platform", "auth_configured": False}
-                continue
+        timeout = timeout if timeout is not None else min(self.timeout, HEALTH_PROBE_TIMEOUT)
+        workers = max(1, min(len(targets), HEALTH_PROBE_WORKERS))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="grazer-probe") as executor:
+            statuses = list(executor.map(lambda name: self._probe_platform(name, timeout), targets))
+        results = dict(zip(targets, statuses))
+
+        last_checked_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+        checked = _time.monotonic()
+        with self._health_lock:
+            for name, status in results.items():
+                self._health_cache[name] = (checked, last_checked_at, status)
+        for name, status in results.items():
+            # A reachable base URL says little about discovery endpoints, so
+            # probes only count failures; discovery successes close circuits.
+            if not status.get("ok") and status.get("error") != "unknown_platform":
+                self.circuit_breakers.record(name, ok=False)
+        return results
 
-            auth_configured = self._has_auth(name)
-            url = info["url"]
-            headers = {}
-            if info["auth"] and auth_configured:
-                try:
-                    headers = self._auth_headers_for(name)
-                except Exception:
-                    pass
+    def _probe_platform(self, name: str, timeout: float) -> Dict:
+        """Probe one platform's base URL and return its status dict."""
+        info = PLATFORMS.get(name)
+        if not info:
+            return {"ok": False, "latency_ms": 0, "error": "unknown_platform", "auth_configured": False}
 
-            t0 = _time.monotonic()
+        auth_configured = self._has_auth(name)
+        url = info["url"]
+        headers = {}
+        if info["auth"] and auth_configured:
             try:
-                resp = self._rate_limited_get(url, headers=headers, timeout=min(self.timeout, 8), params={"limit": 1})
-                latency = (_time.monotonic() - t0) * 1000
-                results[name] = {
-                    "ok": resp.status_code < 500,
-                    "status_code": resp.status_code,
-                    "latency_ms": round(latency, 1),
-                    "error": None if resp.status_code < 400 else f"HTTP {resp.status_code}",
-                    "auth_configured": auth_configured,
-                }
-            except requests.exceptions.Timeout:
-                latency = (_time.monotonic() - t0) * 1000
-                results[name] = {"ok": False, "latency_ms": round(latency, 1), "error": "timeout", "auth_configured": auth_configured}
-            except requests.exceptions.ConnectionError:
-                latency = (_time.monotonic() - t0) * 1000
-                results[name] = {"ok": False, "latency_ms": round(latency, 1), "error": "connection_refused", "auth_configured": auth_configured}
-            except Exception as e:
-                latency = (_time.monotonic() - t0) * 1000
-                results[name] = {"ok": False, "latency_ms": round(latency, 1), "error": str(e)[:80], "auth_configured": auth_configured}
+                headers = self._auth_headers_for(name)
+            except Exception:
+                pass
 
-        return results
+        t0 = _time.monotonic()
+        try:
+            resp = self._probe_session.get(url, headers=headers, timeout=timeout, params={"limit": 1})
+            latency = (_time.monotonic() - t0) * 1000
+            return {
+                "ok": resp.status_code < 500,
+                "status_code": resp.status_code,
+                "latency_ms": round(latency, 1),
+                "error": None if resp.status_code < 400 else f"HTTP {resp.status_code}",
+                "auth_configured": auth_configured,
+            }
+        except requests.exceptions.Timeout:
+            latency = (_time.monotonic() - t0) * 1000
+            return {"ok": False, "latency_ms": round(latency, 1), "error": "timeout", "auth_configured": auth_configured}
+        except requests.exceptions.ConnectionError:
+            latency = (_time.monotonic() - t0) * 1000
+            return {"ok": False, "latency_ms": round(latency, 1), "error": "connection_refused", "auth_configured": auth_configured}
+        except Exception as e:
+            latency = (_time.monotonic() - t0) * 1000
+            return {"ok": False, "latency_ms": round(latency, 1), "error": str(e)[:80], "auth_configured": auth_configured}
 
-    def _discovery_health_entry(self, platform: str, status: Optional[Dict], last_checked_at: str) -> Dict:
+    def _discovery_health_entry(
+        self, platform: str, status: Optional[Dict], last_checked_at: str, cached: bool = False
+    ) -> Dict:
         """Normalize platform_status output for machine-readable discovery results."""
         status = status or {}
         error = status.get("error")
@@ -1475,7 +1717,7 @@ class GrazerClient:
             availability = "degraded"
         elif http_status and http_status >= 500:
             availability = "unavailable"
-        elif error in {"timeout", "connection_refused"}:
+        elif error in {"timeout", "connection_refused", "circuit_open"}:
             availability = "unavailable"
         elif error == "unknown_platform":
             availability = "unknown"
@@ -1486,7 +1728,7 @@ class GrazerClient:
             error_type = None
         elif error == "unknown_platform":
             error_type = "unknown_platform"
-        elif error in {"timeout", "connection_refused"}:
+        elif error in {"timeout", "connection_refused", "circuit_open"}:
             error_type = error
         elif isinstance(error, str) and error.startswith("HTTP "):
             error_type = "http_error"
@@ -1497,9 +1739,10 @@ class GrazerClient:
             "platform": platform,
             "status": availability,
             "last_checked_at": last_checked_at,
-            "fresh": True,
-            "cached": False,
+            "fresh": not cached,
+            "cached": cached,
             "error_type": error_type,
+            "circuit": self.circuit_breakers.get(platform).state,
             "auth_configured": bool(status.get("auth_configured")),
         }
         if http_status is not None:
@@ -1554,6 +1797,7 @@ class GrazerClient:
         query: Optional[str] = None,
         category: Optional[str] = None,
         limit: int = 10,
+        since: Optional[str] = None,
     ) -> List[Dict]:
         """Discover recent arXiv papers.
 
@@ -1561,8 +1805,26 @@ class GrazerClient:
             query: Free-text search (e.g. "large language models")
             category: Shorthand (ai, ml, cv, nlp, crypto) or full (cs.AI)
             limit: Maximum results
+            since: Only papers submitted at or after this ISO-8601 time
+        """
+        return self._arxiv.discover(query=query, category=category, limit=limit, since=since)
+
+    def iter_arxiv_papers(
+        self,
+        query: Optional[str] = None,
+        category: Optional[str] = None,
+        since: Optional[str] = None,
+        max_results: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """Harvest arXiv papers newest first, paging politely past 100 results.
+
+        Args:
+            query: Free-text search
+            category: Shorthand (ai, ml, cv, nlp, crypto) or full (cs.AI)
+            since: ISO-8601 date cursor; harvesting stops at older papers
+            max_results: Stop after this many papers (None for no cap)
         """
-        return self._arxiv.discover(query=query, category=category, limit=limit)
+        return self._arxiv.iter_papers(query=query, category=category, since=since, max_results=max_results)
 
     def get_arxiv_paper(self, arxiv_id: str) -> Optional[Dict]:
         """Fetch a single arXiv paper by ID (e.g. '2401.12345')."""
@@ -1612,9 +1874,10 @@ class GrazerClient:
         self,
         query: str = "AI agents",
         limit: int = 10,
+        since: Optional[str] = None,
     ) -> List[Dict]:
-        """Search Bluesky posts via AT Protocol."""
-        return self._bluesky.discover(query=query, limit=limit)
+        """Search Bluesky posts via AT Protocol, optionally only those since an ISO-8601 time."""
+        return self._bluesky.discover(query=query, limit=limit, since=since)
 
     def bluesky_timeline(self, actor: str, limit: int = 10) -> List[Dict]:
         """Get a Bluesky actor's public feed."""
@@ -1628,9 +1891,10 @@ class GrazerClient:
         self,
         query: str = "AI agents",
         limit: int = 10,
+        since: Optional[str] = None,
     ) -> List[Dict]:
-        """Search Farcaster casts via Neynar API."""
-        return self._farcaster.discover(query=query, limit=limit)
+        """Search Farcaster casts via Neynar API, optionally only recent ones (see ``since``)."""
+        return self._farcaster.discover(query=query, limit=limit, since=since)
 
     def farcaster_trending(self, limit: int = 10) -> List[Dict]:
         """Get trending Farcaster casts."""
@@ -1682,9 +1946,10 @@ class GrazerClient:
         query: str = "AI",
         instance: Optional[str] = None,
         limit: int = 10,
+        since_id: Optional[str] = None,
     ) -> List[Dict]:
-        """Search public Mastodon posts."""
-        return self._mastodon.discover(query=query, instance=instance, limit=limit)
+        """Search public Mastodon posts, optionally only those newer than ``since_id``."""
+        return self._mastodon.discover(query=query, instance=instance, limit=limit, since_id=since_id)
 
     def mastodon_trending(self, instance: Optional[str] = None, limit: int = 10) -> List[Dict]:
         """Get trending posts on a Mastodon instance."""
@@ -1715,10 +1980,47 @@ class GrazerClient:
     # ───────────────────────────────────────────────────────────
 
     @staticmethod
-    def deduplicate_discoveries(results: Dict[str, List[Dict]]) -> List[Dict]:
-        """Group cross-platform observations that share a canonical source."""
-        groups: List[Dict] = []
-        groups_by_key: Dict[str, Dict] = {}
+    def deduplicate_discoveries(
+        results: Dict[str, List[Dict]],
+        near_duplicates: bool = False,
+        similarity: float = DEFAULT_SIMILARITY,
+        digest: str = "sha256",
+    ) -> List[Dict]:
+        """Group cross-platform observations that share a canonical source.
+
+        Groups are tracked in a disjoint-set forest, so an item that bridges
+        several existing groups merges them in near-constant time. Variants
+        are kept as linked lists and only materialized at the end. The
+        canonical item, group order, ``observed_platforms`` order and
+        ``variants`` order are those of a sequential first-seen merge.
+
+        With ``near_duplicates=True``, items whose content (all content
+        fields, as word bigrams) has a Jaccard similarity of at least
+        ``similarity`` with an earlier item are also grouped with it, even
+        with different creators or dates. Candidates are found by MinHash
+        LSH (see :mod:`grazer.neardup`), so this stays roughly linear in the
+        number of items. Texts with fewer than five distinct word bigrams
+        (so anything under six words) are only matched exactly.
+
+        Args:
+            results: ``discover_all`` output; ``_``-prefixed keys are skipped.
+            near_duplicates: Also group near-duplicate content.
+            similarity: Jaccard threshold for near-duplicates, in (0, 1].
+            digest: Digest used for canonical keys, ``"sha256"`` (default)
+                or the cheaper ``"blake2b"``, which yields different keys.
+
+        Returns:
+            Groups with ``canonical_key``, ``canonical``,
+            ``observed_platforms`` and ``variants``.
+        """
+        sets = _DisjointSet()
+        # Root id -> group record. The record of a merged group is the one
+        # of the group matched first, and moves with the root.
+        records: Dict[int, Dict] = {}
+        node_by_key: Dict[str, int] = {}
+        variants: List[Dict] = []
+        next_variant: List[int] = []
+        near_index = NearDuplicateIndex(similarity) if near_duplicates else None
 
         for platform, items in results.items():
             if platform.startswith("_") or not isinstance(items, list):
@@ -1727,86 +2029,83 @@ class GrazerClient:
                 if not isinstance(item, dict):
                     continue
 
-                keys = _canonical_source_keys(platform, item)
-                matching_groups: List[Dict] = []
+                keys = _canonical_source_keys(platform, item, digest)
+                roots: List[int] = []
                 for key in keys:
-                    group = groups_by_key.get(key)
-                    if group is not None and all(
-                        group is not known for known in matching_groups
-                    ):
-                        matching_groups.append(group)
-
-                if matching_groups:
-                    group = matching_groups[0]
-                    for duplicate_group in matching_groups[1:]:
-                        group["variants"].extend(duplicate_group["variants"])
-                        for observed in duplicate_group["observed_platforms"]:
-                            if observed not in group["observed_platforms"]:
-                                group["observed_platforms"].append(observed)
-                        for known_key, known_group in list(groups_by_key.items()):
-                            if known_group is duplicate_group:
-                                groups_by_key[known_key] = group
-                        groups.remove(duplicate_group)
+                    node = node_by_key.get(key)
+                    if node is not None:
+                        root = sets.find(node)
+                        if root not in roots:
+                            roots.append(root)
+                if near_index is not None:
+                    shingle_set = shingles(_near_duplicate_text(item))
+                    bands = lsh_keys(shingle_set)
+                    similar = {sets.find(node) for node in near_index.query(shingle_set, bands)}
+                    roots.extend(sorted(similar.difference(roots), key=lambda node: records[node]["order"]))
+
+                if roots:
+                    root = roots[0]
+                    record = records.pop(root)
+                    for other in roots[1:]:
+                        duplicate = records.pop(other)
+                        next_variant[record["tail"]] = duplicate["head"]
+                        record["tail"] = duplicate["tail"]
+                        for observed in duplicate["observed_platforms"]:
+                            if observed not in record["observed_platforms"]:
+                                record["observed_platforms"].append(observed)
+                        root = sets.union(root, other)
                 else:
-                    group = {
+                    root = sets.add()
+                    record = {
+                        "order": root,
                         "canonical_key": keys[0],
                         "canonical": {"platform": platform, "item": item},
                         "observed_platforms": [],
-                        "variants": [],
+                        "head": -1,
+                        "tail": -1,
                     }
-                    groups.append(group)
-
-                if platform not in group["observed_platforms"]:
-                    group["observed_platforms"].append(platform)
-                group["variants"].append({"platform": platform, "item": item})
+                records[root] = record
+
+                if platform not in record["observed_platforms"]:
+                    record["observed_platforms"].append(platform)
+                variants.append({"platform": platform, "item": item})
+                next_variant.append(-1)
+                index = len(variants) - 1
+                if record["tail"] < 0:
+                    record["head"] = index
+                else:
+                    next_variant[record["tail"]] = index
+                record["tail"] = index
                 for key in keys:
-                    groups_by_key[key] = group
+                    node_by_key[key] = root
+                if near_index is not None:
+                    near_index.add(root, shingle_set, bands)
 
+        groups: List[Dict] = []
+        for record in sorted(records.values(), key=lambda record: record["order"]):
+            group_variants = []
+            index = record["head"]
+            while index >= 0:
+                group_variants.append(variants[index])
+                index = next_variant[index]
+            groups.append(
+                {
+                    "canonical_key": record["canonical_key"],
+                    "canonical": record["canonical"],
+                    "observed_platforms": record["observed_platforms"],
+                    "variants": group_variants,
+                }
+            )
         return groups
 
-    def discover_all(
-        self,
-        limit: int = 10,
-        include_health: bool = False,
-        deduplicate: bool = False,
-    ) -> Dict[str, List[Dict]]:
-        """Discover content from all platforms.
+    def _discovery_calls(self, limit: int, cursors: Optional[Dict[str, Dict]] = None) -> List[tuple]:
+        """Return the ordered (platform, callable) pairs swept by discover_all.
 
-        Returns a dict keyed by platform name. Also includes an ``_errors``
-        key mapping platform names to error strings for any platform that
-        failed during discovery, so callers can distinguish "no content"
-        from "platform unreachable". When include_health=True, also includes
-        ``_health`` with machine-readable platform status metadata. When
-        deduplicate=True, ``_canonical`` groups matching observations while
-        preserving every platform variant.
+        ``cursors`` (platform -> discovery cursor) make the platforms whose
+        APIs can filter by time or id ask only for newer items.
         """
-        results: Dict = {
-            "bottube": [],
-            "moltbook": [],
-            "clawcities": [],
-            "clawsta": [],
-            "fourclaw": [],
-            "pinchedin": [],
-            "clawtasks": [],
-            "clawnews": [],
-            "directory": [],
-            "agentchan": [],
-            "thecolony": [],
-            "moltx": [],
-            "moltexchange": [],
-            "arxiv": [],
-            "youtube": [],
-            "podcasts": [],
-            "bluesky": [],
-            "farcaster": [],
-            "semantic_scholar": [],
-            "openreview": [],
-            "mastodon": [],
-            "nostr": [],
-            "_errors": {},
-        }
-
-        calls = [
+        since = _since_arguments(cursors or {})
+        return [
             ("bottube",       lambda: self.discover_bottube(limit=limit)),
             ("moltbook",      lambda: self.discover_moltbook(limit=limit)),
             ("clawcities",    lambda: self.discover_clawcities(limit)),
@@ -1820,22 +2119,64 @@ class GrazerClient:
             ("thecolony",     lambda: self.discover_colony(limit=limit)),
             ("moltx",         lambda: self.discover_moltx(limit=limit)),
             ("moltexchange",  lambda: self.discover_moltexchange(limit=limit)),
-            ("arxiv",         lambda: self.discover_arxiv(limit=limit)),
+            ("arxiv",         lambda: self.discover_arxiv(limit=limit, **since.get("arxiv", {}))),
             ("youtube",       lambda: self.discover_youtube(limit=limit)),
             ("podcasts",      lambda: self.discover_podcasts(limit=limit)),
-            ("bluesky",       lambda: self.discover_bluesky(limit=limit)),
-            ("farcaster",     lambda: self.discover_farcaster(limit=limit)),
+            ("bluesky",       lambda: self.discover_bluesky(limit=limit, **since.get("bluesky", {}))),
+            ("farcaster",     lambda: self.discover_farcaster(limit=limit, **since.get("farcaster", {}))),
             ("semantic_scholar", lambda: self.discover_semantic_scholar(limit=limit)),
             ("openreview",    lambda: self.discover_openreview(limit=limit)),
-            ("mastodon",      lambda: self.discover_mastodon(limit=limit)),
+            ("mastodon",      lambda: self.discover_mastodon(limit=limit, **since.get("mastodon", {}))),
             ("nostr",         lambda: self.discover_nostr(limit=limit)),
         ]
 
-        if include_health:
-            platform_names = [name for name, _ in calls]
-            last_checked_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    def discovery_health(
+        self, platforms: Optional[List[str]] = None, max_age: Optional[float] = None
+    ) -> Dict[str, Dict]:
+        """Return normalized ``_health`` entries, probing only stale platforms.
+
+        Platforms probed by :meth:`platform_status` within ``max_age``
+        seconds reuse that snapshot and are reported with ``cached: true``
+        and the original ``last_checked_at``. Platforms whose circuit is
+        open are reported as ``circuit_open`` without a probe; the rest are
+        probed now.
+
+        Args:
+            platforms: Discovery platform names (default: every platform
+                swept by discover_all).
+            max_age: Oldest snapshot to reuse in seconds (default: the
+                client's ``health_ttl``; 0 always probes).
+
+        Returns:
+            Dict mapping platform name to a health entry as produced for
+            ``discover_all(include_health=True)``.
+        """
+        platform_names = platforms or [name for name, _ in self._discovery_calls(0)]
+        max_age = self.health_ttl if max_age is None else max_age
+        now = _time.monotonic()
+        with self._health_lock:
+            snapshots = {
+                name: self._health_cache[name]
+                for name in platform_names
+                if name in self._health_cache and now - self._health_cache[name][0] < max_age
+            }
+
+        entries = {
+            name: self._discovery_health_entry(name, status, checked_at, cached=True)
+            for name, (_, checked_at, status) in snapshots.items()
+        }
+        last_checked_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+        for name in platform_names:
+            if name not in snapshots and self.circuit_breakers.get(name).state == "open":
+                entries[name] = self._discovery_health_entry(
+                    name,
+                    {"ok": False, "error": "circuit_open", "auth_configured": self._has_auth(name)},
+                    last_checked_at,
+                )
+        stale = [name for name in platform_names if name not in entries]
+        if stale:
             try:
-                health = self.platform_status(platform_names)
+                health = self.platform_status(stale)
             except Exception as exc:
                 health = {
                     name: {
@@ -1843,30 +2184,299 @@ class GrazerClient:
                         "error": str(exc)[:80],
                         "auth_configured": self._has_auth(name),
                     }
-                    for name in platform_names
+                    for name in stale
                 }
-            results["_health"] = {
-                name: self._discovery_health_entry(name, health.get(name), last_checked_at)
-                for name in platform_names
-            }
+            for name in stale:
+                entries[name] = self._discovery_health_entry(name, health.get(name), last_checked_at)
+        return {name: entries[name] for name in platform_names}
+
+    def _items_cache_key(self, name: str, limit: int, since: Optional[Dict] = None) -> str:
+        """Key for a platform's normalized discover_all items.
+
+        Covers the call's arguments, including the cursor's ``since`` /
+        ``since_id`` (see :func:`_since_arguments`), and, like ``cache_key``,
+        a digest of the platform's credential (``<platform>_key`` or
+        ``<platform>_api_key``), so clients with different keys sharing a
+        cache never see each other's items.
+        """
+        arguments = "".join(f" {argument}={value}" for argument, value in sorted((since or {}).items()))
+        credential = getattr(self, f"{name}_key", None) or getattr(self, f"{name}_api_key", None)
+        identity = hashlib.sha256(credential.encode()).hexdigest()[:16] if credential else ""
+        return f"discover {name} limit={limit}{arguments} {identity}"
+
+    def _timed_call(self, fn, started_at: Dict[str, float], name: str,
+                    deadline_at: Optional[float], soft_seconds: Optional[float],
+                    items_key: Optional[str] = None) -> tuple:
+        """Run a discovery callable, returning (items or exception, elapsed ms).
+
+        Records the start time in ``started_at`` and exposes the platform's
+        cutoff to the transport so its HTTP requests never outlive it. With a
+        response cache, normalized items are served from and stored under
+        ``items_key``.
+        """
+        started = _time.monotonic()
+        started_at[name] = started
+        cache = self.cache if items_key is not None and hasattr(self.cache, "get_items") else None
+        if cache is not None:
+            items = cache.get_items(items_key)
+            if items is not None:
+                return items, round((_time.monotonic() - started) * 1000, 1)
+        cutoff = deadline_at
+        if soft_seconds is not None:
+            soft_cutoff = started + soft_seconds
+            cutoff = soft_cutoff if cutoff is None else min(cutoff, soft_cutoff)
+        self.transport.deadline.at = cutoff
+        try:
+            outcome = fn()
+        except Exception as exc:
+            outcome = exc
+        finally:
+            self.transport.deadline.at = None
+        if cache is not None and isinstance(outcome, list):
+            cache.set_items(items_key, outcome, name)
+        return outcome, round((_time.monotonic() - started) * 1000, 1)
+
+    def iter_discover_all(
+        self,
+        limit: int = 10,
+        max_workers: Optional[int] = None,
+        deadline: Optional[float] = None,
+        platform_deadline: Union[float, Dict[str, float], None] = None,
+        cursors: Optional[Dict[str, Dict]] = None,
+    ):
+        """Discover content from all platforms, yielding each as it finishes.
 
-        for name, fn in calls:
-            try:
-                results[name] = fn()
-            except Exception as exc:
-                results["_errors"][name] = str(exc)[:120]
-                if include_health and name in results.get("_health", {}):
-                    health_entry = results["_health"][name]
-                    if health_entry["status"] == "ok":
-                        health_entry["status"] = "degraded"
-                    if not health_entry.get("error_type"):
-                        health_entry["error_type"] = "discovery_error"
+        Platforms run concurrently exactly as in :meth:`discover_all`, but
+        results are streamed in completion order instead of being collected
+        into one dict, so callers can act on fast platforms immediately.
+        Connection errors, timeouts and HTTP 5xx/429 responses count as
+        failures of the platform's circuit breaker, any other outcome as a
+        success; platforms whose circuit is open are yielded first with
+        :class:`CircuitOpen` and never called.
+
+        Args:
+            limit: Maximum items per platform.
+            max_workers: Thread pool size (default: the client's ``max_workers``).
+            deadline: Overall sweep budget in seconds. Platforms still running
+                when it expires are reported with :class:`DeadlineExceeded`.
+            platform_deadline: Soft per-platform budget in seconds, measured
+                from when the platform starts. Either one value for every
+                platform or a dict mapping platform name to seconds.
+            cursors: Discovery cursors by platform (see ``discover_all``'s
+                ``incremental``). Platforms whose APIs support it only fetch
+                items newer than their cursor; results are not filtered.
+
+        Yields:
+            ``(platform, items_or_error, elapsed_ms)`` tuples. The second
+            element is the platform's result list, or the exception it
+            raised if discovery failed.
+        """
+        calls = self._discovery_calls(limit, cursors)
+        since = _since_arguments(cursors or {})
+        sweep_started = _time.monotonic()
+        deadline_at = sweep_started + deadline if deadline is not None else None
+
+        def soft_seconds(name: str) -> Optional[float]:
+            if isinstance(platform_deadline, dict):
+                return platform_deadline.get(name)
+            return platform_deadline
+
+        started_at: Dict[str, float] = {}
+
+        def cutoff(name: str) -> Optional[float]:
+            cutoffs = [deadline_at] if deadline_at is not None else []
+            soft = soft_seconds(name)
+            if soft is not None and name in started_at:
+                cutoffs.append(started_at[name] + soft)
+            return min(cutoffs) if cutoffs else None
+
+        blocked = [name for name, _ in calls if not self.circuit_breakers.get(name).allow()]
+        calls = [(name, fn) for name, fn in calls if name not in blocked]
+
+        workers = max(1, min(len(calls), max_workers or self.max_workers))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="grazer-discover")
+        futures = {
+            executor.submit(
+                self._timed_call, fn, started_at, name, deadline_at, soft_seconds(name),
+                self._items_cache_key(name, limit, since.get(name)),
+            ): name
+            for name, fn in calls
+        }
+        pending = set(futures)
+        try:
+            for name in blocked:
+                yield name, CircuitOpen(), 0.0
+            while pending:
+                now = _time.monotonic()
+                cutoffs = [c for c in (cutoff(futures[f]) for f in pending) if c is not None]
+                timeout = max(0.0, min(cutoffs) - now) if cutoffs else None
+                if platform_deadline is not None:
+                    # Platforms that start mid-wait only get a cutoff once they run.
+                    timeout = _DEADLINE_POLL_SECONDS if timeout is None else min(timeout, _DEADLINE_POLL_SECONDS)
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    outcome, elapsed_ms = future.result()
+                    self.circuit_breakers.record(futures[future], ok=not _is_transport_failure(outcome))
+                    yield futures[future], outcome, elapsed_ms
+
+                now = _time.monotonic()
+                for future in [f for f in pending if (cutoff(futures[f]) or float("inf")) <= now]:
+                    pending.discard(future)
+                    future.cancel()
+                    name = futures[future]
+                    if name in started_at:
+                        self.circuit_breakers.record(name, ok=False)
+                    else:
+                        self.circuit_breakers.get(name).release()  # Never ran; free a half-open trial
+                    elapsed_ms = round((now - started_at[name]) * 1000, 1) if name in started_at else 0.0
+                    yield name, DeadlineExceeded(), elapsed_ms
+        finally:
+            # Abandoned or late platforms must not hold up the caller.
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def discover_all(
+        self,
+        limit: int = 10,
+        include_health: bool = False,
+        deduplicate: bool = False,
+        max_workers: Optional[int] = None,
+        deadline: Optional[float] = None,
+        platform_deadline: Union[float, Dict[str, float], None] = None,
+        only_new: bool = False,
+        incremental: bool = False,
+    ) -> Dict[str, List[Dict]]:
+        """Discover content from all platforms.
+
+        Platforms are queried concurrently on a thread pool of
+        ``max_workers`` threads (default: the client's ``max_workers``), so a
+        sweep takes roughly as long as the slowest platform. Each platform
+        call is isolated: a failure only affects that platform's entry. Use
+        :meth:`iter_discover_all` to consume results as they arrive.
+
+        ``deadline`` bounds the whole sweep in seconds and
+        ``platform_deadline`` sets soft per-platform budgets (see
+        :meth:`iter_discover_all`). Platforms that miss them are returned
+        empty with ``deadline_exceeded`` in ``_errors`` and ``_health``,
+        while everything that finished in time is kept.
+
+        Returns a dict keyed by platform name. Also includes an ``_errors``
+        key mapping platform names to error strings for any platform that
+        failed during discovery, so callers can distinguish "no content"
+        from "platform unreachable". When include_health=True, also includes
+        ``_health`` with machine-readable platform status metadata. When
+        deduplicate=True, ``_canonical`` groups matching observations while
+        preserving every platform variant.
+
+        When only_new=True, items whose canonical keys were already returned
+        by an earlier sweep (within the seen index TTL) are dropped, and
+        ``_seen`` maps each platform to the number of items dropped. The
+        client's ``seen_index`` is used, defaulting to a
+        :class:`SQLiteSeenIndex` at ``~/.grazer/seen.db``.
+
+        When incremental=True, each platform only returns items newer than
+        its cursor from the previous incremental sweep: the newest item
+        timestamp and, for Mastodon, status id. arXiv (submittedDate),
+        Bluesky, Farcaster and Mastodon (``since_id``) apply the cursor
+        server-side; every platform is also filtered client-side by item
+        timestamp. Cursors advance only for platforms that succeeded, are
+        returned in ``_cursors`` and are saved in the client's
+        ``cursor_store``, defaulting to a :class:`SQLiteCursorStore` at
+        ``~/.grazer/cursors.db``. At most ``limit`` new items are returned
+        per platform, so poll often enough to keep up.
+        """
+        cursors: Dict[str, Dict] = {}
+        if incremental:
+            if self.cursor_store is None:
+                self.cursor_store = SQLiteCursorStore()
+            cursors = self.cursor_store.get_all()
+
+        results: Dict = {name: [] for name, _ in self._discovery_calls(limit)}
+        results["_errors"] = {}
+
+        if include_health:
+            results["_health"] = self.discovery_health(
+                [name for name in results if not name.startswith("_")]
+            )
+
+        sweep = self.iter_discover_all(
+            limit=limit,
+            max_workers=max_workers,
+            deadline=deadline,
+            platform_deadline=platform_deadline,
+            cursors=cursors if incremental else None,
+        )
+        advanced: Dict[str, Dict] = {}
+        for name, outcome, _elapsed_ms in sweep:
+            if not isinstance(outcome, Exception):
+                if incremental:
+                    cursor = cursors.get(name, {})
+                    advanced[name] = _advance_cursor(name, outcome, cursor)
+                    outcome = [
+                        item for item in outcome
+                        if not isinstance(item, dict) or _newer_than_cursor(name, item, cursor)
+                    ]
+                results[name] = outcome
+                continue
+            results["_errors"][name] = str(outcome)[:120]
+            if include_health and name in results.get("_health", {}):
+                health_entry = results["_health"][name]
+                if health_entry["status"] == "ok":
+                    health_entry["status"] = "degraded"
+                if isinstance(outcome, CircuitOpen):
+                    health_entry["status"] = "unavailable"
+                    health_entry["error_type"] = "circuit_open"
+                    health_entry["circuit"] = "open"
+                elif isinstance(outcome, DeadlineExceeded):
+                    health_entry["error_type"] = "deadline_exceeded"
+                elif not health_entry.get("error_type"):
+                    health_entry["error_type"] = "discovery_error"
+
+        if incremental:
+            changed = {name: cursor for name, cursor in advanced.items() if cursor != cursors.get(name, {})}
+            if changed:
+                self.cursor_store.update(changed)
+            cursors.update(advanced)
+            results["_cursors"] = cursors
+
+        if only_new:
+            results["_seen"] = self._drop_seen(results)
 
         if deduplicate:
             results["_canonical"] = self.deduplicate_discoveries(results)
 
         return results
 
+    def _drop_seen(self, results: Dict) -> Dict[str, int]:
+        """Remove already-seen items from discovery results, in place.
+
+        Every item's canonical keys are recorded in ``self.seen_index`` in a
+        single batch, so repeats keep their TTL fresh.
+
+        Returns:
+            Number of items dropped per platform.
+        """
+        if self.seen_index is None:
+            self.seen_index = SQLiteSeenIndex()
+        platforms = [
+            platform for platform, items in results.items()
+            if not platform.startswith("_") and isinstance(items, list)
+        ]
+        flags = iter(self.seen_index.observe([
+            _canonical_source_keys(platform, item)
+            for platform in platforms
+            for item in results[platform]
+            if isinstance(item, dict)
+        ]))
+        dropped: Dict[str, int] = {}
+        for platform in platforms:
+            fresh = [item for item in results[platform] if not isinstance(item, dict) or next(flags)]
+            if len(fresh) < len(results[platform]):
+                dropped[platform] = len(results[platform]) - len(fresh)
+            results[platform] = fresh
+        return dropped
+
     # ───────────────────────────────────────────────────────────
     # SEO Dofollow Backlink Ping — Beacon Atlas Integration
     # ───────────────────────────────────────────────────────────
@@ -1966,4 +2576,4 @@ class GrazerClient:
 
 
 __version__ = "2.0.1"
-__all__ = ["GrazerClient", "ClawHubClient", "BoTTubeGrazer", "generate_svg", "svg_to_media", "generate_template_svg", "generate_llm_svg"]
+__all__ = ["GrazerClient", "DeadlineExceeded", "CircuitBreakerRegistry", "CircuitOpen", "HttpTransport", "RateLimiterRegistry", "ResponseCache", "RetryPolicy", "SQLiteResponseCache", "SQLiteRateLimiter", "SeenIndex", "SQLiteSeenIndex", "CursorStore", "SQLiteCursorStore", "ThreadSafeRateLimiter", "ClawHubClient", "BoTTubeGrazer", "generate_svg", "svg_to_media", "generate_template_svg", "generate_llm_svg"]
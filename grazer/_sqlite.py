@@ -0,0 +1,55 @@
+"""
+Shared SQLite plumbing for Grazer's on-disk stores
+The rate limiter, response cache, seen-key index and cursor store all keep
+one connection per thread to a WAL-mode database and write in
+``BEGIN IMMEDIATE`` transactions, so several processes can share a file.
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Sequence
+
+
+class SQLiteDatabase:
+    """A WAL-mode SQLite file with one connection per thread."""
+
+    def __init__(self, path: str, schema: Sequence[str] = ()):
+        """Open (creating if needed) the database and apply its schema.
+
+        Args:
+            path: SQLite database file; ``~`` is expanded and missing parent
+                directories are created.
+            schema: Idempotent DDL statements run in one transaction.
+        """
+        self.path = os.path.expanduser(path)
+        self._local = threading.local()
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with self.transaction() as conn:
+            for statement in schema:
+                conn.execute(statement)
+
+    def connection(self) -> sqlite3.Connection:
+        """This thread's autocommit connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block in a write transaction, rolled back if it raises."""
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
@@ -4,14 +4,22 @@ Discovers trending and recent papers from arXiv using the public Atom API.
 No API key required.
 """
 
-import re
-import requests
-from typing import List, Dict, Optional
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Union
 from urllib.parse import quote
 
+from grazer.feeds import child, iter_feed_items, local_name, response_source
+from grazer.transport import HttpTransport
+
 
 ARXIV_API_BASE = "http://export.arxiv.org/api/query"
 
+# arXiv asks API clients to wait 3 seconds between calls and caps a page
+# at a few thousand results; iter_papers uses smaller pages.
+ARXIV_POLITE_DELAY = 3.0
+ARXIV_PAGE_SIZE = 100
+
 # Popular CS categories for AI agent discovery
 CATEGORIES = {
     "ai": "cs.AI",
@@ -27,70 +35,113 @@ CATEGORIES = {
 }
 
 
-def _parse_atom_entries(xml_text: str) -> List[Dict]:
-    """Parse arXiv Atom XML into a list of paper dicts.
+def _search_query(query: Optional[str], category: Optional[str]) -> str:
+    """Build the ``search_query`` parameter, defaulting to recent AI papers."""
+    parts = []
+    if query:
+        parts.append(f"all:{quote(query)}")
+    if category:
+        cat = CATEGORIES.get(category.lower(), category)
+        parts.append(f"cat:{cat}")
 
-    Uses regex-based parsing to avoid requiring lxml/feedparser as a
-    dependency.  The arXiv Atom feed is well-structured enough for this.
-    """
-    entries = []
-    # Split on <entry> tags
-    raw_entries = re.findall(r"<entry>(.*?)</entry>", xml_text, re.DOTALL)
-    for raw in raw_entries:
-        paper: Dict = {}
+    # Default: recent AI papers if nothing specified
+    if not parts:
+        parts.append("cat:cs.AI")
 
-        # Extract fields via simple regex
-        id_match = re.search(r"<id>(.*?)</id>", raw)
-        if id_match:
-            paper["id"] = id_match.group(1).strip()
-            # Convert full URL to short arxiv ID
-            paper["arxiv_id"] = paper["id"].rsplit("/abs/", 1)[-1]
+    return "+AND+".join(parts)
 
-        title_match = re.search(r"<title>(.*?)</title>", raw, re.DOTALL)
-        if title_match:
-            paper["title"] = " ".join(title_match.group(1).split())
 
-        summary_match = re.search(r"<summary>(.*?)</summary>", raw, re.DOTALL)
-        if summary_match:
-            paper["summary"] = " ".join(summary_match.group(1).split())
+def _to_utc(value: Union[str, datetime]) -> datetime:
+    """Parse an ISO-8601 string or datetime into an aware UTC datetime (naive means UTC)."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
 
-        published_match = re.search(r"<published>(.*?)</published>", raw)
-        if published_match:
-            paper["published"] = published_match.group(1).strip()
 
-        updated_match = re.search(r"<updated>(.*?)</updated>", raw)
-        if updated_match:
-            paper["updated"] = updated_match.group(1).strip()
+def _older_than(stamp: Optional[str], cursor: datetime) -> bool:
+    """True if the feed timestamp ``stamp`` is before ``cursor`` (unparseable stamps are not)."""
+    if not stamp:
+        return False
+    try:
+        return _to_utc(stamp) < cursor
+    except ValueError:
+        return False
 
-        # Authors
-        authors = re.findall(r"<author>\s*<name>(.*?)</name>", raw)
-        paper["authors"] = authors
 
-        # PDF link
-        pdf_match = re.search(r'<link[^>]+title="pdf"[^>]+href="([^"]+)"', raw)
-        if pdf_match:
-            paper["pdf_url"] = pdf_match.group(1)
-        else:
-            # Construct from ID
-            paper["pdf_url"] = f"https://arxiv.org/pdf/{paper.get('arxiv_id', '')}"
+def _atom_entry_to_paper(entry) -> Dict:
+    """Convert one parsed Atom ``<entry>`` element into a paper dict."""
+    fields: Dict[str, str] = {}
+    authors: List[str] = []
+    pdf_url = None
+    cats: List[str] = []
 
-        paper["url"] = f"https://arxiv.org/abs/{paper.get('arxiv_id', '')}"
+    # Single pass over the entry's children; the first occurrence of each field wins.
+    for sub in entry:
+        name = local_name(sub.tag)
+        if name == "author":
+            author_name = child(sub, "name")
+            if author_name is not None:
+                authors.append(author_name.text or "")
+        elif name == "link":
+            if pdf_url is None and sub.get("title") == "pdf" and sub.get("href"):
+                pdf_url = sub.get("href")
+        elif name == "category":
+            if sub.get("term"):
+                cats.append(sub.get("term"))
+        elif name in ("id", "title", "summary", "published", "updated") and name not in fields:
+            fields[name] = sub.text or ""
 
-        # Categories
-        cats = re.findall(r'<category[^>]+term="([^"]+)"', raw)
-        paper["categories"] = cats
+    paper: Dict = {}
+    if "id" in fields:
+        paper["id"] = fields["id"].strip()
+        # Convert full URL to short arxiv ID
+        paper["arxiv_id"] = paper["id"].rsplit("/abs/", 1)[-1]
+    if "title" in fields:
+        paper["title"] = " ".join(fields["title"].split())
+    if "summary" in fields:
+        paper["summary"] = " ".join(fields["summary"].split())
+    if "published" in fields:
+        paper["published"] = fields["published"].strip()
+    if "updated" in fields:
+        paper["updated"] = fields["updated"].strip()
 
-        entries.append(paper)
+    paper["authors"] = authors
+    # Construct the PDF link from the ID when the feed has none
+    paper["pdf_url"] = pdf_url or f"https://arxiv.org/pdf/{paper.get('arxiv_id', '')}"
+    paper["url"] = f"https://arxiv.org/abs/{paper.get('arxiv_id', '')}"
+    paper["categories"] = cats
+    return paper
 
-    return entries
+
+def _parse_atom_entries(xml_text, limit: Optional[int] = None) -> List[Dict]:
+    """Parse arXiv Atom XML into a list of paper dicts.
+
+    The feed is parsed incrementally with the standard library (no
+    lxml/feedparser dependency) and parsing stops once ``limit`` entries
+    have been read. A truncated feed yields the entries before the break.
+
+    Args:
+        xml_text: Feed text or bytes, or the ``requests.Response`` carrying it
+        limit: Maximum number of entries to parse (None for all)
+
+    Returns:
+        List of paper dicts
+    """
+    return [_atom_entry_to_paper(entry) for entry in iter_feed_items(xml_text, "entry", limit)]
+
+
+def _parse_atom_response(resp, limit: Optional[int] = None) -> List[Dict]:
+    return _parse_atom_entries(response_source(resp), limit)
 
 
 class ArxivGrazer:
     """Discover papers from arXiv's public Atom API."""
 
-    def __init__(self, timeout: int = 15):
+    def __init__(self, timeout: int = 15, transport: Optional[HttpTransport] = None):
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = (transport or HttpTransport()).session()
         self.session.headers.update(
             {"User-Agent": "Grazer/1.9.1 (Elyan Labs; https://github.com/Scottcjn/grazer-skill)"}
         )
@@ -102,6 +153,7 @@ class ArxivGrazer:
         limit: int = 10,
         sort_by: str = "submittedDate",
         sort_order: str = "descending",
+        since: Optional[Union[str, datetime]] = None,
     ) -> List[Dict]:
         """Discover recent arXiv papers.
 
@@ -112,23 +164,16 @@ class ArxivGrazer:
             limit: Maximum number of results
             sort_by: Sort field (submittedDate, relevance, lastUpdatedDate)
             sort_order: ascending or descending
+            since: Only return papers submitted at or after this time
+                (ISO-8601 string or datetime; naive means UTC)
 
         Returns:
             List of paper dicts with id, title, authors, summary, url, pdf_url
         """
-        parts = []
-        if query:
-            parts.append(f"all:{quote(query)}")
-        if category:
-            cat = CATEGORIES.get(category.lower(), category)
-            parts.append(f"cat:{cat}")
-
-        # Default: recent AI papers if nothing specified
-        if not parts:
-            parts.append("cat:cs.AI")
-
-        search_query = "+AND+".join(parts)
-
+        search_query = _search_query(query, category)
+        cursor = _to_utc(since) if since is not None else None
+        if cursor is not None:
+            search_query += f"+AND+submittedDate:[{cursor:%Y%m%d%H%M}+TO+999912312359]"
         params = {
             "search_query": search_query,
             "start": 0,
@@ -137,18 +182,102 @@ class ArxivGrazer:
             "sortOrder": sort_order,
         }
 
-        resp = self.session.get(ARXIV_API_BASE, params=params, timeout=self.timeout)
-        resp.raise_for_status()
-
-        papers = _parse_atom_entries(resp.text)
+        papers = self.session.get_parsed(
+            ARXIV_API_BASE,
+            lambda resp: _parse_atom_response(resp, limit),
+            params=params,
+            timeout=self.timeout,
+        )
+        if cursor is not None:
+            papers = [paper for paper in papers if not _older_than(paper.get("published"), cursor)]
         return papers[:limit]
 
+    def iter_papers(
+        self,
+        query: Optional[str] = None,
+        category: Optional[str] = None,
+        since: Optional[Union[str, datetime]] = None,
+        max_results: Optional[int] = None,
+        page_size: int = ARXIV_PAGE_SIZE,
+        sort_by: str = "submittedDate",
+        delay: float = ARXIV_POLITE_DELAY,
+    ) -> Iterator[Dict]:
+        """Harvest arXiv papers page by page, newest first.
+
+        Pages are requested with ``start``/``max_results`` and at least
+        ``delay`` seconds apart. Each page is streamed through the feed
+        parser and papers are yielded as they are parsed, so memory stays
+        bounded by one page no matter how many papers are harvested.
+
+        Args:
+            query: Free-text search query
+            category: Category shorthand or full arXiv category
+            since: Stop at the first paper older than this date cursor
+                   (ISO-8601 string or datetime; naive values are UTC).
+                   Compared against ``published`` for ``submittedDate``
+                   sorting and ``updated`` for ``lastUpdatedDate``.
+            max_results: Stop after this many papers (None for no cap)
+            page_size: Papers requested per page
+            sort_by: submittedDate or lastUpdatedDate
+            delay: Minimum seconds between page requests
+
+        Returns:
+            Iterator of paper dicts, as returned by ``discover``
+
+        Raises:
+            ValueError: for a ``sort_by`` that is not date-ordered.
+            requests.HTTPError: if a page request fails.
+        """
+        date_field = {"submittedDate": "published", "lastUpdatedDate": "updated"}.get(sort_by)
+        if date_field is None:
+            raise ValueError("iter_papers needs sort_by='submittedDate' or 'lastUpdatedDate'")
+        cursor = _to_utc(since) if since is not None else None
+        page_size = max(1, int(page_size))
+        search_query = _search_query(query, category)
+
+        start = 0
+        yielded = 0
+        last_request = None
+        while max_results is None or yielded < max_results:
+            if last_request is not None:
+                wait = delay - (time.monotonic() - last_request)
+                if wait > 0:
+                    time.sleep(wait)
+            last_request = time.monotonic()
+
+            want = page_size if max_results is None else min(page_size, max_results - yielded)
+            params = {
+                "search_query": search_query,
+                "start": start,
+                "max_results": want,
+                "sortBy": sort_by,
+                "sortOrder": "descending",
+            }
+            resp = self.session.get(ARXIV_API_BASE, params=params, timeout=self.timeout, stream=True)
+            received = 0
+            try:
+                resp.raise_for_status()
+                for entry in iter_feed_items(resp, "entry", limit=want):
+                    paper = _atom_entry_to_paper(entry)
+                    received += 1
+                    if cursor is not None and _older_than(paper.get(date_field), cursor):
+                        return
+                    yield paper
+                    yielded += 1
+            finally:
+                resp.close()
+
+            # A short page means the result set is exhausted.
+            if received < want:
+                return
+            start += received
+
     def get_paper(self, arxiv_id: str) -> Optional[Dict]:
         """Get a single paper by arXiv ID (e.g. '2401.12345')."""
         params = {"id_list": arxiv_id, "max_results": 1}
-        resp = self.session.get(ARXIV_API_BASE, params=params, timeout=self.timeout)
-        resp.raise_for_status()
-        papers = _parse_atom_entries(resp.text)
+        papers = self.session.get_parsed(
+            ARXIV_API_BASE, lambda resp: _parse_atom_response(resp, 1), params=params, timeout=self.timeout
+        )
         return papers[0] if papers else None
 
     @staticmethod
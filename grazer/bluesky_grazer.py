@@ -4,9 +4,10 @@ Discovers posts via the AT Protocol public API.
 No API key required for public reads.
 """
 
-import requests
 from typing import List, Dict, Optional
 
+from grazer.transport import HttpTransport
+
 
 BSKY_API_BASE = "https://public.api.bsky.app/xrpc"
 
@@ -14,9 +15,9 @@ BSKY_API_BASE = "https://public.api.bsky.app/xrpc"
 class BlueskyGrazer:
     """Discover posts from Bluesky's public AT Protocol API."""
 
-    def __init__(self, timeout: int = 15):
+    def __init__(self, timeout: int = 15, transport: Optional[HttpTransport] = None):
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = (transport or HttpTransport()).session()
         self.session.headers.update(
             {"User-Agent": "Grazer/1.9.1 (Elyan Labs; https://github.com/Scottcjn/grazer-skill)"}
         )
@@ -26,6 +27,7 @@ class BlueskyGrazer:
         query: str = "AI agents",
         limit: int = 10,
         sort: str = "latest",
+        since: Optional[str] = None,
     ) -> List[Dict]:
         """Search Bluesky posts via app.bsky.feed.searchPosts.
 
@@ -33,6 +35,8 @@ class BlueskyGrazer:
             query: Free-text search query
             limit: Maximum number of results (max 100)
             sort: Sort order — 'top' or 'latest'
+            since: Only return posts created at or after this ISO-8601
+                datetime
 
         Returns:
             List of post dicts with author, text, url, timestamps, metrics
@@ -42,6 +46,8 @@ class BlueskyGrazer:
             "limit": min(limit, 100),
             "sort": sort,
         }
+        if since:
+            params["since"] = since
 
         resp = self.session.get(
             f"{BSKY_API_BASE}/app.bsky.feed.searchPosts",
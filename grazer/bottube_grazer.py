@@ -6,13 +6,18 @@ BoTTube (https://bottube.ai) is an AI video platform where 63+ agents create,
 upload, and interact with video content (447+ videos).
 """
 
-import requests
 from typing import List, Dict, Optional
 
+from grazer.transport import HttpTransport
+
 
 BOTTUBE_API_BASE = "https://bottube.ai/api"
 
 
+def _json_body(resp):
+    return resp.json() if callable(resp.json) else resp.json
+
+
 class BoTTubeGrazer:
     """Discover BoTTube content — trending videos, new uploads, agent profiles.
 
@@ -27,17 +32,18 @@ class BoTTubeGrazer:
             print(video.get("title", ""), video.get("agent_name", ""))
     """
 
-    def __init__(self, api_key: Optional[str] = None, timeout: int = 15):
+    def __init__(self, api_key: Optional[str] = None, timeout: int = 15, transport: Optional[HttpTransport] = None):
         """Initialise the BoTTube discovery client.
 
         Args:
             api_key: Optional BoTTube API key (currently public endpoints work
                      without authentication, but pass one if you have it).
             timeout: HTTP request timeout in seconds.
+            transport: Shared pooled transport (default: a private one).
         """
         self.api_key = api_key
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = (transport or HttpTransport()).session()
         headers = {"User-Agent": "Grazer/1.9.1 (Elyan Labs)"}
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
@@ -70,13 +76,12 @@ class BoTTubeGrazer:
         if agent:
             params["agent"] = agent
 
-        resp = self.session.get(
+        data = self.session.get_parsed(
             f"{BOTTUBE_API_BASE}/videos",
+            _json_body,
             params=params,
             timeout=self.timeout,
         )
-        resp.raise_for_status()
-        data = resp.json() if callable(resp.json) else resp.json
         videos = data.get("videos", []) if isinstance(data, dict) else []
         return [self._normalize(v) for v in videos[: max(1, int(limit))]]
 
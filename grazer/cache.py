@@ -0,0 +1,333 @@
+"""
+Response caching for Grazer
+A TTL + LRU cache for GET responses, consulted by HttpTransport before any
+request leaves the process, so repeated discovery calls made seconds apart
+(an agent loop tick followed by a CLI run) are served from memory.
+SQLiteResponseCache keeps the same entries on disk so they survive between
+processes.
+"""
+
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time as _time
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from grazer._sqlite import SQLiteDatabase
+
+
+DEFAULT_CACHE_TTL = 60.0
+DEFAULT_CACHE_ENTRIES = 512
+DEFAULT_CACHE_PATH = "~/.grazer/cache.db"
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Request headers that identify the caller; responses fetched with different
+# credentials are cached separately.
+AUTH_HEADERS = ("Authorization", "X-API-Key", "Api-Key")
+
+
+class ResponseCache:
+    """Thread-safe in-memory TTL + LRU cache of HTTP responses.
+
+    Entries are keyed on method, full URL (including params) and a digest
+    of the auth headers. Each platform may have its own TTL; a platform with
+    a TTL of 0 is never cached. Within ``stale_while_revalidate`` seconds
+    after expiry an entry is still served, flagged as stale so the
+    transport can refresh it in the background.
+
+    Example::
+
+        cache = ResponseCache(ttl=120, platform_ttls={"arxiv": 900, "nostr": 15})
+        client = GrazerClient(cache=cache)
+        client.discover_arxiv(limit=5)
+        client.discover_arxiv(limit=5)  # served from the cache
+        cache.get_stats()  # {"hits": 1, "misses": 1, ...}
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_CACHE_TTL,
+        platform_ttls: Optional[Mapping[str, float]] = None,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+        stale_while_revalidate: float = 0.0,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl: Default seconds a response stays fresh.
+            platform_ttls: Per-platform TTL overrides, keyed like rate limits
+                (platform name or hostname).
+            max_entries: Least recently used entries beyond this are evicted.
+            stale_while_revalidate: Seconds past expiry during which a stale
+                response is served while it is refreshed.
+        """
+        self.ttl = float(ttl)
+        self.platform_ttls = {key: float(value) for key, value in (platform_ttls or {}).items()}
+        self.max_entries = max(1, int(max_entries))
+        self.stale_while_revalidate = max(0.0, float(stale_while_revalidate))
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        # Items lookups are counted apart so hit_rate stays the HTTP layer's.
+        self._counters = {
+            "hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0, "items_hits": 0, "items_misses": 0,
+        }
+
+    def ttl_for(self, platform: str) -> float:
+        """Fresh lifetime in seconds for responses from ``platform``."""
+        return self.platform_ttls.get(platform, self.ttl)
+
+    def get(self, key: str, allow_stale: bool = True) -> Optional[Tuple[Dict, bool]]:
+        """Look up a cached response snapshot.
+
+        Args:
+            key: Cache key.
+            allow_stale: Serve an entry within ``stale_while_revalidate``
+                (flagged stale); if False such an entry counts as a miss.
+
+        Returns:
+            ``(snapshot, stale)`` or None on a miss.
+        """
+        cached, counter = self._lookup(key, allow_stale)
+        self._count(counter)
+        return cached
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _lookup(self, key: str, allow_stale: bool) -> Tuple[Optional[Tuple[Dict, bool]], str]:
+        """Return what :meth:`get` returns and the counter it falls under."""
+        now = _time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, snapshot = entry
+                if now < expires_at:
+                    self._entries.move_to_end(key)
+                    return (snapshot, False), "hits"
+                if now < expires_at + self.stale_while_revalidate:
+                    if allow_stale:
+                        self._entries.move_to_end(key)
+                        return (snapshot, True), "stale_hits"
+                else:
+                    del self._entries[key]
+            return None, "misses"
+
+    def set(self, key: str, snapshot: Dict, platform: str) -> None:
+        """Store a response snapshot for ``platform`` under ``key``."""
+        ttl = self.ttl_for(platform)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (_time.monotonic() + ttl, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def get_items(self, key: str) -> Optional[List[Dict]]:
+        """Look up normalized discovery items stored with :meth:`set_items`.
+
+        Only fresh items are returned. Past their TTL the caller re-runs
+        discovery, whose HTTP responses are still served stale (and
+        refreshed in the background) within ``stale_while_revalidate``.
+        Lookups are counted as ``items_hits`` and ``items_misses``.
+        """
+        cached, _ = self._lookup(f"items {key}", allow_stale=False)
+        self._count("items_misses" if cached is None else "items_hits")
+        return copy.deepcopy(cached[0]["items"]) if cached is not None else None
+
+    def set_items(self, key: str, items: List[Dict], platform: str) -> None:
+        """Store normalized discovery items for ``platform`` under ``key``."""
+        self.set(f"items {key}", {"items": copy.deepcopy(items)}, platform)
+
+    def clear(self) -> None:
+        """Drop every cached response (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["stale_hits"]) / lookups, 3) if lookups else 0.0
+        return stats
+
+
+class SQLiteResponseCache(ResponseCache):
+    """On-disk :class:`ResponseCache`, bounded by ``max_bytes`` of stored bodies.
+
+    Least recently used entries are evicted first and expiry uses the wall
+    clock. Hit/miss counters are per instance.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS cache_entries ("
+        " key TEXT PRIMARY KEY, platform TEXT NOT NULL, expires_at REAL NOT NULL,"
+        " accessed_at REAL NOT NULL, size INTEGER NOT NULL, meta TEXT NOT NULL, body BLOB)",
+        "CREATE INDEX IF NOT EXISTS cache_entries_accessed ON cache_entries (accessed_at)",
+    )
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl: float = DEFAULT_CACHE_TTL,
+        platform_ttls: Optional[Mapping[str, float]] = None,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        stale_while_revalidate: float = 0.0,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file (default ``~/.grazer/cache.db``).
+            ttl: Default seconds a response stays fresh.
+            platform_ttls: Per-platform TTL overrides.
+            max_bytes: Total stored size above which old entries are evicted.
+            stale_while_revalidate: Seconds past expiry during which a stale
+                response is served while it is refreshed.
+        """
+        super().__init__(ttl=ttl, platform_ttls=platform_ttls, stale_while_revalidate=stale_while_revalidate)
+        self.max_bytes = max(1, int(max_bytes))
+        self._db = SQLiteDatabase(path, self._SCHEMA)
+        self.path = self._db.path
+
+    def _lookup(self, key: str, allow_stale: bool) -> Tuple[Optional[Tuple[Dict, bool]], str]:
+        now = _time.time()
+        with self._db.transaction() as conn:
+            row = conn.execute(
+                "SELECT expires_at, meta, body FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                expires_at, meta, body = row
+                if now < expires_at + self.stale_while_revalidate:
+                    conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+                else:
+                    conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                    row = None
+        stale = row is not None and now >= expires_at
+        if row is None or (stale and not allow_stale):
+            return None, "misses"
+        return (_decode_snapshot(meta, body), stale), "stale_hits" if stale else "hits"
+
+    def set(self, key: str, snapshot: Dict, platform: str) -> None:
+        ttl = self.ttl_for(platform)
+        if ttl <= 0:
+            return
+        meta, body = _encode_snapshot(snapshot)
+        size = len(meta) + len(body or b"")
+        now = _time.time()
+        with self._db.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries"
+                " (key, platform, expires_at, accessed_at, size, meta, body) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, platform, now + ttl, now, size, meta, body),
+            )
+            evicted = self._evict(conn, now)
+        with self._lock:
+            self._counters["evictions"] += evicted
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        """Drop dead entries, then LRU entries until under ``max_bytes``. Must be in a transaction."""
+        conn.execute(
+            "DELETE FROM cache_entries WHERE expires_at + ? <= ?", (self.stale_while_revalidate, now)
+        )
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+        evicted = 0
+        if total <= self.max_bytes:
+            return evicted
+        for key, size in conn.execute(
+            "SELECT key, size FROM cache_entries ORDER BY accessed_at"
+        ).fetchall():
+            conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            evicted += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+        return evicted
+
+    def get_items(self, key: str) -> Optional[List[Dict]]:
+        cached, _ = self._lookup(f"items {key}", allow_stale=False)
+        self._count("items_misses" if cached is None else "items_hits")
+        return cached[0]["items"] if cached is not None else None
+
+    def set_items(self, key: str, items: List[Dict], platform: str) -> None:
+        self.set(f"items {key}", {"items": items}, platform)
+
+    def clear(self) -> None:
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM cache_entries")
+
+    def __len__(self) -> int:
+        return self._db.connection().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._counters)
+        entries, size = self._db.connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()
+        stats.update(entries=entries, bytes=size, path=self.path)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["stale_hits"]) / lookups, 3) if lookups else 0.0
+        return stats
+
+
+def cache_key(method: str, url: str, params=None, headers: Optional[Mapping[str, str]] = None) -> str:
+    """Build a cache key from method, full URL and the caller's credentials."""
+    full_url = requests.Request(method, url, params=params).prepare().url
+    identity = ""
+    if headers:
+        headers = CaseInsensitiveDict(headers)
+        credentials = [f"{name}:{headers[name]}" for name in AUTH_HEADERS if headers.get(name)]
+        if credentials:
+            identity = hashlib.sha256("\n".join(credentials).encode()).hexdigest()[:16]
+    return f"{method.upper()} {full_url} {identity}"
+
+
+def snapshot_response(resp: requests.Response) -> Dict:
+    """Reduce a response to plain data that can be cached and restored."""
+    return {
+        "status_code": resp.status_code,
+        "reason": resp.reason,
+        "url": resp.url,
+        "headers": dict(resp.headers),
+        "encoding": resp.encoding,
+        "content": resp.content,
+    }
+
+
+def restore_response(snapshot: Dict) -> requests.Response:
+    """Rebuild a fresh ``requests.Response`` from :func:`snapshot_response`."""
+    resp = requests.Response()
+    resp.status_code = snapshot["status_code"]
+    resp.reason = snapshot["reason"]
+    resp.url = snapshot["url"]
+    resp.headers = CaseInsensitiveDict(snapshot["headers"])
+    resp.encoding = snapshot["encoding"]
+    resp._content = snapshot["content"]
+    return resp
+
+
+def _encode_snapshot(snapshot: Dict) -> Tuple[str, Optional[bytes]]:
+    """Split a snapshot into JSON metadata and its raw body for storage."""
+    meta = {key: value for key, value in snapshot.items() if key != "content"}
+    return json.dumps(meta, default=str), snapshot.get("content")
+
+
+def _decode_snapshot(meta: str, body: Optional[bytes]) -> Dict:
+    snapshot = json.loads(meta)
+    if body is not None:
+        snapshot["content"] = bytes(body)
+    return snapshot
@@ -0,0 +1,171 @@
+"""
+Circuit breakers for Grazer
+Per-platform closed/open/half-open breakers, fed by discovery errors and
+health probes, so a platform that is known to be down fails instantly
+instead of costing every sweep a full timeout.
+"""
+
+import threading
+import time as _time
+from typing import Dict, Mapping, Optional
+
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RECOVERY_SECONDS = 60.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpen(RuntimeError):
+    """Reported when a platform is skipped because its circuit is open."""
+
+    def __init__(self, message: str = "circuit_open"):
+        super().__init__(message)
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for one platform.
+
+    ``failure_threshold`` consecutive failures open the circuit. After
+    ``recovery_seconds`` it becomes half-open and lets a single trial call
+    through: success closes it, failure opens it again for another
+    ``recovery_seconds``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_seconds: float = DEFAULT_RECOVERY_SECONDS,
+    ):
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            recovery_seconds: Seconds an open circuit waits before a trial call.
+        """
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.recovery_seconds = float(recovery_seconds)
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def _current_state(self, now: float) -> str:
+        """Return the state, moving open to half-open once recovery is due. Must hold the lock."""
+        if self._state == OPEN and now - self._opened_at >= self.recovery_seconds:
+            self._state = HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    @property
+    def state(self) -> str:
+        """``closed``, ``open`` or ``half_open``."""
+        with self._lock:
+            return self._current_state(_time.monotonic())
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed (claims the half-open trial slot)."""
+        with self._lock:
+            state = self._current_state(_time.monotonic())
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def release(self) -> None:
+        """Give back a claimed half-open trial slot without a verdict."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold or after a failed trial."""
+        with self._lock:
+            now = _time.monotonic()
+            state = self._current_state(now)
+            self._failures += 1
+            if state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = now
+                self._trial_in_flight = False
+
+    def get_stats(self) -> Dict:
+        """Current state, consecutive failures and seconds until a trial call."""
+        with self._lock:
+            now = _time.monotonic()
+            state = self._current_state(now)
+            retry_in = self.recovery_seconds - (now - self._opened_at) if state == OPEN else 0.0
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "retry_in_seconds": round(max(0.0, retry_in), 1),
+            }
+
+
+class CircuitBreakerRegistry:
+    """Lazily created circuit breakers keyed by platform name.
+
+    Example::
+
+        breakers = CircuitBreakerRegistry(failure_threshold=2, recovery_seconds=300,
+                                          platforms={"clawsta": {"recovery_seconds": 900}})
+        client = GrazerClient(circuit_breakers=breakers)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_seconds: float = DEFAULT_RECOVERY_SECONDS,
+        platforms: Optional[Mapping[str, Mapping]] = None,
+    ):
+        """Initialize the registry.
+
+        Args:
+            failure_threshold: Default consecutive failures that open a circuit.
+            recovery_seconds: Default seconds before an open circuit is retried.
+            platforms: Per-platform overrides with the same two keys.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.platforms = dict(platforms or {})
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, platform: str) -> CircuitBreaker:
+        """Return the breaker for ``platform``, creating it on first use."""
+        with self._lock:
+            breaker = self._breakers.get(platform)
+            if breaker is None:
+                options = self.platforms.get(platform, {})
+                breaker = CircuitBreaker(
+                    failure_threshold=options.get("failure_threshold", self.failure_threshold),
+                    recovery_seconds=options.get("recovery_seconds", self.recovery_seconds),
+                )
+                self._breakers[platform] = breaker
+            return breaker
+
+    def record(self, platform: str, ok: bool) -> None:
+        """Feed one success or failure for ``platform``."""
+        breaker = self.get(platform)
+        if ok:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Stats for every breaker created so far."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {platform: breaker.get_stats() for platform, breaker in breakers.items()}
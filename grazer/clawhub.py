@@ -3,19 +3,20 @@ ClawHub Integration - Skill Registry with Vector Search
 Python SDK for https://clawhub.ai
 """
 
-import requests
 from typing import List, Dict, Optional
 
+from grazer.transport import HttpTransport
+
 
 class ClawHubClient:
     """Client for the ClawHub skill registry API."""
 
     BASE_URL = "https://clawhub.ai/api/v1"
 
-    def __init__(self, token: Optional[str] = None, timeout: int = 15):
+    def __init__(self, token: Optional[str] = None, timeout: int = 15, transport: Optional[HttpTransport] = None):
         self.token = token
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = (transport or HttpTransport()).session()
         self.session.headers.update({"User-Agent": "Grazer/1.3.0 (Elyan Labs)"})
         if token:
             self.session.headers.update({"Authorization": f"Bearer {token}"})
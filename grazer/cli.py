@@ -11,7 +11,7 @@ import time
 from pathlib import Path
 from typing import Optional
 
-from grazer import GrazerClient, PLATFORMS, __version__
+from grazer import GrazerClient, PLATFORMS, SQLiteResponseCache, __version__
 
 
 def _configure_console_encoding() -> None:
@@ -39,9 +39,25 @@ def load_config() -> dict:
     return json.loads(config_path.read_text())
 
 
+def _make_cache(config: dict) -> Optional[SQLiteResponseCache]:
+    """Build the on-disk response cache from the optional "cache" config section."""
+    options = config.get("cache")
+    if not options or not options.get("enabled", True):
+        return None
+    return SQLiteResponseCache(
+        path=options.get("path", "~/.grazer/cache.db"),
+        ttl=options.get("ttl_seconds", 300),
+        platform_ttls=options.get("platform_ttls"),
+        max_bytes=int(options.get("max_mb", 64) * 1024 * 1024),
+        stale_while_revalidate=options.get("stale_while_revalidate", 0),
+    )
+
+
 def _make_client(config: dict, **extra) -> GrazerClient:
     """Build a GrazerClient from config with all keys populated."""
     llm = config.get("imagegen", {})
+    if "cache" not in extra:
+        extra["cache"] = _make_cache(config)
     return GrazerClient(
         bottube_key=config.get("bottube", {}).get("api_key"),
         moltbook_key=config.get("moltbook", {}).get("api_key"),
@@ -59,6 +75,8 @@ def _make_client(config: dict, **extra) -> GrazerClient:
         llm_url=llm.get("llm_url"),
         llm_model=llm.get("llm_model", "gpt-oss-120b"),
         llm_api_key=llm.get("llm_api_key"),
+        rate_limits=config.get("rate_limits"),
+        rate_limit_db=config.get("rate_limit_db"),
         **extra,
     )
 
@@ -163,7 +181,8 @@ def _idempotency_mark(scope: str, key: Optional[str], ttl_seconds: int) -> None:
 def cmd_discover(args):
     """Discover trending content."""
     config = load_config()
-    client = _make_client(config)
+    extra = {"cache": None} if getattr(args, "no_cache", False) else {}
+    client = _make_client(config, **extra)
 
     if args.platform == "bottube":
         videos = client.discover_bottube(category=args.category, limit=args.limit)
@@ -487,16 +506,6 @@ def cmd_discover(args):
     elif args.platform == "all":
         include_health = getattr(args, "include_health", False)
         deduplicate = getattr(args, "deduplicate", False)
-        discover_options = {
-            "limit": args.limit,
-            "include_health": include_health,
-        }
-        if deduplicate:
-            discover_options["deduplicate"] = True
-        all_content = client.discover_all(**discover_options)
-        errors = all_content.pop("_errors", {})
-        health = all_content.pop("_health", {})
-        canonical = all_content.pop("_canonical", [])
         print("\n🌐 All Platforms:\n")
         labels = {
             "bottube": "BoTTube videos",
@@ -522,20 +531,28 @@ def cmd_discover(args):
             "mastodon": "Mastodon posts",
             "nostr": "Nostr events",
         }
-        for key, label in labels.items():
-            count = len(all_content.get(key, []))
-            err = errors.get(key)
+        health = client.discovery_health(list(labels)) if include_health else {}
+        all_content = {}
+        # Print each platform as soon as it finishes instead of waiting for the slowest one.
+        sweep_options = {"limit": args.limit}
+        if getattr(args, "deadline", None):
+            sweep_options["deadline"] = args.deadline
+        for key, outcome, elapsed_ms in client.iter_discover_all(**sweep_options):
+            label = labels.get(key, key)
             health_suffix = ""
             if include_health:
                 platform_health = health.get(key, {})
                 status = platform_health.get("status", "unknown")
                 source = "cached" if platform_health.get("cached") else "fresh" if platform_health.get("fresh") else "unknown"
                 health_suffix = f" [{status}, {source}]"
-            if err:
-                print(f"  {label}: OFFLINE{health_suffix} ({err[:60]})")
+            if isinstance(outcome, Exception):
+                err = str(outcome)
+                print(f"  {label}: OFFLINE{health_suffix} ({err[:60]})", flush=True)
             else:
-                print(f"  {label}: {count}{health_suffix}")
+                all_content[key] = outcome
+                print(f"  {label}: {len(outcome)}{health_suffix} ({elapsed_ms:.0f}ms)", flush=True)
         if deduplicate:
+            canonical = GrazerClient.deduplicate_discoveries(all_content)
             observations = sum(len(group.get("variants", [])) for group in canonical)
             collapsed = max(0, observations - len(canonical))
             print(f"  Canonical items: {len(canonical)} ({collapsed} duplicate observations collapsed)")
@@ -545,7 +562,7 @@ def cmd_discover(args):
 def cmd_status(args):
     """Check platform health and reachability."""
     config = load_config()
-    client = _make_client(config)
+    client = _make_client(config, cache=None)  # Health probes must hit the network
 
     platforms = [args.platform] if args.platform and args.platform != "all" else None
     results = client.platform_status(platforms)
@@ -950,6 +967,8 @@ def main():
     discover_parser.add_argument("-l", "--limit", type=int, default=20, help="Result limit")
     discover_parser.add_argument("--include-health", action="store_true", help="Include machine-readable platform health in all-platform discovery")
     discover_parser.add_argument("--deduplicate", action="store_true", help="Group matching cross-platform observations")
+    discover_parser.add_argument("--deadline", type=float, help="Overall time budget in seconds for all-platform discovery")
+    discover_parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk response cache from config")
 
     # stats command
     stats_parser = subparsers.add_parser("stats", help="Get platform statistics")
@@ -0,0 +1,86 @@
+"""
+Discovery cursor store for Grazer
+Keeps, per platform, how far the last discover_all(incremental=True) poll
+got: the newest item timestamp, the keys of the items at that timestamp
+and, for Mastodon, the newest status id. The next poll asks each platform
+for what came after it. SQLiteCursorStore keeps the cursors on disk, so a
+polling loop picks up where the previous process stopped.
+"""
+
+import json
+import threading
+import time as _time
+from typing import Dict
+
+from grazer._sqlite import SQLiteDatabase
+
+
+DEFAULT_CURSOR_PATH = "~/.grazer/cursors.db"
+
+
+class CursorStore:
+    """In-memory per-platform discovery cursors.
+
+    A cursor is a small JSON-serializable dict (``timestamp``, ``keys`` and
+    optionally ``id``); see ``GrazerClient.discover_all(incremental=True)``.
+
+    Example::
+
+        client = GrazerClient(cursor_store=CursorStore())
+        first = client.discover_all(incremental=True)
+        delta = client.discover_all(incremental=True)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cursors: Dict[str, Dict] = {}
+
+    def get_all(self) -> Dict[str, Dict]:
+        """Return a copy of every platform's cursor."""
+        with self._lock:
+            return {platform: dict(cursor) for platform, cursor in self._cursors.items()}
+
+    def update(self, cursors: Dict[str, Dict]) -> None:
+        """Replace the cursors of the given platforms, leaving the others."""
+        with self._lock:
+            self._cursors.update({platform: dict(cursor) for platform, cursor in cursors.items()})
+
+    def clear(self) -> None:
+        """Forget every cursor; the next incremental poll starts from scratch."""
+        with self._lock:
+            self._cursors.clear()
+
+
+class SQLiteCursorStore(CursorStore):
+    """On-disk :class:`CursorStore`; ``update`` writes a whole poll in one transaction."""
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS cursors ("
+        "platform TEXT PRIMARY KEY, cursor TEXT NOT NULL, updated_at REAL NOT NULL)",
+    )
+
+    def __init__(self, path: str = DEFAULT_CURSOR_PATH):
+        """Initialize the store.
+
+        Args:
+            path: SQLite database file (default ``~/.grazer/cursors.db``).
+        """
+        super().__init__()
+        self._db = SQLiteDatabase(path, self._SCHEMA)
+        self.path = self._db.path
+
+    def get_all(self) -> Dict[str, Dict]:
+        rows = self._db.connection().execute("SELECT platform, cursor FROM cursors").fetchall()
+        return {platform: json.loads(cursor) for platform, cursor in rows}
+
+    def update(self, cursors: Dict[str, Dict]) -> None:
+        now = _time.time()
+        with self._db.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cursors (platform, cursor, updated_at) VALUES (?, ?, ?)",
+                ((platform, json.dumps(cursor, sort_keys=True), now) for platform, cursor in cursors.items()),
+            )
+
+    def clear(self) -> None:
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM cursors")
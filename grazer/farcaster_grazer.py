@@ -4,9 +4,11 @@ Discovers casts via the Neynar API.
 Optional API key for higher rate limits; public endpoints work without auth.
 """
 
-import requests
+from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
+from grazer.transport import HttpTransport
+
 
 NEYNAR_API_BASE = "https://api.neynar.com/v2/farcaster"
 
@@ -14,10 +16,10 @@ NEYNAR_API_BASE = "https://api.neynar.com/v2/farcaster"
 class FarcasterGrazer:
     """Discover casts from Farcaster via the Neynar API."""
 
-    def __init__(self, api_key: Optional[str] = None, timeout: int = 15):
+    def __init__(self, api_key: Optional[str] = None, timeout: int = 15, transport: Optional[HttpTransport] = None):
         self.api_key = api_key
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = (transport or HttpTransport()).session()
         headers = {
             "User-Agent": "Grazer/1.9.1 (Elyan Labs; https://github.com/Scottcjn/grazer-skill)",
             "Accept": "application/json",
@@ -30,12 +32,16 @@ class FarcasterGrazer:
         self,
         query: str = "AI agents",
         limit: int = 10,
+        since: Optional[str] = None,
     ) -> List[Dict]:
         """Search Farcaster casts.
 
         Args:
             query: Free-text search query
             limit: Maximum number of results (max 100)
+            since: Only search casts from the day before this ISO-8601
+                timestamp onwards (the search ``after:`` operator is
+                day-granular, so callers filter the overlap)
 
         Returns:
             List of cast dicts with author, text, url, timestamps, metrics
@@ -44,6 +50,10 @@ class FarcasterGrazer:
             "q": query,
             "limit": min(limit, 100),
         }
+        after = _search_after_date(since)
+        if after:
+            params["q"] = f"{query} after:{after}"
+            params["sort_type"] = "desc_chron"
 
         resp = self.session.get(
             f"{NEYNAR_API_BASE}/cast/search",
@@ -122,6 +132,17 @@ class FarcasterGrazer:
         return casts[:limit]
 
 
+def _search_after_date(since: Optional[str]) -> str:
+    """The ``after:`` search date covering ``since`` ("" if unset or unparseable)."""
+    if not since:
+        return ""
+    try:
+        stamp = datetime.fromisoformat(since.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return ""
+    return (stamp - timedelta(days=1)).date().isoformat()
+
+
 def _normalize_cast(item: dict) -> Dict:
     """Normalize a Farcaster cast object into a consistent dict."""
     author_data = item.get("author", {})
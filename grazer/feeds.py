@@ -0,0 +1,181 @@
+"""
+Streaming feed parsing for Grazer
+Atom and RSS helpers shared by the feed-based plugins. Documents are fed to
+an incremental XML parser in chunks, so a caller that only wants the first
+``limit`` entries stops parsing as soon as it has them, and finished
+elements are cleared as it goes. Feeds with a fixed, machine-written layout
+can instead be scanned with one combined field regex per entry.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from itertools import islice
+from typing import Dict, Iterator, Optional, Pattern, Tuple, Union
+
+import requests
+
+
+CHUNK_SIZE = 16 * 1024
+
+FeedSource = Union[str, bytes, requests.Response]
+
+ATOM_ENTRY_PATTERN = re.compile(r"<entry>(.*?)</entry>", re.DOTALL)
+
+# YouTube channel/playlist feeds: each alternative captures one field of an
+# entry into its named group.
+YOUTUBE_FIELD_PATTERN = re.compile(
+    r"<yt:videoId>(?P<id>.*?)</yt:videoId>"
+    r"|<title>(?P<title>(?s:.*?))</title>"
+    r"|<author>\s*<name>(?P<channel>.*?)</name>"
+    r"|<published>(?P<published>.*?)</published>"
+    r"|<media:description>(?P<description>(?s:.*?))</media:description>"
+    r'|<media:thumbnail[^>]+url="(?P<thumbnail>[^"]+)"'
+    r'|<media:statistics[^>]+views="(?P<views>\d+)"'
+)
+
+
+def local_name(tag) -> str:
+    """Return ``tag`` without its ``{namespace}`` prefix ("" for comments/PIs)."""
+    if not isinstance(tag, str):
+        return ""
+    return tag.rsplit("}", 1)[-1]
+
+
+def split_tag(tag) -> Tuple[str, str]:
+    """Split ``{namespace}local`` into ``(namespace, local)`` (namespace "" if none)."""
+    if not isinstance(tag, str):
+        return "", ""
+    if tag.startswith("{"):
+        namespace, _, local = tag[1:].partition("}")
+        return namespace, local
+    return "", tag
+
+
+def child(elem: ET.Element, name: str) -> Optional[ET.Element]:
+    """Return the first direct child of ``elem`` whose local name is ``name``."""
+    for sub in elem:
+        if local_name(sub.tag) == name:
+            return sub
+    return None
+
+
+def response_source(resp) -> FeedSource:
+    """Return what to parse for a fetched feed: the response itself, so a
+    streamed body is read incrementally and the feed's own encoding
+    declaration is honoured, or ``resp.text`` for response-like stand-ins."""
+    if isinstance(resp, requests.Response):
+        return resp
+    return resp.text
+
+
+def _chunks(source: FeedSource, chunk_size: int) -> Iterator[Union[str, bytes]]:
+    if isinstance(source, requests.Response):
+        if not source._content_consumed and source.raw is not None:
+            # Streamed response (stream=True): read straight off the socket.
+            yield from source.iter_content(chunk_size)
+            return
+        source = source.content
+    if isinstance(source, (str, bytes)):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+        return
+    # Any other binary or text file-like object.
+    while True:
+        data = source.read(chunk_size)
+        if not data:
+            return
+        yield data
+
+
+def iter_feed_items(
+    source: FeedSource,
+    item_tag: str,
+    limit: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    max_bytes: Optional[int] = None,
+) -> Iterator[ET.Element]:
+    """Yield each completed ``item_tag`` element of a feed as it is parsed.
+
+    Tags are matched by local name, so namespaced and plain feeds both work.
+    Each element is cleared once the consumer resumes the generator, so
+    read what you need from it before asking for the next one. A truncated
+    or malformed document (including an HTML-only entity such as
+    ``&nbsp;``), or one longer than ``max_bytes``, ends the iteration after
+    the items completed before the problem instead of raising.
+
+    Args:
+        source: Feed text or bytes, a ``requests.Response`` or a file-like object
+        item_tag: Local name of the item element ("entry" for Atom, "item" for RSS)
+        limit: Stop after this many items (None for all)
+        chunk_size: Bytes or characters fed to the parser at a time
+        max_bytes: Stop reading after this many bytes (characters for text
+                   input); None reads the whole document
+
+    Returns:
+        Iterator of parsed ``xml.etree.ElementTree.Element`` items
+    """
+    if limit is not None and limit <= 0:
+        return
+    parser = ET.XMLPullParser(events=("end",))
+    count = 0
+    received = 0
+    chunks = _chunks(source, chunk_size)
+    done = False
+    while not done:
+        try:
+            data = next(chunks, None)
+            if data is None:
+                done = True
+                parser.close()
+            else:
+                if max_bytes is not None and received + len(data) >= max_bytes:
+                    data = data[:max_bytes - received]
+                    done = True
+                received += len(data)
+                parser.feed(data)
+        except ET.ParseError:
+            # Keep whatever was parsed before the document broke off.
+            done = True
+        try:
+            for _, elem in parser.read_events():
+                if local_name(elem.tag) != item_tag:
+                    continue
+                yield elem
+                elem.clear()
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+        except ET.ParseError:
+            # The pull parser queues errors (an undefined entity, a bare "<")
+            # and raises them here, after the events that preceded them.
+            return
+
+
+def iter_entry_fields(
+    text: Union[str, bytes],
+    field_pattern: Pattern,
+    limit: Optional[int] = None,
+    entry_pattern: Pattern = ATOM_ENTRY_PATTERN,
+) -> Iterator[Dict[str, str]]:
+    """Yield the raw fields of each entry of a fixed-layout feed.
+
+    One scan finds the entries and one more per entry picks up all of its
+    fields; the first occurrence of each named group wins. Values are the
+    raw matched text, with character and entity references left as is.
+
+    Args:
+        text: Feed text or bytes (decoded as UTF-8)
+        field_pattern: Alternation of named groups, one per field
+        limit: Stop after this many entries (None for all)
+        entry_pattern: Pattern whose first group is the text of one entry
+
+    Returns:
+        Iterator of ``{group name: matched text}`` dicts
+    """
+    if isinstance(text, bytes):
+        text = text.decode("utf-8", errors="replace")
+    for entry in islice(entry_pattern.finditer(text), limit):
+        fields: Dict[str, str] = {}
+        for match in field_pattern.finditer(entry.group(1)):
+            fields.setdefault(match.lastgroup, match.group(match.lastgroup))
+        yield fields
@@ -4,9 +4,10 @@ Discovers posts, trending hashtags, and public timelines from any Mastodon insta
 No API key required for public reads.
 """
 
-import requests
 from typing import List, Dict, Optional
 
+from grazer.transport import HttpTransport
+
 
 DEFAULT_INSTANCE = "mastodon.social"
 
@@ -14,10 +15,10 @@ DEFAULT_INSTANCE = "mastodon.social"
 class MastodonGrazer:
     """Discover posts from the Mastodon fediverse."""
 
-    def __init__(self, instance: str = DEFAULT_INSTANCE, timeout: int = 15):
+    def __init__(self, instance: str = DEFAULT_INSTANCE, timeout: int = 15, transport: Optional[HttpTransport] = None):
         self.instance = instance.rstrip("/")
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = (transport or HttpTransport()).session()
         self.session.headers.update(
             {"User-Agent": "Grazer/1.9.1 (Elyan Labs; https://github.com/Scottcjn/grazer-skill)"}
         )
@@ -33,6 +34,7 @@ class MastodonGrazer:
         query: str = "AI",
         instance: Optional[str] = None,
         limit: int = 10,
+        since_id: Optional[str] = None,
     ) -> List[Dict]:
         """Search public posts on a Mastodon instance.
 
@@ -40,6 +42,7 @@ class MastodonGrazer:
             query: Free-text search query
             instance: Instance hostname (default: mastodon.social)
             limit: Maximum results (max 40)
+            since_id: Only return statuses newer than this status id
 
         Returns:
             List of post dicts
@@ -50,6 +53,9 @@ class MastodonGrazer:
             "type": "statuses",
             "limit": min(limit, 40),
         }
+        if since_id:
+            # Search pages by min_id ("immediately newer than").
+            params["min_id"] = since_id
 
         resp = self.session.get(
             f"{base}/search",
@@ -62,6 +68,8 @@ class MastodonGrazer:
         posts = []
         for item in data.get("statuses", []):
             post = _normalize_status(item)
+            if since_id and not _newer_id(post["id"], since_id):
+                continue
             posts.append(post)
 
         return posts[:limit]
@@ -169,6 +177,14 @@ class MastodonGrazer:
         return posts[:limit]
 
 
+def _newer_id(status_id, since_id) -> bool:
+    """True if ``status_id`` is after ``since_id`` (Mastodon ids sort numerically)."""
+    try:
+        return int(status_id) > int(since_id)
+    except (TypeError, ValueError):
+        return True
+
+
 def _normalize_status(item: dict) -> Dict:
     """Normalize a Mastodon status object into a consistent dict."""
     account = item.get("account", {})
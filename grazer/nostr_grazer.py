@@ -4,9 +4,10 @@ Discovers Nostr events via the nostr.band REST API.
 No WebSocket needed, no API key required.
 """
 
-import requests
 from typing import List, Dict, Optional
 
+from grazer.transport import HttpTransport
+
 
 NOSTR_BAND_API = "https://api.nostr.band"
 
@@ -14,9 +15,9 @@ NOSTR_BAND_API = "https://api.nostr.band"
 class NostrGrazer:
     """Discover Nostr events via the nostr.band REST search API."""
 
-    def __init__(self, timeout: int = 15):
+    def __init__(self, timeout: int = 15, transport: Optional[HttpTransport] = None):
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = (transport or HttpTransport()).session()
         self.session.headers.update(
             {"User-Agent": "Grazer/1.9.1 (Elyan Labs; https://github.com/Scottcjn/grazer-skill)"}
         )
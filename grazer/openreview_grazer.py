@@ -4,9 +4,10 @@ Discovers conference papers and submissions via the OpenReview API v2.
 No API key required for public venues.
 """
 
-import requests
 from typing import List, Dict, Optional
 
+from grazer.transport import HttpTransport
+
 
 OPENREVIEW_API_BASE = "https://api2.openreview.net"
 
@@ -14,9 +15,9 @@ OPENREVIEW_API_BASE = "https://api2.openreview.net"
 class OpenReviewGrazer:
     """Discover papers from OpenReview conference venues."""
 
-    def __init__(self, timeout: int = 15):
+    def __init__(self, timeout: int = 15, transport: Optional[HttpTransport] = None):
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = (transport or HttpTransport()).session()
         self.session.headers.update(
             {"User-Agent": "Grazer/1.9.1 (Elyan Labs; https://github.com/Scottcjn/grazer-skill)"}
         )
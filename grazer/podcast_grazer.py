@@ -4,72 +4,96 @@ Discovers podcast episodes via the iTunes Search API and public RSS feeds.
 No API key required.
 """
 
-import re
-import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from urllib.parse import quote
 
+from grazer.feeds import iter_feed_items, response_source, split_tag
+from grazer.transport import HttpTransport
+
 
 ITUNES_SEARCH_URL = "https://itunes.apple.com/search"
 ITUNES_LOOKUP_URL = "https://itunes.apple.com/lookup"
-
-
-def _parse_podcast_rss(xml_text: str) -> List[Dict]:
+ITUNES_NS = "http://www.itunes.com/dtds/podcast-1.0.dtd"
+
+# Shows' RSS feeds are fetched concurrently by discover(), at most this many at a time.
+DEFAULT_FEED_WORKERS = 8
+
+# Podcast feeds can run to many megabytes; stop reading a feed after this
+# much even if fewer than ``limit`` episodes have been parsed.
+DEFAULT_MAX_FEED_BYTES = 16 * 1024 * 1024
+
+# Plain RSS 2.0 elements and iTunes extension elements read from each <item>.
+_RSS_FIELDS = {"title", "description", "pubDate", "link", "enclosure"}
+_ITUNES_FIELDS = {"duration", "episode"}
+
+
+def _rss_item_to_episode(item) -> Dict:
+    """Convert one parsed RSS ``<item>`` element into an episode dict."""
+    fields: Dict[str, str] = {}
+    audio_url = None
+
+    # Single pass over the item's children; the first occurrence of each field wins.
+    for sub in item:
+        namespace, tag = split_tag(sub.tag)
+        if not namespace and tag in _RSS_FIELDS:
+            if tag == "enclosure":
+                if audio_url is None and sub.get("url"):
+                    audio_url = sub.get("url")
+            elif tag not in fields:
+                fields[tag] = sub.text or ""
+        elif namespace.lower() == ITUNES_NS and tag in _ITUNES_FIELDS and tag not in fields:
+            fields[tag] = sub.text or ""
+
+    ep: Dict = {}
+    if "title" in fields:
+        ep["title"] = " ".join(fields["title"].split())
+    if "description" in fields:
+        ep["description"] = " ".join(fields["description"].split())[:500]
+    if "pubDate" in fields:
+        ep["published"] = fields["pubDate"].strip()
+    if audio_url:
+        ep["audio_url"] = audio_url
+    if "duration" in fields:
+        ep["duration"] = fields["duration"].strip()
+    if "link" in fields:
+        ep["url"] = fields["link"].strip()
+    if "episode" in fields:
+        ep["episode_number"] = fields["episode"].strip()
+    return ep
+
+
+def _parse_podcast_rss(
+    xml_text, limit: Optional[int] = None, max_bytes: Optional[int] = None
+) -> List[Dict]:
     """Parse a podcast RSS feed into episode dicts.
 
-    Uses regex to avoid requiring feedparser.  Podcast RSS is
-    well-structured (RSS 2.0 with iTunes extensions).
-    """
-    episodes = []
-    raw_items = re.findall(r"<item>(.*?)</item>", xml_text, re.DOTALL)
-    for raw in raw_items:
-        ep: Dict = {}
-
-        title_match = re.search(r"<title>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</title>", raw, re.DOTALL)
-        if title_match:
-            ep["title"] = " ".join(title_match.group(1).split())
-
-        desc_match = re.search(
-            r"<description>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</description>", raw, re.DOTALL
-        )
-        if desc_match:
-            ep["description"] = " ".join(desc_match.group(1).split())[:500]
-
-        pub_match = re.search(r"<pubDate>(.*?)</pubDate>", raw)
-        if pub_match:
-            ep["published"] = pub_match.group(1).strip()
-
-        # Audio enclosure
-        enc_match = re.search(r'<enclosure[^>]+url="([^"]+)"', raw)
-        if enc_match:
-            ep["audio_url"] = enc_match.group(1)
-
-        # Duration (iTunes extension)
-        dur_match = re.search(r"<itunes:duration>(.*?)</itunes:duration>", raw)
-        if dur_match:
-            ep["duration"] = dur_match.group(1).strip()
+    The feed is parsed incrementally with the standard library (no
+    feedparser dependency). Parsing stops after ``limit`` items or
+    ``max_bytes`` of input, whichever comes first, so the rest of a large
+    feed is never read.
 
-        # Episode link
-        link_match = re.search(r"<link>(.*?)</link>", raw)
-        if link_match:
-            ep["url"] = link_match.group(1).strip()
+    Args:
+        xml_text: Feed text or bytes, or the (possibly streamed) ``requests.Response``
+        limit: Maximum number of episodes to parse (None for all)
+        max_bytes: Maximum feed size to read (None for no cap)
 
-        # Episode number
-        ep_num_match = re.search(r"<itunes:episode>(.*?)</itunes:episode>", raw)
-        if ep_num_match:
-            ep["episode_number"] = ep_num_match.group(1).strip()
-
-        episodes.append(ep)
-
-    return episodes
+    Returns:
+        List of episode dicts
+    """
+    return [
+        _rss_item_to_episode(item)
+        for item in iter_feed_items(xml_text, "item", limit, max_bytes=max_bytes)
+    ]
 
 
 class PodcastGrazer:
     """Discover podcasts and episodes via iTunes Search API and RSS feeds."""
 
-    def __init__(self, timeout: int = 15):
+    def __init__(self, timeout: int = 15, transport: Optional[HttpTransport] = None):
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = (transport or HttpTransport()).session()
         self.session.headers.update(
             {"User-Agent": "Grazer/1.9.1 (Elyan Labs; https://github.com/Scottcjn/grazer-skill)"}
         )
@@ -123,19 +147,28 @@ class PodcastGrazer:
         self,
         feed_url: str,
         limit: int = 10,
+        max_bytes: int = DEFAULT_MAX_FEED_BYTES,
     ) -> List[Dict]:
         """Fetch recent episodes from a podcast RSS feed.
 
+        The feed is streamed and parsing stops after ``limit`` episodes, so
+        only the head of a large feed is downloaded.
+
         Args:
             feed_url: The podcast's RSS feed URL
             limit: Maximum episodes to return
+            max_bytes: Stop reading the feed after this many bytes
 
         Returns:
             List of episode dicts with title, description, audio_url, etc.
         """
-        resp = self.session.get(feed_url, timeout=self.timeout)
-        resp.raise_for_status()
-        eps = _parse_podcast_rss(resp.text)
+        eps = self.session.get_parsed(
+            feed_url,
+            lambda resp: _parse_podcast_rss(response_source(resp), limit, max_bytes=max_bytes),
+            variant=(limit, max_bytes),
+            timeout=self.timeout,
+            stream=True,
+        )
         return eps[:limit]
 
     def discover(
@@ -143,32 +176,63 @@ class PodcastGrazer:
         query: str = "AI technology",
         limit: int = 10,
         episodes_per_show: int = 3,
+        max_workers: int = DEFAULT_FEED_WORKERS,
+        feed_timeout: Optional[float] = None,
     ) -> List[Dict]:
         """Discover podcasts and their latest episodes in one call.
 
         Searches iTunes for shows matching the query, then fetches the
-        latest episodes from each show's RSS feed.
+        latest episodes from the shows' RSS feeds concurrently. A feed that
+        fails or runs out of time leaves that show with ``episodes == []``.
 
         Args:
             query: Search terms
             limit: Maximum number of shows
             episodes_per_show: How many episodes to fetch per show
+            max_workers: Maximum feeds fetched at the same time
+            feed_timeout: Seconds each feed may take, including retries
+                          (defaults to the grazer's timeout)
 
         Returns:
             List of show dicts, each with a nested ``episodes`` list.
         """
         shows = self.search(query, limit=limit)
         for show in shows:
-            feed_url = show.get("feed_url")
-            if feed_url:
-                try:
-                    show["episodes"] = self.episodes(feed_url, limit=episodes_per_show)
-                except Exception:
-                    show["episodes"] = []
-            else:
-                show["episodes"] = []
+            show["episodes"] = []
+        pending = [show for show in shows if show.get("feed_url")]
+        if not pending:
+            return shows
+
+        budget = self.timeout if feed_timeout is None else feed_timeout
+        # Worker threads don't inherit the caller's thread-local deadline
+        # (e.g. a discover_all platform budget), so pass it along explicitly.
+        caller_cutoff = getattr(self.session.transport.deadline, "at", None)
+        workers = max(1, min(max_workers, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="grazer-podcast") as pool:
+            futures = [
+                (show, pool.submit(self._feed_episodes, show["feed_url"], episodes_per_show, budget, caller_cutoff))
+                for show in pending
+            ]
+            for show, future in futures:
+                show["episodes"] = future.result()
         return shows
 
+    def _feed_episodes(
+        self, feed_url: str, limit: int, budget: float, caller_cutoff: Optional[float]
+    ) -> List[Dict]:
+        """Fetch one show's episodes within ``budget`` seconds, or [] on any failure."""
+        cutoff = time.monotonic() + budget
+        if caller_cutoff is not None:
+            cutoff = min(cutoff, caller_cutoff)
+        deadline = self.session.transport.deadline
+        deadline.at = cutoff
+        try:
+            return self.episodes(feed_url, limit=limit)
+        except Exception:
+            return []
+        finally:
+            deadline.at = None
+
     def lookup(self, podcast_id: int) -> Optional[Dict]:
         """Look up a podcast by its iTunes ID.
 
@@ -0,0 +1,477 @@
+"""
+Rate limiting for Grazer
+Thread-safe sliding-window limiters and a per-platform registry so that
+a burst against one host never throttles requests to unrelated hosts.
+An optional SQLite-backed limiter shares budgets between processes.
+"""
+
+import sqlite3
+import threading
+import time as _time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+from grazer._sqlite import SQLiteDatabase
+
+
+DEFAULT_MAX_REQUESTS = 60
+DEFAULT_WINDOW_SECONDS = 60.0
+
+# Adaptive limiting: cap on how long a Retry-After/reset header may park a
+# platform, and the fraction of the configured budget restored per window.
+MAX_PARK_SECONDS = 300.0
+RECOVERY_FRACTION = 0.1
+
+
+class ThreadSafeRateLimiter:
+    """Thread-safe rate limiter using sliding window algorithm.
+    
+    Prevents race conditions when multiple threads make concurrent requests.
+    Uses threading.Condition so threads deterministically queue and wake
+    without the lock-release-then-sleep concurrency hole.
+
+    Request timestamps live in a deque ordered oldest-first and come from
+    ``time.monotonic()``, so pruning is amortized O(1) per call and wall
+    clock adjustments never shrink or stretch the window.
+
+    The limiter also adapts to server feedback (see :meth:`observe`): an
+    HTTP 429 halves the effective budget and parks new requests until the
+    ``Retry-After`` time, an exhausted ``X-RateLimit-Remaining`` parks them
+    until the advertised reset, and the budget then grows back towards the
+    configured ``max_requests`` by a tenth per quiet window.
+    """
+    
+    def __init__(self, max_requests: int = 60, window_seconds: float = 60.0):
+        """Initialize rate limiter.
+        
+        Args:
+            max_requests: Maximum requests allowed in the time window.
+            window_seconds: Time window in seconds.
+        """
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.configured_max_requests = max_requests
+        self._condition = threading.Condition()
+        self._requests: Deque[float] = deque()  # Monotonic timestamps, oldest first
+        self._parked_until = 0.0  # Monotonic time before which nothing may be sent
+        self._adjusted_at = _time.monotonic()  # Last budget change, for ramp-up
+    
+    def _prune(self, now: float) -> None:
+        """Drop timestamps outside the current window. Must hold self._condition."""
+        cutoff = now - self.window_seconds
+        requests = self._requests
+        while requests and requests[0] <= cutoff:
+            requests.popleft()
+    
+    def _recover(self, now: float) -> None:
+        """Ramp a reduced budget back up, one step per quiet window. Must hold self._condition."""
+        if self.max_requests >= self.configured_max_requests:
+            return
+        if now - self._adjusted_at < self.window_seconds:
+            return
+        step = max(1, int(self.configured_max_requests * RECOVERY_FRACTION))
+        self.max_requests = min(self.configured_max_requests, self.max_requests + step)
+        self._adjusted_at = now
+        self._condition.notify_all()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Acquire permission to make a request. Blocks if rate limit exceeded.
+        
+        A full window only frees up as its oldest timestamp expires, so
+        waiters sleep exactly until then instead of being woken by every
+        successful acquire. Requests also wait out any park set by
+        :meth:`observe`.
+
+        Args:
+            timeout: Longest wait in seconds (default: no limit). A caller
+                whose slot would open later gives up at once without taking one.
+
+        Returns:
+            True once a slot is taken, False if it could not be within ``timeout``.
+        """
+        with self._condition:
+            now = _time.monotonic()
+            give_up_at = None if timeout is None else now + timeout
+            self._prune(now)
+            self._recover(now)
+            
+            # Deterministically compute when a slot will be available.
+            # If we are at capacity, the earliest slot opens when the oldest
+            # timestamp falls outside the window.
+            while now < self._parked_until or len(self._requests) >= self.max_requests:
+                if now < self._parked_until:
+                    wait_time = self._parked_until - now
+                else:
+                    wait_time = self._requests[0] + self.window_seconds - now
+                if give_up_at is not None and now + wait_time > give_up_at:
+                    return False
+                if wait_time > 0:
+                    self._condition.wait(timeout=wait_time)
+                now = _time.monotonic()
+                self._prune(now)
+                self._recover(now)
+            
+            # Record this request
+            self._requests.append(now)
+            return True
+
+    def try_acquire(self) -> bool:
+        """Take a slot only if one is free right now; never blocks."""
+        with self._condition:
+            now = _time.monotonic()
+            self._prune(now)
+            self._recover(now)
+            if now < self._parked_until or len(self._requests) >= self.max_requests:
+                return False
+            self._requests.append(now)
+            return True
+
+    def observe(self, status_code: Any, headers: Any) -> None:
+        """Learn from a response's status code and rate limit headers.
+
+        Args:
+            status_code: HTTP status of the response.
+            headers: Response headers (any case-insensitive mapping).
+        """
+        feedback = _rate_limit_feedback(status_code, headers, self.window_seconds, self.configured_max_requests)
+        if feedback is None:
+            return
+        throttled, park = feedback
+
+        with self._condition:
+            now = _time.monotonic()
+            if park:
+                self._parked_until = max(self._parked_until, now + park)
+            if throttled:
+                self.max_requests = max(1, self.max_requests // 2)
+                self._adjusted_at = now
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """Treat the platform as rate limited, as if it had returned HTTP 429."""
+        headers = {} if retry_after is None else {"Retry-After": str(retry_after)}
+        self.observe(429, headers)
+    
+    def get_stats(self) -> Dict:
+        """Get current rate limiter statistics."""
+        with self._condition:
+            now = _time.monotonic()
+            self._prune(now)
+            self._recover(now)
+            in_window = len(self._requests)
+            return {
+                "requests_in_window": in_window,
+                "max_requests": self.max_requests,
+                "configured_max_requests": self.configured_max_requests,
+                "window_seconds": self.window_seconds,
+                "available": max(0, self.max_requests - in_window),
+                "parked_seconds": round(max(0.0, self._parked_until - now), 3),
+            }
+
+
+class SQLiteRateLimiter:
+    """:class:`ThreadSafeRateLimiter` whose budget is kept in a SQLite file.
+
+    Everything using the same file and key draws from one budget. A caller
+    that finds the window full sleeps outside the transaction and retries;
+    timestamps use the wall clock.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS rate_requests (key TEXT NOT NULL, ts REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS rate_requests_key_ts ON rate_requests (key, ts)",
+        "CREATE TABLE IF NOT EXISTS rate_state ("
+        " key TEXT PRIMARY KEY, max_requests INTEGER NOT NULL,"
+        " parked_until REAL NOT NULL, adjusted_at REAL NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS rate_counts (key TEXT PRIMARY KEY, in_window INTEGER NOT NULL)",
+    )
+
+    def __init__(self, path: str, key: str, max_requests: int = 60, window_seconds: float = 60.0):
+        """Initialize the limiter.
+
+        Args:
+            path: SQLite database file shared by all participating processes.
+            key: Budget name (typically the platform).
+            max_requests: Maximum requests allowed in the time window.
+            window_seconds: Time window in seconds.
+        """
+        self.key = key
+        self.configured_max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._db = SQLiteDatabase(path, self._SCHEMA)
+        self.path = self._db.path
+
+    def _state(self, conn: sqlite3.Connection, now: float) -> tuple:
+        """Return (max_requests, parked_until), applying ramp-up. Must be in a transaction."""
+        row = conn.execute(
+            "SELECT max_requests, parked_until, adjusted_at FROM rate_state WHERE key = ?", (self.key,)
+        ).fetchone()
+        if row is None:
+            return self.configured_max_requests, 0.0
+        max_requests, parked_until, adjusted_at = row
+        if max_requests < self.configured_max_requests and now - adjusted_at >= self.window_seconds:
+            step = max(1, int(self.configured_max_requests * RECOVERY_FRACTION))
+            max_requests = min(self.configured_max_requests, max_requests + step)
+            conn.execute(
+                "UPDATE rate_state SET max_requests = ?, adjusted_at = ? WHERE key = ?",
+                (max_requests, now, self.key),
+            )
+        return max_requests, parked_until
+
+    def _in_window(self, conn: sqlite3.Connection, now: float) -> int:
+        """Prune requests that left the window and return how many remain. Must be in a transaction.
+
+        The count lives in ``rate_counts`` and is adjusted by the rows pruned
+        here and inserted by :meth:`_try_acquire`, so no call scans the window.
+        """
+        pruned = conn.execute(
+            "DELETE FROM rate_requests WHERE key = ? AND ts <= ?", (self.key, now - self.window_seconds)
+        ).rowcount
+        row = conn.execute("SELECT in_window FROM rate_counts WHERE key = ?", (self.key,)).fetchone()
+        if row is None:
+            # First use of this key (or a database from before the counter): count once.
+            (in_window,) = conn.execute(
+                "SELECT COUNT(*) FROM rate_requests WHERE key = ?", (self.key,)
+            ).fetchone()
+            conn.execute("INSERT INTO rate_counts (key, in_window) VALUES (?, ?)", (self.key, in_window))
+            return in_window
+        in_window = max(0, row[0] - pruned)
+        if pruned:
+            conn.execute("UPDATE rate_counts SET in_window = ? WHERE key = ?", (in_window, self.key))
+        return in_window
+
+    def _try_acquire(self) -> float:
+        """Record a request if the budget allows. Returns 0, or seconds to wait."""
+        with self._db.transaction() as conn:
+            now = _time.time()
+            in_window = self._in_window(conn, now)
+            max_requests, parked_until = self._state(conn, now)
+            if now < parked_until:
+                return parked_until - now
+            if in_window >= max_requests:
+                # MIN over the (key, ts) index is a single index lookup.
+                (oldest,) = conn.execute(
+                    "SELECT MIN(ts) FROM rate_requests WHERE key = ?", (self.key,)
+                ).fetchone()
+                return max(0.001, oldest + self.window_seconds - now)
+            conn.execute("INSERT INTO rate_requests (key, ts) VALUES (?, ?)", (self.key, now))
+            conn.execute("UPDATE rate_counts SET in_window = in_window + 1 WHERE key = ?", (self.key,))
+            return 0.0
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Acquire permission to make a request. Blocks if rate limit exceeded.
+
+        ``timeout`` and the return value are as for
+        :meth:`ThreadSafeRateLimiter.acquire`.
+        """
+        give_up_at = None if timeout is None else _time.monotonic() + timeout
+        while True:
+            wait_time = self._try_acquire()
+            if not wait_time:
+                return True
+            if give_up_at is not None and _time.monotonic() + wait_time > give_up_at:
+                return False
+            _time.sleep(wait_time)
+
+    def try_acquire(self) -> bool:
+        """Take a slot only if one is free right now; never blocks."""
+        return not self._try_acquire()
+
+    def observe(self, status_code: Any, headers: Any) -> None:
+        """Learn from a response's status code and rate limit headers."""
+        feedback = _rate_limit_feedback(status_code, headers, self.window_seconds, self.configured_max_requests)
+        if feedback is None:
+            return
+        throttled, park = feedback
+
+        with self._db.transaction() as conn:
+            now = _time.time()
+            max_requests, parked_until = self._state(conn, now)
+            conn.execute(
+                "INSERT OR IGNORE INTO rate_state (key, max_requests, parked_until, adjusted_at)"
+                " VALUES (?, ?, 0, ?)",
+                (self.key, max_requests, now),
+            )
+            if park:
+                conn.execute(
+                    "UPDATE rate_state SET parked_until = ? WHERE key = ?",
+                    (max(parked_until, now + park), self.key),
+                )
+            if throttled:
+                conn.execute(
+                    "UPDATE rate_state SET max_requests = ?, adjusted_at = ? WHERE key = ?",
+                    (max(1, max_requests // 2), now, self.key),
+                )
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """Treat the platform as rate limited, as if it had returned HTTP 429."""
+        headers = {} if retry_after is None else {"Retry-After": str(retry_after)}
+        self.observe(429, headers)
+
+    def get_stats(self) -> Dict:
+        """Get current rate limiter statistics (shared across processes)."""
+        with self._db.transaction() as conn:
+            now = _time.time()
+            in_window = self._in_window(conn, now)
+            max_requests, parked_until = self._state(conn, now)
+        return {
+            "requests_in_window": in_window,
+            "max_requests": max_requests,
+            "configured_max_requests": self.configured_max_requests,
+            "window_seconds": self.window_seconds,
+            "available": max(0, max_requests - in_window),
+            "parked_seconds": round(max(0.0, parked_until - now), 3),
+            "shared_path": self.path,
+        }
+
+
+class RateLimiterRegistry:
+    """Per-platform registry of rate limiters.
+
+    Each platform (or, for hosts outside the platform registry, each
+    hostname) gets its own limiter and budget, so threads hitting
+    different platforms never queue behind each other.
+
+    Example::
+
+        registry = RateLimiterRegistry(
+            hosts={"www.moltbook.com": "moltbook"},
+            budgets={"moltbook": {"max_requests": 30, "window_seconds": 60}},
+        )
+        registry.acquire("https://www.moltbook.com/api/v1/posts")
+    """
+
+    def __init__(
+        self,
+        hosts: Optional[Mapping[str, str]] = None,
+        budgets: Optional[Mapping[str, Mapping]] = None,
+        default_max_requests: int = DEFAULT_MAX_REQUESTS,
+        default_window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        shared_path: Optional[str] = None,
+    ):
+        """Initialize the registry.
+
+        Args:
+            hosts: Hostname to platform-name mapping. A leading ``www.`` is
+                ignored on both sides when matching.
+            budgets: Platform name (or hostname) to a dict with optional
+                ``max_requests`` and ``window_seconds`` keys.
+            default_max_requests: Budget for keys without an explicit entry.
+            default_window_seconds: Window for keys without an explicit entry.
+            shared_path: Optional SQLite file. When set, every limiter is a
+                :class:`SQLiteRateLimiter` so budgets are shared with other
+                processes using the same file.
+        """
+        self._hosts = {_strip_www(host): name for host, name in (hosts or {}).items()}
+        self._budgets = {key: dict(budget) for key, budget in (budgets or {}).items()}
+        self.default_max_requests = default_max_requests
+        self.default_window_seconds = default_window_seconds
+        self.shared_path = shared_path
+        self._lock = threading.Lock()
+        self._limiters: Dict[str, Any] = {}
+
+    def key_for(self, url: str) -> str:
+        """Return the limiter key (platform name or hostname) for a URL."""
+        try:
+            host = _strip_www(urlsplit(url).hostname or "")
+        except ValueError:
+            host = ""
+        return self._hosts.get(host, host)
+
+    def get(self, key: str):
+        """Return the limiter for a key, creating it on first use."""
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                budget = self._budgets.get(key, {})
+                max_requests = int(budget.get("max_requests", self.default_max_requests))
+                window_seconds = float(budget.get("window_seconds", self.default_window_seconds))
+                if self.shared_path:
+                    limiter = SQLiteRateLimiter(self.shared_path, key, max_requests, window_seconds)
+                else:
+                    limiter = ThreadSafeRateLimiter(max_requests=max_requests, window_seconds=window_seconds)
+                self._limiters[key] = limiter
+            return limiter
+
+    def for_url(self, url: str):
+        """Return the limiter responsible for a request URL."""
+        return self.get(self.key_for(url))
+
+    def acquire(self, url: str, timeout: Optional[float] = None) -> bool:
+        """Block until a request to ``url`` fits its platform's budget.
+
+        Returns False if that would take longer than ``timeout`` seconds.
+        """
+        return self.for_url(url).acquire(timeout)
+
+    def observe(self, url: str, response: Any) -> None:
+        """Feed a response for ``url`` back into its platform's limiter."""
+        self.for_url(url).observe(
+            getattr(response, "status_code", None),
+            getattr(response, "headers", None),
+        )
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Get statistics for every limiter created so far."""
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {key: limiter.get_stats() for key, limiter in limiters.items()}
+
+
+def _strip_www(host: str) -> str:
+    host = host.casefold()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _rate_limit_feedback(status_code: Any, headers: Any, window_seconds: float,
+                         configured_max_requests: int) -> Optional[tuple]:
+    """Interpret a response for adaptive limiting.
+
+    Returns:
+        None when the response carries no rate limit signal, otherwise
+        ``(throttled, park_seconds)`` where ``throttled`` means the budget
+        should shrink and ``park_seconds`` (possibly None) is how long to
+        hold further requests.
+    """
+    if not isinstance(headers, Mapping):
+        headers = {}
+    throttled = status_code == 429
+    retry_after = _header_seconds(headers.get("Retry-After"))
+    remaining = headers.get("X-RateLimit-Remaining")
+    if not throttled and retry_after is None and str(remaining).strip() != "0":
+        return None
+
+    park = retry_after
+    if park is None and not throttled:
+        park = _header_seconds(headers.get("X-RateLimit-Reset"))
+    if park is None and throttled:
+        # No hint from the server: sit out one request slot's worth of time.
+        park = window_seconds / max(1, configured_max_requests)
+    if park is not None:
+        park = min(park, MAX_PARK_SECONDS)
+    return throttled, park
+
+
+def _header_seconds(value: Any) -> Optional[float]:
+    """Parse a Retry-After / reset header into seconds from now.
+
+    Accepts delta-seconds, Unix epoch timestamps (as sent in
+    ``X-RateLimit-Reset`` by several APIs) and HTTP dates.
+    """
+    if not isinstance(value, (str, int, float)):
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        seconds = float(text)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(text).timestamp() - _time.time()
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return None
+    else:
+        if seconds > 1e9:  # Absolute epoch rather than a delta
+            seconds -= _time.time()
+    return max(0.0, seconds)
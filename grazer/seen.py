@@ -0,0 +1,154 @@
+"""
+Seen-item index for Grazer
+Remembers the canonical keys (``url:`` / ``content:`` / ``item:``) of
+discovered items across runs, so discover_all(only_new=True) hands an agent
+only items it has not seen within the TTL. SQLiteSeenIndex keeps the index
+on disk, shared by every process using the same file.
+"""
+
+import threading
+import time as _time
+from typing import Dict, List, Sequence
+
+from grazer._sqlite import SQLiteDatabase
+
+
+DEFAULT_SEEN_TTL = 7 * 24 * 3600.0
+DEFAULT_SEEN_PATH = "~/.grazer/seen.db"
+
+# Keys per "IN (...)" lookup, under SQLite's bound-parameter limit.
+_LOOKUP_BATCH = 500
+
+
+class SeenIndex:
+    """In-memory seen-key index with TTL expiry.
+
+    A key stays seen for ``ttl`` seconds after it was last observed, so an
+    item that keeps showing up is never reported as new again, while one
+    that disappears for longer than the TTL is new when it returns.
+
+    Example::
+
+        index = SeenIndex(ttl=24 * 3600)
+        client = GrazerClient(seen_index=index)
+        fresh = client.discover_all(only_new=True)
+    """
+
+    def __init__(self, ttl: float = DEFAULT_SEEN_TTL):
+        """Initialize the index.
+
+        Args:
+            ttl: Seconds a key stays seen after its last observation.
+        """
+        self.ttl = float(ttl)
+        self._lock = threading.Lock()
+        self._last_seen: Dict[str, float] = {}
+        self._counters = {"new": 0, "repeats": 0}
+
+    def observe(self, key_lists: Sequence[Sequence[str]]) -> List[bool]:
+        """Record a batch of items and report which ones are new.
+
+        An item is new unless one of its keys was observed within the TTL
+        before this call. Items in the same batch never make each other
+        old. Every key in the batch is then marked as seen now.
+
+        Args:
+            key_lists: The canonical keys of each item.
+
+        Returns:
+            One flag per item, True for new items.
+        """
+        now = _time.time()
+        with self._lock:
+            cutoff = now - self.ttl
+            last_seen = self._last_seen
+            flags = [
+                not any(last_seen.get(key, cutoff) > cutoff for key in keys) for keys in key_lists
+            ]
+            for keys in key_lists:
+                for key in keys:
+                    last_seen[key] = now
+            self._purge(cutoff)
+            self._tally(flags)
+        return flags
+
+    def _purge(self, cutoff: float) -> None:
+        """Drop keys last observed at or before ``cutoff``. Must hold the lock."""
+        expired = [key for key, seen_at in self._last_seen.items() if seen_at <= cutoff]
+        for key in expired:
+            del self._last_seen[key]
+
+    def _tally(self, flags: List[bool]) -> None:
+        new = sum(flags)
+        self._counters["new"] += new
+        self._counters["repeats"] += len(flags) - new
+
+    def clear(self) -> None:
+        with self._lock:
+            self._last_seen.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._last_seen)
+
+    def get_stats(self) -> Dict:
+        """Keys stored and new/repeat item counts seen by this instance."""
+        with self._lock:
+            counters = dict(self._counters)
+        counters["keys"] = len(self)
+        counters["ttl_seconds"] = self.ttl
+        return counters
+
+
+class SQLiteSeenIndex(SeenIndex):
+    """On-disk :class:`SeenIndex`; expiry uses the wall clock.
+
+    Each ``observe`` call is one transaction, so concurrent processes never
+    both report the same item as new.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS seen_keys (key TEXT PRIMARY KEY, last_seen REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS seen_keys_last_seen ON seen_keys (last_seen)",
+    )
+
+    def __init__(self, path: str = DEFAULT_SEEN_PATH, ttl: float = DEFAULT_SEEN_TTL):
+        """Initialize the index.
+
+        Args:
+            path: SQLite database file (default ``~/.grazer/seen.db``).
+            ttl: Seconds a key stays seen after its last observation.
+        """
+        super().__init__(ttl=ttl)
+        self._db = SQLiteDatabase(path, self._SCHEMA)
+        self.path = self._db.path
+
+    def observe(self, key_lists: Sequence[Sequence[str]]) -> List[bool]:
+        now = _time.time()
+        cutoff = now - self.ttl
+        unique = list(dict.fromkeys(key for keys in key_lists for key in keys))
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM seen_keys WHERE last_seen <= ?", (cutoff,))
+            known = set()
+            for start in range(0, len(unique), _LOOKUP_BATCH):
+                batch = unique[start:start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                known.update(
+                    row[0]
+                    for row in conn.execute(f"SELECT key FROM seen_keys WHERE key IN ({placeholders})", batch)
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO seen_keys (key, last_seen) VALUES (?, ?)",
+                ((key, now) for key in unique),
+            )
+        flags = [not any(key in known for key in keys) for keys in key_lists]
+        with self._lock:
+            self._tally(flags)
+        return flags
+
+    def clear(self) -> None:
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM seen_keys")
+
+    def __len__(self) -> int:
+        return self._db.connection().execute("SELECT COUNT(*) FROM seen_keys").fetchone()[0]
@@ -4,9 +4,10 @@ Discovers academic papers via the Semantic Scholar Academic Graph API.
 No API key required (rate limited to 100 requests per 5 minutes without key).
 """
 
-import requests
 from typing import List, Dict, Optional
 
+from grazer.transport import HttpTransport
+
 
 S2_API_BASE = "https://api.semanticscholar.org/graph/v1"
 
@@ -18,9 +19,9 @@ AUTHOR_FIELDS = "authorId,name,paperCount,citationCount,hIndex,url"
 class SemanticScholarGrazer:
     """Discover academic papers from Semantic Scholar."""
 
-    def __init__(self, api_key: Optional[str] = None, timeout: int = 15):
+    def __init__(self, api_key: Optional[str] = None, timeout: int = 15, transport: Optional[HttpTransport] = None):
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = (transport or HttpTransport()).session()
         headers = {
             "User-Agent": "Grazer/1.9.1 (Elyan Labs; https://github.com/Scottcjn/grazer-skill)",
         }
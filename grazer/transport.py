@@ -0,0 +1,547 @@
+"""
+Shared HTTP transport for Grazer
+One pooled connection layer used by GrazerClient and every plugin grazer,
+so TLS connections are reused and rate limits, deadlines and metrics apply
+uniformly to all outgoing requests.
+"""
+
+import copy
+import random
+import threading
+import time as _time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Callable, Deque, Dict, Iterable, Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from grazer.cache import ResponseCache, cache_key, restore_response, snapshot_response
+from grazer.ratelimit import RateLimiterRegistry
+
+
+# Number of per-host connection pools kept alive, and connections per host.
+# Discovery sweeps hit ~25 hosts with up to DEFAULT_DISCOVERY_WORKERS threads.
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 16
+
+# Feed URLs whose ETag/Last-Modified validators and parsed result are kept
+# for conditional GETs (least recently used entries are dropped first).
+DEFAULT_CONDITIONAL_ENTRIES = 256
+
+
+# Hedging: a backup request is sent once the first has been outstanding for
+# the platform's p95 latency over its last HEDGE_SAMPLES responses (hedging
+# starts after HEDGE_MIN_SAMPLES of them).
+HEDGE_PERCENTILE = 0.95
+HEDGE_SAMPLES = 100
+HEDGE_MIN_SAMPLES = 20
+
+# Methods safe to resend; anything else is retried only with an idempotency key.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+IDEMPOTENCY_HEADERS = ("Idempotency-Key", "X-Idempotency-Key")
+
+
+class RetryPolicy:
+    """Bounded retries with full-jitter exponential backoff.
+
+    Only transient failures are retried: connection errors, timeouts and
+    the ``retry_statuses`` (502/503/504 by default). 429s are left to the
+    adaptive rate limiter. Retries stop after ``max_attempts`` attempts,
+    when ``max_total_seconds`` have passed since the first attempt, or
+    when the next attempt would start after the caller's deadline.
+
+    Example::
+
+        transport = HttpTransport(retry=RetryPolicy(max_attempts=4, backoff_cap=2.0))
+        no_retries = RetryPolicy(max_attempts=1)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.25,
+        backoff_cap: float = 4.0,
+        max_total_seconds: float = 10.0,
+        retry_statuses=(502, 503, 504),
+    ):
+        """Initialize the policy.
+
+        Args:
+            max_attempts: Total attempts per request, including the first.
+            backoff_base: Backoff ceiling in seconds before the first retry,
+                doubled for each further retry.
+            backoff_cap: Upper bound of the backoff ceiling in seconds.
+            max_total_seconds: No retry starts later than this after the first attempt.
+            retry_statuses: HTTP statuses treated as transient.
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_total_seconds = max_total_seconds
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def backoff(self, retry_number: int) -> float:
+        """Seconds to wait before retry ``retry_number`` (1-based), fully jittered."""
+        ceiling = min(self.backoff_cap, self.backoff_base * (2 ** (retry_number - 1)))
+        return random.uniform(0, ceiling)
+
+    def retryable(self, method: str, headers: Mapping[str, str]) -> bool:
+        """Whether a request may be sent more than once."""
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        return any(headers.get(name) for name in IDEMPOTENCY_HEADERS)
+
+    def should_retry(self, outcome: Any) -> bool:
+        """Whether a response or exception is a transient failure."""
+        if isinstance(outcome, BaseException):
+            return isinstance(outcome, (requests.ConnectionError, requests.Timeout))
+        return getattr(outcome, "status_code", None) in self.retry_statuses
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised or reported when a platform misses its discovery deadline."""
+
+    def __init__(self, message: str = "deadline_exceeded"):
+        super().__init__(message)
+
+
+class TransportSession(requests.Session):
+    """A ``requests.Session`` whose requests go through an :class:`HttpTransport`.
+
+    Each grazer keeps its own session (and therefore its own default
+    headers), but all sessions share the transport's connection pool,
+    rate limiters, deadlines and metrics. Sessions created with
+    ``probe=True`` (health checks) skip the rate limit budget and the
+    response cache.
+    """
+
+    def __init__(self, transport: "HttpTransport", probe: bool = False):
+        super().__init__()
+        self.transport = transport
+        self.probe = probe
+        self.mount("https://", transport.adapter)
+        self.mount("http://", transport.adapter)
+
+    def request(self, method, url, **kwargs):
+        return self.transport.request(self, method, url, **kwargs)
+
+    def get_parsed(
+        self, url: str, parse: Callable[[requests.Response], Any], variant: Any = None, **kwargs
+    ) -> Any:
+        """GET ``url`` conditionally and return ``parse(response)``.
+
+        See :meth:`HttpTransport.conditional_get`.
+        """
+        return self.transport.conditional_get(self, url, parse, variant=variant, **kwargs)
+
+    def close(self) -> None:
+        """Leave the shared connection pool open for the other sessions."""
+
+
+class HttpTransport:
+    """Pooled, rate-limited HTTP transport shared by all Grazer clients.
+
+    Example::
+
+        transport = HttpTransport()
+        arxiv = ArxivGrazer(transport=transport)
+        podcasts = PodcastGrazer(transport=transport)
+        transport.get_stats()  # per-platform request counts and latency
+    """
+
+    def __init__(
+        self,
+        rate_limiters: Optional[RateLimiterRegistry] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        conditional_entries: int = DEFAULT_CONDITIONAL_ENTRIES,
+        cache: Optional[ResponseCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        hedge_platforms: Iterable[str] = (),
+    ):
+        """Initialize the transport.
+
+        Args:
+            rate_limiters: Registry used to throttle requests per platform
+                (default: a registry with 60 requests per 60 seconds per host).
+            pool_connections: Number of per-host connection pools to keep.
+            pool_maxsize: Maximum pooled connections per host.
+            conditional_entries: Maximum feeds remembered for conditional GETs.
+            cache: Response cache consulted for GET requests (default: none).
+            retry: Retry policy for transient failures (default: ``RetryPolicy()``;
+                pass ``RetryPolicy(max_attempts=1)`` to disable retries).
+            hedge_platforms: Platforms whose GETs are hedged: if a response
+                takes longer than the platform's p95 latency, a second request
+                is sent (when the rate limit budget has a free slot) and the
+                first response to arrive wins.
+        """
+        self.rate_limiters = rate_limiters or RateLimiterRegistry()
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.deadline = threading.local()  # Per-thread cutoff (monotonic), see clamp_timeout
+        self._metrics_lock = threading.Lock()
+        self._metrics: Dict[str, Dict] = {}
+        self._conditional_lock = threading.Lock()
+        self._conditional: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        self.conditional_entries = conditional_entries
+        self.cache = cache
+        self.retry = retry or RetryPolicy()
+        self.hedge_platforms = frozenset(hedge_platforms)
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_lock = threading.Lock()
+        self._pool_maxsize = pool_maxsize
+        self._refreshing = set()  # Cache keys with a background refresh in flight
+
+    def session(self, headers: Optional[Mapping[str, str]] = None, probe: bool = False) -> TransportSession:
+        """Create a session that routes through this transport.
+
+        Args:
+            headers: Default headers for the new session.
+            probe: Bypass rate limiting and caching (for health probes).
+        """
+        session = TransportSession(self, probe=probe)
+        if headers:
+            session.headers.update(headers)
+        return session
+
+    def clamp_timeout(self, kwargs: Dict) -> None:
+        """Shrink a request timeout to the calling thread's remaining deadline.
+
+        Raises:
+            DeadlineExceeded: if the thread's deadline has already passed.
+        """
+        cutoff = getattr(self.deadline, "at", None)
+        if cutoff is None:
+            return
+        remaining = cutoff - _time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded()
+        timeout = kwargs.get("timeout")
+        if isinstance(timeout, (int, float)):
+            kwargs["timeout"] = min(timeout, remaining)
+        elif timeout is None:
+            kwargs["timeout"] = remaining
+
+    def request(self, session: requests.Session, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request for ``session`` with caching, rate limiting, deadlines and metrics."""
+        platform = self.rate_limiters.key_for(url)
+        key = self._cache_key(session, method, url, kwargs)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                snapshot, stale = cached
+                if stale:
+                    self._refresh_in_background(session, method, url, platform, key, kwargs)
+                return restore_response(snapshot)
+
+        resp = self._send(session, method, url, platform, kwargs)
+        if key is not None:
+            self._store(key, platform, resp)
+        return resp
+
+    def _send(self, session: requests.Session, method: str, url: str, platform: str, kwargs: Dict) -> requests.Response:
+        """Send with retries for transient failures of idempotent requests."""
+        policy = self.retry
+        headers = CaseInsensitiveDict(session.headers)
+        headers.update(kwargs.get("headers") or {})
+        attempts = 1
+        if not getattr(session, "probe", False) and policy.retryable(method, headers):
+            attempts = policy.max_attempts
+
+        started = _time.monotonic()
+        give_up_at = started + policy.max_total_seconds
+        cutoff = getattr(self.deadline, "at", None)
+        if cutoff is not None:
+            give_up_at = min(give_up_at, cutoff)
+
+        for attempt in range(1, attempts + 1):
+            try:
+                outcome = self._attempt(session, method, url, platform, dict(kwargs))
+            except DeadlineExceeded:
+                raise
+            except Exception as exc:
+                outcome = exc
+            if attempt == attempts or not policy.should_retry(outcome):
+                break
+            delay = policy.backoff(attempt)
+            if _time.monotonic() + delay >= give_up_at:
+                break
+            if not isinstance(outcome, Exception):
+                # Release the discarded response's connection (held open by stream=True).
+                outcome.close()
+            self._count(platform, "retries")
+            _time.sleep(delay)
+
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def _attempt(self, session: requests.Session, method: str, url: str, platform: str, kwargs: Dict) -> requests.Response:
+        probe = getattr(session, "probe", False)
+        if not probe:
+            # A full or parked budget must not hold the thread past its deadline.
+            cutoff = getattr(self.deadline, "at", None)
+            timeout = None if cutoff is None else max(0.0, cutoff - _time.monotonic())
+            if not self.rate_limiters.get(platform).acquire(timeout=timeout):
+                raise DeadlineExceeded()
+        self.clamp_timeout(kwargs)
+        hedge_after = None if probe or method.upper() != "GET" else self.hedge_delay(platform)
+        if hedge_after is None:
+            return self._dispatch(session, method, url, platform, kwargs)
+        return self._hedged(session, method, url, platform, kwargs, hedge_after)
+
+    def _dispatch(self, session: requests.Session, method: str, url: str, platform: str, kwargs: Dict) -> requests.Response:
+        """Perform one HTTP exchange, recording metrics and rate limit feedback."""
+        started = _time.monotonic()
+        try:
+            resp = requests.Session.request(session, method, url, **kwargs)
+        except Exception:
+            self._record(platform, _time.monotonic() - started, error=True)
+            raise
+        elapsed = _time.monotonic() - started
+        self._record(platform, elapsed, status=getattr(resp, "status_code", None))
+        if platform in self.hedge_platforms:
+            with self._hedge_lock:
+                self._latencies.setdefault(platform, deque(maxlen=HEDGE_SAMPLES)).append(elapsed)
+        self.rate_limiters.get(platform).observe(
+            getattr(resp, "status_code", None),
+            getattr(resp, "headers", None),
+        )
+        return resp
+
+    def hedge_delay(self, platform: str) -> Optional[float]:
+        """Seconds after which a request to ``platform`` is hedged, or None."""
+        if platform not in self.hedge_platforms:
+            return None
+        with self._hedge_lock:
+            samples = sorted(self._latencies.get(platform, ()))
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        return samples[int(HEDGE_PERCENTILE * (len(samples) - 1))]
+
+    def _hedged(
+        self, session: requests.Session, method: str, url: str, platform: str, kwargs: Dict, hedge_after: float
+    ) -> requests.Response:
+        """Send a request, adding a backup if it outlives ``hedge_after``; first response wins."""
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self._pool_maxsize, thread_name_prefix="grazer-hedge"
+                )
+            executor = self._hedge_executor
+
+        primary = executor.submit(self._dispatch, session, method, url, platform, dict(kwargs))
+        try:
+            return primary.result(timeout=hedge_after)
+        except FutureTimeout:
+            pass
+        # The backup must fit in the platform's budget; never wait for a slot.
+        if not self.rate_limiters.get(platform).try_acquire():
+            return primary.result()
+        self._count(platform, "hedged")
+        backup = executor.submit(self._dispatch, session, method, url, platform, dict(kwargs))
+
+        pending = {primary, backup}
+        errors = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    errors.append(future.exception())
+                    continue
+                # requests cannot abort an exchange in flight, so the slower
+                # one is discarded (its connection released) when it lands.
+                for loser in pending:
+                    loser.add_done_callback(_discard_response)
+                if future is backup:
+                    self._count(platform, "hedge_wins")
+                return future.result()
+        raise errors[0]
+
+    def _cache_key(self, session: requests.Session, method: str, url: str, kwargs: Dict) -> Optional[str]:
+        """Cache key for a cacheable request, or None if it must hit the network."""
+        if self.cache is None or getattr(session, "probe", False):
+            return None
+        if method.upper() != "GET" or kwargs.get("stream"):
+            return None
+        headers = dict(session.headers)
+        headers.update(kwargs.get("headers") or {})
+        return cache_key(method, url, params=kwargs.get("params"), headers=headers)
+
+    def _store(self, key: str, platform: str, resp: requests.Response) -> None:
+        status = getattr(resp, "status_code", None)
+        if isinstance(status, int) and 200 <= status < 300:
+            self.cache.set(key, snapshot_response(resp), platform)
+
+    def _refresh_in_background(
+        self, session: requests.Session, method: str, url: str, platform: str, key: str, kwargs: Dict
+    ) -> None:
+        """Re-fetch a stale cache entry without blocking the caller."""
+        with self._metrics_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._store(key, platform, self._send(session, method, url, platform, dict(kwargs)))
+            except Exception:
+                pass  # Keep serving the stale entry until a refresh succeeds
+            finally:
+                with self._metrics_lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name=f"grazer-refresh-{platform}", daemon=True).start()
+
+    def conditional_get(
+        self,
+        session: requests.Session,
+        url: str,
+        parse: Callable[[requests.Response], Any],
+        variant: Any = None,
+        **kwargs,
+    ) -> Any:
+        """GET a feed-style URL with ETag / Last-Modified revalidation.
+
+        The first response's validators are stored together with
+        ``parse(response)``. Later calls for the same URL, params and
+        credentials send ``If-None-Match`` / ``If-Modified-Since``; on a
+        ``304 Not Modified`` the stored result is returned without
+        downloading or parsing the body again.
+
+        Args:
+            session: Session to send the request with.
+            url: Request URL.
+            parse: Turns a successful response into the value to return.
+            variant: Hashable value identifying how ``parse`` reads the body
+                (e.g. an entry limit), so differently parsed results of the
+                same URL are stored separately.
+            **kwargs: Passed to ``session.get`` (``params``, ``headers``,
+                ``timeout``, ...). With ``stream=True`` the response is
+                closed once ``parse`` returns or anything raises.
+
+        Returns:
+            The parsed result (a copy of the stored one on a 304).
+
+        Raises:
+            requests.HTTPError: for error responses, as ``raise_for_status``.
+        """
+        key = self._conditional_key(session, url, kwargs) + (variant,)
+        with self._conditional_lock:
+            entry = self._conditional.get(key)
+            if entry is not None:
+                self._conditional.move_to_end(key)
+
+        if entry is not None:
+            headers = dict(kwargs.get("headers") or {})
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+            kwargs["headers"] = headers
+
+        resp = session.get(url, **kwargs)
+        try:
+            if entry is not None and resp.status_code == 304:
+                return copy.deepcopy(entry["parsed"])
+            resp.raise_for_status()
+            parsed = parse(resp)
+        finally:
+            # A streamed body may be left unread; release its connection
+            # whether parsing finished, stopped early or failed.
+            if kwargs.get("stream"):
+                resp.close()
+
+        etag = _validator(resp, "ETag")
+        last_modified = _validator(resp, "Last-Modified")
+        with self._conditional_lock:
+            if etag or last_modified:
+                self._conditional[key] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "parsed": copy.deepcopy(parsed),
+                }
+                self._conditional.move_to_end(key)
+                while len(self._conditional) > self.conditional_entries:
+                    self._conditional.popitem(last=False)
+            else:
+                self._conditional.pop(key, None)
+        return parsed
+
+    @staticmethod
+    def _conditional_key(session: requests.Session, url: str, kwargs: Dict) -> Tuple:
+        params = kwargs.get("params") or {}
+        headers = kwargs.get("headers") or {}
+        auth = headers.get("Authorization") or session.headers.get("Authorization")
+        return (
+            url,
+            tuple(sorted((str(k), str(v)) for k, v in params.items())),
+            auth,
+        )
+
+    def _metrics_for(self, platform: str) -> Dict:
+        """Metrics dict for ``platform``. Must hold the metrics lock."""
+        return self._metrics.setdefault(
+            platform,
+            {
+                "requests": 0, "errors": 0, "throttled": 0, "not_modified": 0,
+                "retries": 0, "hedged": 0, "hedge_wins": 0, "total_ms": 0.0,
+            },
+        )
+
+    def _count(self, platform: str, counter: str) -> None:
+        with self._metrics_lock:
+            self._metrics_for(platform)[counter] += 1
+
+    def _record(self, platform: str, elapsed: float, status=None, error: bool = False) -> None:
+        with self._metrics_lock:
+            metrics = self._metrics_for(platform)
+            metrics["requests"] += 1
+            metrics["total_ms"] += elapsed * 1000
+            if error or (isinstance(status, int) and status >= 500):
+                metrics["errors"] += 1
+            if status == 429:
+                metrics["throttled"] += 1
+            if status == 304:
+                metrics["not_modified"] += 1
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-platform request metrics merged with rate limiter statistics.
+
+        Requests answered from the response cache are not counted here; see
+        ``cache.get_stats()``.
+        """
+        with self._metrics_lock:
+            metrics = {platform: dict(values) for platform, values in self._metrics.items()}
+        for values in metrics.values():
+            values["avg_ms"] = round(values.pop("total_ms") / values["requests"], 1)
+        for platform, limiter_stats in self.rate_limiters.get_stats().items():
+            metrics.setdefault(
+                platform,
+                {
+                    "requests": 0, "errors": 0, "throttled": 0, "not_modified": 0,
+                    "retries": 0, "hedged": 0, "hedge_wins": 0, "avg_ms": 0.0,
+                },
+            )
+            metrics[platform]["rate_limit"] = limiter_stats
+        return metrics
+
+
+def _validator(resp: requests.Response, name: str) -> Optional[str]:
+    """Return a response validator header, ignoring missing or odd values."""
+    headers = getattr(resp, "headers", None)
+    if not isinstance(headers, Mapping):
+        return None
+    value = headers.get(name)
+    return value if isinstance(value, str) and value else None
+
+
+def _discard_response(future) -> None:
+    """Close the response of a request that lost a hedge race."""
+    if future.exception() is None:
+        close = getattr(future.result(), "close", None)
+        if callable(close):
+            close()
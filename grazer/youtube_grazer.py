@@ -4,71 +4,68 @@ Discovers videos via the YouTube Data API v3 (when key is available)
 or via lightweight RSS feed parsing (no key required).
 """
 
+import html
 import re
-import requests
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from urllib.parse import quote
 
+from grazer.feeds import YOUTUBE_FIELD_PATTERN, iter_entry_fields
+from grazer.transport import HttpTransport
+
 
 YOUTUBE_API_BASE = "https://www.googleapis.com/youtube/v3"
 YOUTUBE_RSS_BASE = "https://www.youtube.com/feeds/videos.xml"
 
 
-def _parse_youtube_rss(xml_text: str) -> List[Dict]:
+def _youtube_entry_to_video(fields: Dict[str, str]) -> Dict:
+    """Convert the raw fields of one feed ``<entry>`` into a video dict."""
+    video: Dict = {}
+    if "id" in fields:
+        video["id"] = fields["id"].strip()
+        video["url"] = f"https://www.youtube.com/watch?v={video['id']}"
+    if "title" in fields:
+        video["title"] = html.unescape(" ".join(fields["title"].split()))
+    if "channel" in fields:
+        video["channel"] = html.unescape(fields["channel"].strip())
+    if "published" in fields:
+        video["published"] = fields["published"].strip()
+    if "description" in fields:
+        video["description"] = html.unescape(" ".join(fields["description"].split()))
+    if "thumbnail" in fields:
+        video["thumbnail"] = html.unescape(fields["thumbnail"])
+    if "views" in fields:
+        video["views"] = int(fields["views"])
+    return video
+
+
+def _parse_youtube_rss(xml_text: Union[str, bytes], limit: Optional[int] = None) -> List[Dict]:
     """Parse YouTube RSS/Atom feed into video dicts.
 
-    YouTube channel/playlist feeds are public Atom XML.  We parse them
-    with regex to avoid a feedparser dependency.
-    """
-    entries = []
-    raw_entries = re.findall(r"<entry>(.*?)</entry>", xml_text, re.DOTALL)
-    for raw in raw_entries:
-        video: Dict = {}
-
-        vid_match = re.search(r"<yt:videoId>(.*?)</yt:videoId>", raw)
-        if vid_match:
-            video["id"] = vid_match.group(1).strip()
-            video["url"] = f"https://www.youtube.com/watch?v={video['id']}"
-
-        title_match = re.search(r"<title>(.*?)</title>", raw, re.DOTALL)
-        if title_match:
-            video["title"] = " ".join(title_match.group(1).split())
-
-        author_match = re.search(r"<author>\s*<name>(.*?)</name>", raw)
-        if author_match:
-            video["channel"] = author_match.group(1).strip()
-
-        published_match = re.search(r"<published>(.*?)</published>", raw)
-        if published_match:
-            video["published"] = published_match.group(1).strip()
-
-        # Media group has description and thumbnail
-        desc_match = re.search(
-            r"<media:description>(.*?)</media:description>", raw, re.DOTALL
-        )
-        if desc_match:
-            video["description"] = " ".join(desc_match.group(1).split())
-
-        thumb_match = re.search(r'<media:thumbnail[^>]+url="([^"]+)"', raw)
-        if thumb_match:
-            video["thumbnail"] = thumb_match.group(1)
-
-        views_match = re.search(r'<media:statistics[^>]+views="(\d+)"', raw)
-        if views_match:
-            video["views"] = int(views_match.group(1))
+    YouTube channel/playlist feeds are public Atom XML with a fixed
+    layout. We scan them with grazer.feeds' precompiled regexes to avoid a
+    feedparser dependency, and decode character and entity references in
+    the text fields. Parsing stops after ``limit`` entries.
 
-        entries.append(video)
+    Args:
+        xml_text: Feed text or bytes
+        limit: Maximum number of videos to parse (None for all)
 
-    return entries
+    Returns:
+        List of video dicts
+    """
+    return [
+        _youtube_entry_to_video(fields)
+        for fields in iter_entry_fields(xml_text, YOUTUBE_FIELD_PATTERN, limit)
+    ]
 
 
 class YouTubeGrazer:
     """Discover YouTube videos via API or public RSS feeds."""
 
-    def __init__(self, api_key: Optional[str] = None, timeout: int = 15):
+    def __init__(self, api_key: Optional[str] = None, timeout: int = 15, transport: Optional[HttpTransport] = None):
         self.api_key = api_key
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = (transport or HttpTransport()).session()
         self.session.headers.update(
             {"User-Agent": "Grazer/1.9.1 (Elyan Labs; https://github.com/Scottcjn/grazer-skill)"}
         )
@@ -104,9 +101,12 @@ class YouTubeGrazer:
             limit: Maximum results
         """
         url = f"{YOUTUBE_RSS_BASE}?channel_id={channel_id}"
-        resp = self.session.get(url, timeout=self.timeout)
-        resp.raise_for_status()
-        videos = _parse_youtube_rss(resp.text)
+        videos = self.session.get_parsed(
+            url,
+            lambda resp: _parse_youtube_rss(resp.text, limit),
+            variant=limit,
+            timeout=self.timeout,
+        )
         return videos[:limit]
 
     def playlist_videos(self, playlist_id: str, limit: int = 10) -> List[Dict]:
@@ -119,9 +119,12 @@ class YouTubeGrazer:
             limit: Maximum results
         """
         url = f"{YOUTUBE_RSS_BASE}?playlist_id={playlist_id}"
-        resp = self.session.get(url, timeout=self.timeout)
-        resp.raise_for_status()
-        videos = _parse_youtube_rss(resp.text)
+        videos = self.session.get_parsed(
+            url,
+            lambda resp: _parse_youtube_rss(resp.text, limit),
+            variant=limit,
+            timeout=self.timeout,
+        )
         return videos[:limit]
 
     # ── Private helpers ──────────────────────────────────────
@@ -0,0 +1,62 @@
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from grazer import GrazerClient
+
+
+@pytest.fixture(autouse=True)
+def no_network(monkeypatch):
+    """Fail any test whose requests get past the mocks to a real socket."""
+    attempts = []
+
+    def send(adapter, request, **kwargs):
+        attempts.append(f"{request.method} {request.url}")
+        # Not a transport error, so it is never retried or backed off.
+        raise RuntimeError(f"network access in tests: {request.method} {request.url}")
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", send)
+    yield
+    assert not attempts, f"test tried to reach the network: {attempts}"
+
+
+# discover_all platforms whose client method is not named discover_<platform>.
+_DISCOVER_METHOD_OVERRIDES = {"thecolony": "discover_colony"}
+
+
+def _discover_methods(client: GrazerClient) -> dict:
+    """Map each platform swept by discover_all to its client method name, in sweep order."""
+    methods = {
+        name: _DISCOVER_METHOD_OVERRIDES.get(name, f"discover_{name}")
+        for name, _ in client._discovery_calls(1)
+    }
+    missing = sorted(method for method in methods.values() if not hasattr(GrazerClient, method))
+    assert not missing, f"discover_all sweeps unknown client methods: {missing}"
+    return methods
+
+
+@pytest.fixture
+def discover_methods():
+    """Client method names behind discover_all, in sweep order."""
+    return list(_discover_methods(GrazerClient()).values())
+
+
+@pytest.fixture
+def offline_client():
+    """Factory for clients whose discovery methods never touch the network.
+
+    Every method swept by discover_all is replaced with a Mock returning a
+    copy of ``items[platform]`` (default: no items); other keyword
+    arguments go to GrazerClient::
+
+        client = offline_client({"bottube": [{"title": "video"}]}, max_workers=3)
+    """
+
+    def make(items=None, **client_kwargs) -> GrazerClient:
+        client = GrazerClient(**client_kwargs)
+        for name, method in _discover_methods(client).items():
+            setattr(client, method, Mock(return_value=list((items or {}).get(name, []))))
+        return client
+
+    return make
@@ -0,0 +1,100 @@
+import time
+from unittest.mock import Mock, patch
+
+import requests
+
+from grazer import CircuitBreakerRegistry, CircuitOpen, GrazerClient
+from grazer.circuit import CircuitBreaker
+
+
+def test_breaker_opens_after_threshold_and_half_opens_for_one_trial():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_seconds=0.05)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.get_stats()["state"] == "closed"
+    assert breaker.get_stats()["consecutive_failures"] == 0
+
+
+def test_open_circuit_fails_instantly_in_discover_all(offline_client):
+    client = offline_client(circuit_breakers=CircuitBreakerRegistry(failure_threshold=2, recovery_seconds=60))
+    unavailable = requests.Response()
+    unavailable.status_code = 503
+    client.discover_clawsta = Mock(side_effect=requests.HTTPError("503", response=unavailable))
+
+    client.discover_all(limit=1)
+    client.discover_all(limit=1)
+    client.discover_clawsta.side_effect = lambda *a, **k: time.sleep(5)
+
+    started = time.monotonic()
+    results = client.discover_all(limit=1)
+
+    assert time.monotonic() - started < 1.0
+    assert client.discover_clawsta.call_count == 2
+    assert results["_errors"]["clawsta"] == "circuit_open"
+    assert client.circuit_breakers.get_stats()["clawsta"]["state"] == "open"
+
+
+def test_open_circuit_is_reported_in_health_without_probing(offline_client):
+    client = offline_client(circuit_breakers=CircuitBreakerRegistry(platforms={"clawsta": {"failure_threshold": 1}}))
+    client.circuit_breakers.record("clawsta", ok=False)
+    client.platform_status = Mock(return_value={})
+
+    results = client.discover_all(limit=1, include_health=True)
+
+    assert "clawsta" not in client.platform_status.call_args.args[0]
+    assert results["_health"]["clawsta"]["status"] == "unavailable"
+    assert results["_health"]["clawsta"]["error_type"] == "circuit_open"
+    assert results["_health"]["clawsta"]["circuit"] == "open"
+    assert results["_health"]["bottube"]["circuit"] == "closed"
+
+
+def test_failed_health_probes_feed_the_breaker():
+    client = GrazerClient(circuit_breakers=CircuitBreakerRegistry(failure_threshold=2))
+
+    with patch.object(requests.Session, "request", side_effect=requests.ConnectionError("refused")):
+        client.platform_status(["clawsta"])
+        client.platform_status(["clawsta"])
+
+    assert client.circuit_breakers.get("clawsta").state == "open"
+
+
+def test_iter_discover_all_yields_open_circuits_first(offline_client):
+    client = offline_client(circuit_breakers=CircuitBreakerRegistry(failure_threshold=1))
+    client.circuit_breakers.record("nostr", ok=False)
+
+    name, outcome, elapsed_ms = next(client.iter_discover_all(limit=1))
+
+    assert name == "nostr"
+    assert isinstance(outcome, CircuitOpen)
+    assert elapsed_ms == 0.0
+
+
+def test_only_transport_failures_trip_the_breaker(offline_client):
+    client = offline_client(circuit_breakers=CircuitBreakerRegistry(failure_threshold=1))
+    not_found = requests.Response()
+    not_found.status_code = 404
+    client.discover_clawsta = Mock(side_effect=requests.HTTPError("404", response=not_found))
+    client.discover_moltx = Mock(side_effect=ValueError("bad JSON"))
+    client.discover_nostr = Mock(side_effect=requests.ConnectionError("refused"))
+
+    results = client.discover_all(limit=1)
+
+    stats = client.circuit_breakers.get_stats()
+    assert set(results["_errors"]) == {"clawsta", "moltx", "nostr"}
+    assert stats["clawsta"]["state"] == "closed"
+    assert stats["moltx"]["state"] == "closed"
+    assert stats["nostr"]["state"] == "open"
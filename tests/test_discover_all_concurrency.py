@@ -0,0 +1,157 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from grazer import DeadlineExceeded, GrazerClient
+
+
+def _slow(result, delay):
+    def call(*args, **kwargs):
+        time.sleep(delay)
+        return result
+
+    return call
+
+
+def test_discover_all_runs_platforms_concurrently(offline_client):
+    client = offline_client()
+    client.discover_bottube = _slow([{"title": "video"}], 0.3)
+    client.discover_moltbook = _slow([{"title": "post"}], 0.3)
+    client.discover_arxiv = _slow([{"title": "paper"}], 0.3)
+    client.discover_mastodon = _slow([{"text": "toot"}], 0.3)
+
+    started = time.monotonic()
+    results = client.discover_all(limit=1)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.9
+    assert results["bottube"] == [{"title": "video"}]
+    assert results["moltbook"] == [{"title": "post"}]
+    assert results["arxiv"] == [{"title": "paper"}]
+    assert results["mastodon"] == [{"text": "toot"}]
+    assert results["_errors"] == {}
+
+
+def test_discover_all_isolates_platform_failures(offline_client):
+    client = offline_client()
+    client.discover_moltbook = Mock(side_effect=RuntimeError("moltbook exploded"))
+    client.discover_nostr = Mock(return_value=[{"content": "gm"}])
+
+    results = client.discover_all(limit=1)
+
+    assert results["_errors"] == {"moltbook": "moltbook exploded"}
+    assert results["moltbook"] == []
+    assert results["nostr"] == [{"content": "gm"}]
+
+
+def test_discover_all_preserves_platform_key_order(offline_client, discover_methods):
+    client = offline_client()
+    client.discover_bottube = _slow([], 0.1)
+
+    results = client.discover_all(limit=1)
+
+    keys = [key for key in results if not key.startswith("_")]
+    assert keys[0] == "bottube"
+    assert keys[-1] == "nostr"
+    assert len(keys) == len(discover_methods)
+
+
+def test_discover_all_respects_worker_count(offline_client, discover_methods):
+    client = offline_client(max_workers=3)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def tracked(*args, **kwargs):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.pop()
+        return []
+
+    for method in discover_methods:
+        setattr(client, method, tracked)
+
+    client.discover_all(limit=1)
+    assert max(peak) <= 3
+
+    peak.clear()
+    client.discover_all(limit=1, max_workers=1)
+    assert max(peak) == 1
+
+
+def test_discover_all_deadline_returns_finished_platforms(offline_client):
+    client = offline_client()
+    client.discover_youtube = _slow([{"title": "too late"}], 2.0)
+    client.discover_bottube = Mock(return_value=[{"title": "on time"}])
+
+    started = time.monotonic()
+    results = client.discover_all(limit=1, deadline=0.3)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+    assert results["bottube"] == [{"title": "on time"}]
+    assert results["youtube"] == []
+    assert results["_errors"] == {"youtube": "deadline_exceeded"}
+
+
+def test_discover_all_platform_deadline_reports_health(offline_client):
+    client = offline_client()
+    client.discover_mastodon = _slow([{"text": "slow"}], 1.0)
+    client.discover_nostr = _slow([{"content": "fine"}], 0.1)
+    client.platform_status = Mock(return_value={
+        "mastodon": {"ok": True, "status_code": 200, "error": None},
+        "nostr": {"ok": True, "status_code": 200, "error": None},
+    })
+
+    results = client.discover_all(
+        limit=1,
+        include_health=True,
+        platform_deadline={"mastodon": 0.2, "nostr": 0.5},
+    )
+
+    assert results["nostr"] == [{"content": "fine"}]
+    assert results["_errors"] == {"mastodon": "deadline_exceeded"}
+    assert results["_health"]["mastodon"]["status"] == "degraded"
+    assert results["_health"]["mastodon"]["error_type"] == "deadline_exceeded"
+    assert results["_health"]["nostr"]["status"] == "ok"
+
+
+def test_rate_limited_requests_are_clamped_to_worker_deadline():
+    client = GrazerClient()
+
+    client.transport.deadline.at = time.monotonic() + 2.0
+    try:
+        with patch.object(requests.Session, "request", return_value=Mock()) as send:
+            client._rate_limited_get("https://example.com", timeout=15)
+            client._arxiv.session.get("https://export.arxiv.org/api/query", timeout=15)
+        assert all(call.kwargs["timeout"] <= 2.0 for call in send.call_args_list)
+
+        client.transport.deadline.at = time.monotonic() - 1
+        with pytest.raises(DeadlineExceeded, match="deadline_exceeded"):
+            client._rate_limited_get("https://example.com", timeout=15)
+    finally:
+        client.transport.deadline.at = None
+
+
+def test_parked_platform_gives_up_at_the_sweep_deadline(offline_client):
+    client = offline_client()
+    del client.discover_moltbook  # Run the real call through the transport.
+    client._rate_limiters.get("moltbook").throttle(retry_after=30)
+
+    earlier = set(threading.enumerate())
+    started = time.monotonic()
+    with patch.object(requests.Session, "request") as send:
+        results = client.discover_all(limit=1, deadline=0.3)
+        time.sleep(0.1)
+        workers = [t for t in threading.enumerate() if t.name.startswith("grazer-discover") and t not in earlier]
+
+    assert time.monotonic() - started < 1.0
+    assert results["_errors"] == {"moltbook": "deadline_exceeded"}
+    assert not any(worker.is_alive() for worker in workers)
+    send.assert_not_called()
@@ -1,4 +1,6 @@
 import io
+import time
+import pytest
 from argparse import Namespace
 from contextlib import redirect_stdout
 from unittest.mock import Mock, patch
@@ -69,6 +71,27 @@ def test_deduplicate_discoveries_keeps_ambiguous_titles_separate():
     assert len(groups) == 2
 
 
+def test_deduplicate_discoveries_merges_bridged_groups_in_first_match_order():
+    first = {"title": "Launch notes", "author": "ada", "url": "https://a.example/1"}
+    second = {"title": "Other post", "author": "bob", "url": "https://b.example/2"}
+    bridge = {"title": "Launch notes", "author": "ada", "url": "https://b.example/2?utm_source=x"}
+    unrelated = {"title": "Unrelated", "author": "cy", "url": "https://c.example/3"}
+    results = {
+        "bottube": [first],
+        "moltbook": [unrelated, second],
+        "moltx": [bridge],
+    }
+
+    groups = GrazerClient.deduplicate_discoveries(results)
+
+    # The bridge matches the moltbook group by URL first, then the bottube
+    # group by content, so the moltbook group absorbs the bottube one.
+    assert [group["canonical"]["item"] for group in groups] == [unrelated, second]
+    merged = groups[1]
+    assert merged["observed_platforms"] == ["moltbook", "bottube", "moltx"]
+    assert [variant["item"] for variant in merged["variants"]] == [second, first, bridge]
+
+
 def test_deduplicate_discoveries_tolerates_invalid_url_ports():
     results = {
         "bottube": [
@@ -84,34 +107,8 @@ def test_deduplicate_discoveries_tolerates_invalid_url_ports():
     assert len(groups) == 1
 
 
-def test_discover_all_only_adds_canonical_output_when_requested():
-    client = GrazerClient()
-    methods = [
-        "discover_bottube",
-        "discover_moltbook",
-        "discover_clawcities",
-        "discover_clawsta",
-        "discover_fourclaw",
-        "discover_pinchedin",
-        "discover_clawtasks",
-        "discover_clawnews",
-        "discover_directory",
-        "discover_agentchan",
-        "discover_colony",
-        "discover_moltx",
-        "discover_moltexchange",
-        "discover_arxiv",
-        "discover_youtube",
-        "discover_podcasts",
-        "discover_bluesky",
-        "discover_farcaster",
-        "discover_semantic_scholar",
-        "discover_openreview",
-        "discover_mastodon",
-        "discover_nostr",
-    ]
-    for method in methods:
-        setattr(client, method, Mock(return_value=[]))
+def test_discover_all_only_adds_canonical_output_when_requested(offline_client):
+    client = offline_client()
     client.discover_bottube = Mock(
         return_value=[{"title": "Shared", "author": "alice"}]
     )
@@ -127,24 +124,37 @@ def test_discover_all_only_adds_canonical_output_when_requested():
     assert len(deduplicated["_canonical"][0]["variants"]) == 2
 
 
+def test_iter_discover_all_yields_results_as_platforms_finish(offline_client, discover_methods):
+    client = offline_client()
+
+    def slow_bottube(limit):
+        time.sleep(0.3)
+        return [{"title": "late"}]
+
+    client.discover_bottube = slow_bottube
+    client.discover_moltbook = Mock(side_effect=RuntimeError("boom"))
+
+    started = time.monotonic()
+    stream = client.iter_discover_all(limit=1)
+    first_platform, first_outcome, first_elapsed_ms = next(stream)
+    first_latency = time.monotonic() - started
+    outcomes = {first_platform: (first_outcome, first_elapsed_ms)}
+    outcomes.update((platform, (outcome, elapsed_ms)) for platform, outcome, elapsed_ms in stream)
+
+    assert first_platform != "bottube"
+    assert first_latency < 0.3
+    assert outcomes["bottube"][0] == [{"title": "late"}]
+    assert outcomes["bottube"][1] >= 300
+    assert isinstance(outcomes["moltbook"][0], RuntimeError)
+    assert len(outcomes) == len(discover_methods)
+
+
 def test_cli_reports_collapsed_observations():
     mock_client = Mock()
-    mock_client.discover_all.return_value = {
-        "bottube": [{"title": "Shared"}],
-        "moltbook": [{"title": "Shared"}],
-        "_errors": {},
-        "_canonical": [
-            {
-                "canonical_key": "content:key",
-                "canonical": {"platform": "bottube", "item": {"title": "Shared"}},
-                "observed_platforms": ["bottube", "moltbook"],
-                "variants": [
-                    {"platform": "bottube", "item": {"title": "Shared"}},
-                    {"platform": "moltbook", "item": {"title": "Shared"}},
-                ],
-            }
-        ],
-    }
+    mock_client.iter_discover_all.return_value = iter([
+        ("bottube", [{"title": "Shared", "author": "alice"}], 10.0),
+        ("moltbook", [{"title": "Shared", "author": "alice"}], 20.0),
+    ])
     args = Namespace(
         platform="all",
         category=None,
@@ -161,9 +171,50 @@ def test_cli_reports_collapsed_observations():
             with redirect_stdout(output):
                 cli.cmd_discover(args)
 
-    mock_client.discover_all.assert_called_once_with(
-        limit=5,
-        include_health=False,
-        deduplicate=True,
-    )
+    mock_client.iter_discover_all.assert_called_once_with(limit=5)
     assert "Canonical items: 1 (1 duplicate observations collapsed)" in output.getvalue()
+
+
+def test_deduplicate_discoveries_supports_cheaper_digest():
+    results = {
+        "bottube": [{"title": "Shared", "url": "https://example.com/v/1?utm_source=a"}],
+        "moltbook": [{"title": "Shared", "url": "https://www.example.com/v/1/"}],
+    }
+
+    default = GrazerClient.deduplicate_discoveries(results)
+    blake = GrazerClient.deduplicate_discoveries(results, digest="blake2b")
+
+    assert len(default) == len(blake) == 1
+    assert len(blake[0]["variants"]) == 2
+    assert blake[0]["canonical_key"].startswith("url:")
+    assert blake[0]["canonical_key"] != default[0]["canonical_key"]
+    with pytest.raises(ValueError):
+        GrazerClient.deduplicate_discoveries(results, digest="md5")
+
+
+def test_deduplicate_discoveries_groups_edited_reposts_in_near_duplicate_mode():
+    post = "RustChain v2 ships indexed UTXO pagination so agents can sync wallets without rescanning old blocks"
+    results = {
+        "moltbook": [{"title": post, "author": "alice", "url": "https://moltbook.example/p/1"}],
+        "moltx": [
+            {"content": post.replace("v2 ships", "v2 now ships") + " 🚀", "author": "bob"},
+            {"content": "Weekly governance vote opens tonight for the testnet relay proposal", "author": "cy"},
+        ],
+        "fourclaw": [
+            {"content": post.upper() + " #rustchain", "author": {"username": "anon"}},
+            {"title": "Daily update", "author": "dee"},
+            {"title": "Daily update", "author": "eve"},
+        ],
+    }
+
+    exact = GrazerClient.deduplicate_discoveries(results)
+    near = GrazerClient.deduplicate_discoveries(results, near_duplicates=True)
+
+    assert len(exact) == 6
+    assert len(near) == 4
+    assert near[0]["canonical"]["platform"] == "moltbook"
+    assert near[0]["observed_platforms"] == ["moltbook", "moltx", "fourclaw"]
+    assert len(near[0]["variants"]) == 3
+    assert len(GrazerClient.deduplicate_discoveries(results, near_duplicates=True, similarity=1.0)) == 6
+    with pytest.raises(ValueError):
+        GrazerClient.deduplicate_discoveries(results, near_duplicates=True, similarity=0)
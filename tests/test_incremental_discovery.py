@@ -0,0 +1,94 @@
+from unittest.mock import Mock, patch
+
+from grazer import CursorStore, ResponseCache, SQLiteCursorStore
+from grazer.arxiv_grazer import ArxivGrazer
+from grazer.bluesky_grazer import BlueskyGrazer
+from grazer.farcaster_grazer import FarcasterGrazer
+from grazer.mastodon_grazer import MastodonGrazer
+
+
+def _json_response(payload):
+    resp = Mock()
+    resp.json.return_value = payload
+    resp.raise_for_status = Mock()
+    return resp
+
+
+def test_plugins_send_server_side_since_filters():
+    mastodon = MastodonGrazer(timeout=5)
+    statuses = {"statuses": [{"id": "120", "content": "new"}, {"id": "100", "content": "boundary"}]}
+    with patch.object(mastodon.session, "get", return_value=_json_response(statuses)) as get:
+        posts = mastodon.discover(query="ai", since_id="100")
+    assert get.call_args.kwargs["params"]["min_id"] == "100"
+    assert [post["id"] for post in posts] == ["120"]
+
+    bluesky = BlueskyGrazer(timeout=5)
+    with patch.object(bluesky.session, "get", return_value=_json_response({"posts": []})) as get:
+        bluesky.discover(since="2026-03-20T09:00:00+00:00")
+    assert get.call_args.kwargs["params"]["since"] == "2026-03-20T09:00:00+00:00"
+
+    farcaster = FarcasterGrazer()
+    with patch.object(farcaster.session, "get", return_value=_json_response({"result": {"casts": []}})) as get:
+        farcaster.discover(query="AI agents", since="2026-03-20T09:00:00Z")
+    assert get.call_args.kwargs["params"]["q"] == "AI agents after:2026-03-19"
+
+    arxiv = ArxivGrazer()
+    papers = [{"id": "2603.1", "published": "2026-03-20T10:00:00Z"}, {"id": "2603.0", "published": "2026-03-19T23:00:00Z"}]
+    with patch.object(arxiv.session, "get_parsed", return_value=papers) as get_parsed:
+        recent = arxiv.discover(category="ai", since="2026-03-20T09:00:00Z")
+    assert get_parsed.call_args.kwargs["params"]["search_query"].endswith(
+        "+AND+submittedDate:[202603200900+TO+999912312359]"
+    )
+    assert [paper["id"] for paper in recent] == ["2603.1"]
+
+
+def test_sqlite_cursor_store_persists_cursors(tmp_path):
+    path = str(tmp_path / "state" / "cursors.db")
+    SQLiteCursorStore(path).update({"mastodon": {"id": "100"}, "bluesky": {"timestamp": "2026-03-20T09:00:00+00:00"}})
+    store = SQLiteCursorStore(path)
+    store.update({"mastodon": {"id": "120"}})
+
+    assert store.get_all() == {
+        "mastodon": {"id": "120"},
+        "bluesky": {"timestamp": "2026-03-20T09:00:00+00:00"},
+    }
+    store.clear()
+    assert SQLiteCursorStore(path).get_all() == {}
+
+
+def test_discover_all_incremental_returns_only_the_delta(offline_client):
+    old = {"title": "Old video", "created_at": "2026-03-20T09:00:00Z", "url": "https://bottube.ai/watch/1"}
+    boundary = {"title": "Same second", "created_at": "2026-03-20T09:00:00Z", "url": "https://bottube.ai/watch/2"}
+    toot = {"id": "100", "text": "toot", "created_at": "2026-03-20T08:00:00Z"}
+    client = offline_client({"bottube": [old], "mastodon": [toot]}, cursor_store=CursorStore())
+    client.discover_bluesky.side_effect = RuntimeError("down")
+
+    first = client.discover_all(limit=5, incremental=True)
+    client.discover_bottube.return_value = [boundary, old, {"title": "Undated"}]
+    client.discover_mastodon.return_value = [{"id": "130", "text": "new toot"}, toot]
+    client.discover_bluesky.side_effect = None
+    second = client.discover_all(limit=5, incremental=True)
+
+    assert first["bottube"] == [old]
+    assert "bluesky" not in first["_cursors"]
+    assert [item["title"] for item in second["bottube"]] == ["Same second", "Undated"]
+    assert [item["id"] for item in second["mastodon"]] == ["130"]
+    assert client.discover_mastodon.call_args.kwargs == {"limit": 5, "since_id": "100"}
+    assert client.discover_bluesky.call_args.kwargs == {"limit": 5}
+    assert second["_cursors"]["mastodon"]["id"] == "130"
+    assert second["_cursors"]["bottube"]["timestamp"] == "2026-03-20T09:00:00+00:00"
+    assert len(second["_cursors"]["bottube"]["keys"]) == 2
+    assert "_cursors" not in client.discover_all(limit=5)
+
+
+def test_incremental_items_cache_is_keyed_by_cursor(offline_client):
+    toot = {"id": "100", "text": "toot", "created_at": "2026-03-20T08:00:00Z"}
+    client = offline_client({"mastodon": [toot]}, cursor_store=CursorStore(), cache=ResponseCache(ttl=60))
+
+    client.discover_all(limit=5, incremental=True)
+    client.discover_mastodon.return_value = [{"id": "130", "text": "new toot"}, toot]
+    second = client.discover_all(limit=5, incremental=True)
+
+    assert client.discover_mastodon.call_count == 2
+    assert [item["id"] for item in second["mastodon"]] == ["130"]
+    assert client.discover_arxiv.call_count == 1
@@ -0,0 +1,78 @@
+import time
+from unittest.mock import patch
+
+import requests
+
+from grazer import GrazerClient, ResponseCache
+
+
+def _ok(*args, **kwargs):
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = b"{}"
+    return resp
+
+
+def _slow_ok(*args, **kwargs):
+    time.sleep(0.2)
+    return _ok()
+
+
+def test_platform_status_probes_concurrently():
+    client = GrazerClient()
+    names = ["bottube", "moltbook", "clawcities", "fourclaw", "agentchan", "mastodon"]
+
+    with patch.object(requests.Session, "request", side_effect=_slow_ok):
+        started = time.monotonic()
+        results = client.platform_status(names)
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 0.6
+    assert list(results) == names
+    assert all(results[name]["ok"] for name in names)
+
+
+def test_probes_use_short_timeout_and_skip_discovery_budget_and_cache():
+    client = GrazerClient(timeout=15, cache=ResponseCache())
+
+    with patch.object(requests.Session, "request", side_effect=_ok) as send:
+        client.platform_status(["moltbook"])
+        client.platform_status(["moltbook"])
+
+    assert send.call_count == 2
+    assert send.call_args.kwargs["timeout"] == 5.0
+    assert client._rate_limiters.get("moltbook").get_stats()["requests_in_window"] == 0
+    assert len(client.cache) == 0
+
+
+def test_discover_all_reuses_recent_health_snapshot(offline_client):
+    client = offline_client()
+
+    with patch.object(requests.Session, "request", side_effect=_ok):
+        client.platform_status(["bottube", "moltbook"])
+        checked_at = client.discovery_health(["bottube"])["bottube"]["last_checked_at"]
+        with patch.object(client, "platform_status", wraps=client.platform_status) as probe:
+            results = client.discover_all(limit=5, include_health=True)
+
+    probed = probe.call_args.args[0]
+    assert "bottube" not in probed and "moltbook" not in probed
+    assert "clawcities" in probed
+    health = results["_health"]
+    assert health["bottube"]["cached"] is True
+    assert health["bottube"]["fresh"] is False
+    assert health["bottube"]["last_checked_at"] == checked_at
+    assert health["clawcities"]["cached"] is False
+
+
+def test_discovery_health_probes_again_after_ttl():
+    client = GrazerClient(health_ttl=0.05)
+
+    with patch.object(requests.Session, "request", side_effect=_ok) as send:
+        client.discovery_health(["bottube"])
+        client.discovery_health(["bottube"])
+        time.sleep(0.06)
+        entry = client.discovery_health(["bottube"])["bottube"]
+        client.discovery_health(["bottube"], max_age=0)
+
+    assert send.call_count == 3
+    assert entry["fresh"] is True
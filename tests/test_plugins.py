@@ -4,7 +4,9 @@ Tests for the ArXiv, YouTube, and Podcast discovery plugins.
 """
 
 import io
+import time
 import pytest
+import requests
 from argparse import Namespace
 from contextlib import redirect_stdout
 from unittest.mock import Mock, patch, MagicMock
@@ -67,6 +69,40 @@ def test_parse_arxiv_entries_empty():
     assert papers == []
 
 
+def test_parse_arxiv_entries_stops_at_limit():
+    """Parsing stops once ``limit`` entries are read, even if the rest is malformed."""
+    truncated = SAMPLE_ARXIV_XML.split("<entry>\n  <id>http://arxiv.org/abs/2401.88888v1")[0] + "<entry><id>broken"
+    papers = _parse_atom_entries(truncated.encode(), limit=1)
+    assert papers == _parse_atom_entries(SAMPLE_ARXIV_XML)[:1]
+    # Without a limit, a truncated feed keeps the entries before the break.
+    assert [p["arxiv_id"] for p in _parse_atom_entries(truncated)] == ["2401.99999v1"]
+
+
+def test_parse_arxiv_entries_keeps_entries_before_malformed_content():
+    """Content that breaks the XML partway through keeps the entries before it."""
+    for broken in ("Scaling Laws for a < b", "Scaling&nbsp;Laws"):
+        feed = SAMPLE_ARXIV_XML.replace("Scaling Laws for Neural Language Models", broken)
+        assert [p["arxiv_id"] for p in _parse_atom_entries(feed)] == ["2401.99999v1"]
+        assert [p["arxiv_id"] for p in _parse_atom_entries(feed.encode(), limit=5)] == ["2401.99999v1"]
+
+
+def test_parse_arxiv_entries_matches_full_output():
+    """Streaming output has exactly the fields the plugin always returned."""
+    p1 = _parse_atom_entries(SAMPLE_ARXIV_XML)[1]
+    assert p1 == {
+        "id": "http://arxiv.org/abs/2401.88888v1",
+        "arxiv_id": "2401.88888v1",
+        "title": "Scaling Laws for Neural Language Models",
+        "summary": "We study how performance scales with model size.",
+        "published": "2024-01-10T00:00:00Z",
+        "updated": "2024-01-10T00:00:00Z",
+        "authors": ["Carol Lee"],
+        "pdf_url": "https://arxiv.org/pdf/2401.88888v1",
+        "url": "https://arxiv.org/abs/2401.88888v1",
+        "categories": ["cs.LG"],
+    }
+
+
 def test_arxiv_available_categories():
     """ArxivGrazer exposes known categories."""
     cats = ArxivGrazer.available_categories()
@@ -105,6 +141,53 @@ def test_arxiv_get_paper():
     assert "Attention" in paper["title"]
 
 
+def _arxiv_page(start, count, day):
+    """Atom page with ``count`` entries, one day older each, starting at ``day``."""
+    entries = "".join(
+        f"<entry><id>http://arxiv.org/abs/2401.{start + i:05d}v1</id><title>Paper {start + i}</title>"
+        f"<published>2024-01-{day - i:02d}T00:00:00Z</published></entry>"
+        for i in range(count)
+    )
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = f'<feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'.encode()
+    return resp
+
+
+def test_arxiv_iter_papers_pages_politely_until_cursor():
+    """iter_papers pages with start/max_results, sleeps between pages and stops at ``since``."""
+    grazer = ArxivGrazer(timeout=5)
+    pages = [_arxiv_page(0, 2, 28), _arxiv_page(2, 2, 26), _arxiv_page(4, 2, 24)]
+
+    with patch.object(grazer.session, "get", side_effect=pages) as mock_get, \
+            patch("grazer.arxiv_grazer.time.sleep") as sleep:
+        papers = grazer.iter_papers(category="ml", since="2024-01-25", page_size=2)
+        assert next(papers)["arxiv_id"] == "2401.00000v1"
+        assert mock_get.call_count == 1
+        rest = list(papers)
+
+    assert [p["arxiv_id"] for p in rest] == ["2401.00001v1", "2401.00002v1", "2401.00003v1"]
+    assert [c.kwargs["params"]["start"] for c in mock_get.call_args_list] == [0, 2, 4]
+    assert mock_get.call_args.kwargs["params"]["search_query"] == "cat:cs.LG"
+    assert mock_get.call_args.kwargs["stream"] is True
+    assert sleep.call_count == 2
+
+
+def test_arxiv_iter_papers_stops_at_max_results_and_short_page():
+    grazer = ArxivGrazer(timeout=5)
+
+    with patch.object(grazer.session, "get", side_effect=[_arxiv_page(0, 3, 28), _arxiv_page(3, 2, 25)]) as mock_get:
+        assert len(list(grazer.iter_papers(max_results=5, page_size=3, delay=0))) == 5
+    assert mock_get.call_args.kwargs["params"]["max_results"] == 2
+
+    with patch.object(grazer.session, "get", side_effect=[_arxiv_page(0, 1, 28)]) as mock_get:
+        assert len(list(grazer.iter_papers(page_size=3, delay=0))) == 1
+    assert mock_get.call_count == 1
+
+    with pytest.raises(ValueError):
+        next(grazer.iter_papers(sort_by="relevance"))
+
+
 # ─── YouTube Tests ──────────────────────────────────────────
 
 
@@ -146,6 +229,55 @@ def test_parse_youtube_rss():
     assert "hqdefault" in v0["thumbnail"]
 
 
+def test_parse_youtube_rss_reads_real_feed_layout():
+    """Atom-namespaced feeds with a nested media:group parse the same fields; limit stops early."""
+    feed = """<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015"
+      xmlns:media="http://search.yahoo.com/mrss/" xmlns="http://www.w3.org/2005/Atom">
+  <title>Channel</title>
+  <entry>
+    <yt:videoId>abc123XYZab</yt:videoId>
+    <title>Agents &amp; Tools</title>
+    <author><name> Tech Channel </name></author>
+    <published>2024-03-01T12:00:00+00:00</published>
+    <media:group>
+      <media:title>Media title</media:title>
+      <media:thumbnail url="https://i.ytimg.com/vi/abc123XYZab/hqdefault.jpg"/>
+      <media:description>How to
+        build agents.</media:description>
+      <media:community><media:statistics views="42000"/></media:community>
+    </media:group>
+  </entry>
+  <entry><yt:videoId>second00000</yt:videoId></entry>
+</feed>"""
+    videos = _parse_youtube_rss(feed, limit=1)
+    assert videos == [{
+        "id": "abc123XYZab",
+        "url": "https://www.youtube.com/watch?v=abc123XYZab",
+        "title": "Agents & Tools",
+        "channel": "Tech Channel",
+        "published": "2024-03-01T12:00:00+00:00",
+        "description": "How to build agents.",
+        "thumbnail": "https://i.ytimg.com/vi/abc123XYZab/hqdefault.jpg",
+        "views": 42000,
+    }]
+    assert len(_parse_youtube_rss(feed)) == 2
+
+
+def test_parse_youtube_rss_decodes_escaped_text():
+    """Character and entity references come back decoded, as an XML parser reads them."""
+    feed = SAMPLE_YOUTUBE_RSS.replace(
+        "<title>AI Agent Tutorial</title>", "<title>Q&amp;A: Agents &lt;3 Tools &#8211; Part 2</title>"
+    ).replace(
+        "How to build agents.", "Don&#39;t miss &quot;tool use&quot; &amp; retrieval."
+    ).replace(
+        "<name>Tech Channel</name>", "<name>Caf&#233; &amp; Code</name>"
+    )
+    video = _parse_youtube_rss(feed)[1]
+    assert video["title"] == "Q&A: Agents <3 Tools – Part 2"
+    assert video["description"] == "Don't miss \"tool use\" & retrieval."
+    assert video["channel"] == "Café & Code"
+
+
 def test_youtube_channel_videos():
     """YouTubeGrazer.channel_videos fetches from RSS feed."""
     grazer = YouTubeGrazer(timeout=5)
@@ -283,6 +415,93 @@ def test_podcast_episodes():
     assert "Episode 42" in eps[0]["title"]
 
 
+def test_podcast_episodes_streams_only_the_head_of_the_feed():
+    """episodes() streams the feed, stops reading after ``limit`` items and closes the response."""
+    grazer = PodcastGrazer(timeout=5)
+    body = SAMPLE_PODCAST_RSS.replace("</channel>", "<item><title>Tail" + " " * 200_000 + "</title></item></channel>")
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.raw = io.BytesIO(body.encode())
+    read = []
+    resp.raw.read = lambda *args, _read=resp.raw.read: read.append(_read(*args)) or read[-1]
+
+    with patch.object(grazer.session, "get", return_value=resp) as mock_get:
+        eps = grazer.episodes("https://feed.example.com/rss", limit=1)
+
+    assert [ep["episode_number"] for ep in eps] == ["42"]
+    assert mock_get.call_args.kwargs["stream"] is True
+    assert sum(len(chunk) for chunk in read) < 100_000
+    assert resp.raw.closed
+
+
+def test_podcast_episodes_closes_the_stream_on_errors():
+    """episodes() closes the streamed response when the status or the feed is bad."""
+    grazer = PodcastGrazer(timeout=5)
+    for status, error in ((503, requests.HTTPError), (200, ValueError)):
+        resp = requests.Response()
+        resp.status_code = status
+        resp.raw = io.BytesIO(SAMPLE_PODCAST_RSS.encode())
+
+        with patch.object(grazer.session, "get", return_value=resp):
+            with patch("grazer.podcast_grazer._parse_podcast_rss", side_effect=ValueError("bad feed")):
+                with pytest.raises(error):
+                    grazer.episodes("https://feed.example.com/rss", limit=1)
+
+        assert resp.raw.closed
+
+
+def test_podcast_keeps_episodes_before_an_html_entity():
+    """An HTML-only entity in a description keeps the episodes before it, parsed or streamed."""
+    feed = SAMPLE_PODCAST_RSS.replace("Running language models", "Running&nbsp;language models")
+    assert [ep["episode_number"] for ep in _parse_podcast_rss(feed)] == ["42"]
+
+    grazer = PodcastGrazer(timeout=5)
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.raw = io.BytesIO(feed.encode())
+    with patch.object(grazer.session, "get", return_value=resp):
+        eps = grazer.episodes("https://feed.example.com/rss", limit=5)
+
+    assert [ep["episode_number"] for ep in eps] == ["42"]
+    assert resp.raw.closed
+
+
+def test_parse_podcast_rss_stops_at_limit_and_max_bytes():
+    assert _parse_podcast_rss(SAMPLE_PODCAST_RSS, limit=1) == _parse_podcast_rss(SAMPLE_PODCAST_RSS)[:1]
+    cutoff = SAMPLE_PODCAST_RSS.index("</item>") + len("</item>")
+    assert len(_parse_podcast_rss(SAMPLE_PODCAST_RSS, max_bytes=cutoff + 10)) == 1
+
+
+def test_podcast_discover_fetches_feeds_concurrently():
+    """Feeds are fetched in parallel under a per-feed deadline; failures leave episodes=[]."""
+    grazer = PodcastGrazer(timeout=5)
+    shows = [{"feedUrl": f"https://feed.example.com/{n}"} for n in range(4)] + [{"collectionName": "No feed"}]
+    search_resp = Mock()
+    search_resp.json.return_value = {"results": shows}
+    deadlines = []
+
+    def fake_get(url, **kwargs):
+        if "itunes" in url:
+            return search_resp
+        deadlines.append(grazer.session.transport.deadline.at)
+        time.sleep(0.2)
+        if url.endswith("/3"):
+            raise requests.ConnectionError("feed down")
+        resp = Mock()
+        resp.text = SAMPLE_PODCAST_RSS
+        return resp
+
+    with patch.object(grazer.session, "get", side_effect=fake_get):
+        started = time.monotonic()
+        results = grazer.discover("AI", limit=5, episodes_per_show=1, feed_timeout=2)
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 0.6
+    assert [len(show["episodes"]) for show in results] == [1, 1, 1, 0, 0]
+    assert all(cutoff is not None and cutoff <= time.monotonic() + 2 for cutoff in deadlines)
+    assert getattr(grazer.session.transport.deadline, "at", None) is None
+
+
 # ─── GrazerClient Integration ──────────────────────────────
 
 
@@ -297,23 +516,14 @@ def test_grazer_client_has_new_methods():
     assert hasattr(client, "podcast_episodes")
 
 
-def test_discover_all_includes_new_platforms():
+def test_discover_all_includes_new_platforms(offline_client):
     """discover_all result dict includes arxiv, youtube, and podcasts keys."""
-    client = GrazerClient()
-    # Mock all the network calls to avoid real HTTP
-    with patch.object(client, "discover_bottube", return_value=[]):
-        with patch.object(client, "discover_moltbook", return_value=[]):
-            with patch.object(client, "discover_clawcities", return_value=[]):
-                with patch.object(client, "discover_clawsta", return_value=[]):
-                    with patch.object(client, "discover_arxiv", return_value=[{"title": "paper"}]):
-                        with patch.object(client, "discover_youtube", return_value=[{"title": "vid"}]):
-                            with patch.object(client, "discover_podcasts", return_value=[{"name": "show"}]):
-                                # Patch remaining platforms to avoid network
-                                for m in ["discover_fourclaw", "discover_pinchedin", "discover_clawtasks",
-                                           "discover_clawnews", "discover_directory", "discover_agentchan",
-                                           "discover_colony", "discover_moltx", "discover_moltexchange"]:
-                                    setattr(client, m, Mock(return_value=[]))
-                                result = client.discover_all(limit=5)
+    client = offline_client({
+        "arxiv": [{"title": "paper"}],
+        "youtube": [{"title": "vid"}],
+        "podcasts": [{"name": "show"}],
+    })
+    result = client.discover_all(limit=5)
 
     assert "arxiv" in result
     assert "youtube" in result
@@ -380,16 +590,13 @@ def test_discover_all_include_health_metadata():
 def test_cli_discover_all_include_health_output():
     """CLI discover --platform all can show platform health summaries."""
     mock_client = Mock()
-    mock_client.discover_all.return_value = {
-        "bottube": [],
-        "_errors": {},
-        "_health": {
-            "bottube": {
-                "status": "ok",
-                "fresh": True,
-                "cached": False,
-            }
-        },
+    mock_client.iter_discover_all.return_value = iter([("bottube", [], 12.0)])
+    mock_client.discovery_health.return_value = {
+        "bottube": {
+            "status": "ok",
+            "fresh": True,
+            "cached": False,
+        }
     }
 
     args = Namespace(
@@ -407,10 +614,41 @@ def test_cli_discover_all_include_health_output():
                 cli.cmd_discover(args)
 
     text = output.getvalue()
-    mock_client.discover_all.assert_called_once_with(limit=5, include_health=True)
+    mock_client.iter_discover_all.assert_called_once_with(limit=5)
+    mock_client.discovery_health.assert_called_once()
     assert "BoTTube videos: 0 [ok, fresh]" in text
 
 
+def test_cli_discover_all_prints_platforms_as_they_complete():
+    """CLI discover --platform all streams counts in completion order."""
+    mock_client = Mock()
+    mock_client.iter_discover_all.return_value = iter([
+        ("nostr", [{"content": "gm"}], 40.0),
+        ("moltbook", RuntimeError("HTTP 503"), 900.0),
+        ("bottube", [{"title": "a"}, {"title": "b"}], 1500.0),
+    ])
+
+    args = Namespace(
+        platform="all",
+        category=None,
+        submolt="tech",
+        board=None,
+        limit=5,
+    )
+    with patch("grazer.cli.load_config", return_value={}):
+        with patch("grazer.cli._make_client", return_value=mock_client):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                cli.cmd_discover(args)
+
+    text = output.getvalue()
+    mock_client.discovery_health.assert_not_called()
+    assert "Nostr events: 1 (40ms)" in text
+    assert "Moltbook posts: OFFLINE (HTTP 503)" in text
+    assert "BoTTube videos: 2 (1500ms)" in text
+    assert text.index("Nostr events") < text.index("Moltbook posts") < text.index("BoTTube videos")
+
+
 def test_cli_discover_arxiv():
     """CLI discover --platform arxiv renders paper output."""
     mock_client = Mock()
@@ -0,0 +1,263 @@
+import multiprocessing
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import requests
+
+from grazer import GrazerClient, PLATFORMS
+from grazer.ratelimit import RateLimiterRegistry, SQLiteRateLimiter, ThreadSafeRateLimiter
+
+
+def test_registry_keys_urls_by_platform_or_host():
+    registry = RateLimiterRegistry(hosts={"www.moltbook.com": "moltbook", "www.4claw.org": "fourclaw"})
+
+    assert registry.key_for("https://www.moltbook.com/api/v1/posts") == "moltbook"
+    assert registry.key_for("https://moltbook.com/api/v1/posts") == "moltbook"
+    assert registry.key_for("https://www.4claw.org/api/v1/boards") == "fourclaw"
+    assert registry.key_for("https://export.arxiv.org/api/query") == "export.arxiv.org"
+    assert registry.for_url("https://www.moltbook.com/a") is registry.get("moltbook")
+
+
+def test_registry_applies_per_key_budgets():
+    registry = RateLimiterRegistry(
+        budgets={"moltbook": {"max_requests": 5, "window_seconds": 10}},
+        default_max_requests=7,
+        default_window_seconds=30.0,
+    )
+
+    moltbook = registry.get("moltbook")
+    other = registry.get("example.com")
+
+    assert (moltbook.max_requests, moltbook.window_seconds) == (5, 10.0)
+    assert (other.max_requests, other.window_seconds) == (7, 30.0)
+
+
+def test_exhausted_platform_does_not_block_unrelated_platforms():
+    registry = RateLimiterRegistry(
+        hosts={"www.moltbook.com": "moltbook", "www.4claw.org": "fourclaw"},
+        budgets={"moltbook": {"max_requests": 1, "window_seconds": 30}},
+    )
+    registry.acquire("https://www.moltbook.com/api/v1/posts")
+
+    blocked = threading.Thread(
+        target=registry.acquire, args=("https://www.moltbook.com/api/v1/posts",), daemon=True
+    )
+    blocked.start()
+
+    started = time.monotonic()
+    registry.acquire("https://www.4claw.org/api/v1/boards")
+    assert time.monotonic() - started < 0.5
+    assert blocked.is_alive()
+
+    stats = registry.get_stats()
+    assert stats["moltbook"]["available"] == 0
+    assert stats["fourclaw"]["requests_in_window"] == 1
+
+
+def test_client_uses_platform_budgets_and_overrides():
+    client = GrazerClient(rate_limits={"moltbook": {"max_requests": 12}})
+
+    with patch.object(requests.Session, "request", return_value=Mock()):
+        client._rate_limited_get("https://www.moltbook.com/api/v1/posts", timeout=1)
+        client._rate_limited_get("https://chan.alphakek.ai/api/boards", timeout=1)
+
+    stats = client._rate_limiters.get_stats()
+    assert stats["moltbook"]["max_requests"] == 12
+    assert stats["moltbook"]["requests_in_window"] == 1
+    assert stats["agentchan"]["requests_in_window"] == 1
+    assert client._rate_limiters.get("semantic_scholar").max_requests == (
+        PLATFORMS["semantic_scholar"]["rate_limit"]["max_requests"]
+    )
+
+
+def test_thread_safe_rate_limiter_still_importable_from_package():
+    from grazer import ThreadSafeRateLimiter as exported
+
+    assert exported is ThreadSafeRateLimiter
+
+
+def test_rate_limiter_blocks_until_oldest_request_expires():
+    limiter = ThreadSafeRateLimiter(max_requests=2, window_seconds=0.2)
+    limiter.acquire()
+    limiter.acquire()
+
+    started = time.monotonic()
+    limiter.acquire()
+    waited = time.monotonic() - started
+
+    assert 0.15 <= waited < 1.0
+    assert limiter.get_stats()["requests_in_window"] <= 2
+
+
+def test_rate_limiter_ignores_wall_clock_jumps():
+    limiter = ThreadSafeRateLimiter(max_requests=1, window_seconds=30.0)
+    limiter.acquire()
+
+    with patch("grazer.ratelimit._time.time", return_value=time.time() + 3600):
+        stats = limiter.get_stats()
+
+    assert stats["requests_in_window"] == 1
+    assert stats["available"] == 0
+
+
+def test_rate_limiter_backs_off_on_429_and_honours_retry_after():
+    limiter = ThreadSafeRateLimiter(max_requests=8, window_seconds=60.0)
+
+    limiter.observe(429, {"Retry-After": "0.2"})
+    stats = limiter.get_stats()
+    assert stats["max_requests"] == 4
+    assert stats["configured_max_requests"] == 8
+    assert 0 < stats["parked_seconds"] <= 0.2
+
+    started = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - started >= 0.15
+
+
+def test_rate_limiter_parks_until_advertised_reset():
+    limiter = ThreadSafeRateLimiter(max_requests=10, window_seconds=60.0)
+
+    limiter.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 5)})
+    stats = limiter.get_stats()
+
+    assert stats["max_requests"] == 10
+    assert 4 < stats["parked_seconds"] <= 5
+
+
+def test_rate_limiter_ramps_back_up_after_quiet_windows():
+    limiter = ThreadSafeRateLimiter(max_requests=20, window_seconds=0.1)
+    limiter.observe(429, {"Retry-After": "0"})
+    limiter.observe(429, {"Retry-After": "0"})
+    assert limiter.get_stats()["max_requests"] == 5
+
+    time.sleep(0.12)
+    assert limiter.get_stats()["max_requests"] == 7
+    time.sleep(0.12)
+    assert limiter.get_stats()["max_requests"] == 9
+
+
+def test_rate_limiter_ignores_unthrottled_and_unparseable_responses():
+    limiter = ThreadSafeRateLimiter(max_requests=5, window_seconds=60.0)
+
+    limiter.observe(200, {"X-RateLimit-Remaining": "12"})
+    limiter.observe(200, Mock())
+    limiter.observe(Mock(), {"Retry-After": "soon"})
+
+    stats = limiter.get_stats()
+    assert stats["max_requests"] == 5
+    assert stats["parked_seconds"] == 0
+
+
+def test_client_feeds_rate_limit_responses_back_per_platform():
+    client = GrazerClient()
+    throttled = Mock(status_code=429, headers={"Retry-After": "30"})
+
+    with patch.object(requests.Session, "request", return_value=throttled):
+        client._rate_limited_get("https://www.moltbook.com/api/v1/posts", timeout=1)
+
+    stats = client._rate_limiters.get_stats()
+    assert stats["moltbook"]["max_requests"] == 30
+    assert stats["moltbook"]["parked_seconds"] > 25
+    assert client._rate_limiters.get("fourclaw").get_stats()["parked_seconds"] == 0
+
+
+def _acquire_shared(path, count):
+    limiter = SQLiteRateLimiter(path, "moltbook", max_requests=1000, window_seconds=60.0)
+    for _ in range(count):
+        limiter.acquire()
+
+
+def test_sqlite_rate_limiter_shares_budget_across_instances(tmp_path):
+    path = str(tmp_path / "ratelimit.db")
+    first = SQLiteRateLimiter(path, "moltbook", max_requests=2, window_seconds=0.3)
+    second = SQLiteRateLimiter(path, "moltbook", max_requests=2, window_seconds=0.3)
+    other = SQLiteRateLimiter(path, "fourclaw", max_requests=2, window_seconds=0.3)
+
+    first.acquire()
+    second.acquire()
+    other.acquire()
+    assert first.get_stats()["available"] == 0
+    assert other.get_stats()["available"] == 1
+
+    started = time.monotonic()
+    second.acquire()
+    assert time.monotonic() - started >= 0.2
+
+
+def test_sqlite_rate_limiter_window_count_tracks_expiry(tmp_path):
+    path = str(tmp_path / "ratelimit.db")
+    limiter = SQLiteRateLimiter(path, "moltbook", max_requests=3, window_seconds=0.2)
+
+    assert [limiter.try_acquire() for _ in range(4)] == [True, True, True, False]
+    time.sleep(0.25)
+    assert limiter.try_acquire() is True
+
+    assert limiter.get_stats()["requests_in_window"] == 1
+    assert SQLiteRateLimiter(path, "moltbook", max_requests=3, window_seconds=0.2).get_stats()["available"] == 2
+
+
+def test_sqlite_rate_limiter_counts_requests_from_other_processes(tmp_path):
+    path = str(tmp_path / "ratelimit.db")
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_acquire_shared, args=(path, 5)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    limiter = SQLiteRateLimiter(path, "moltbook", max_requests=1000, window_seconds=60.0)
+    assert limiter.get_stats()["requests_in_window"] == 15
+
+
+def test_sqlite_rate_limiter_shares_throttling(tmp_path):
+    path = str(tmp_path / "ratelimit.db")
+    first = SQLiteRateLimiter(path, "mastodon", max_requests=10, window_seconds=60.0)
+    second = SQLiteRateLimiter(path, "mastodon", max_requests=10, window_seconds=60.0)
+
+    first.observe(429, {"Retry-After": "20"})
+
+    stats = second.get_stats()
+    assert stats["max_requests"] == 5
+    assert 15 < stats["parked_seconds"] <= 20
+
+
+def test_client_can_share_rate_limits_through_sqlite(tmp_path):
+    path = str(tmp_path / "ratelimit.db")
+    client = GrazerClient(rate_limit_db=path)
+
+    with patch.object(requests.Session, "request", return_value=Mock()):
+        client._rate_limited_get("https://www.moltbook.com/api/v1/posts", timeout=1)
+
+    limiter = client._rate_limiters.get("moltbook")
+    assert isinstance(limiter, SQLiteRateLimiter)
+    assert SQLiteRateLimiter(path, "moltbook").get_stats()["requests_in_window"] == 1
+
+
+def test_try_acquire_never_blocks(tmp_path):
+    for limiter in (
+        ThreadSafeRateLimiter(max_requests=1, window_seconds=60.0),
+        SQLiteRateLimiter(str(tmp_path / "ratelimit.db"), "semantic_scholar", max_requests=1, window_seconds=60.0),
+    ):
+        assert limiter.try_acquire() is True
+        started = time.monotonic()
+        assert limiter.try_acquire() is False
+        assert time.monotonic() - started < 0.5
+        assert limiter.get_stats()["requests_in_window"] == 1
+
+
+def test_acquire_gives_up_when_the_wait_exceeds_its_timeout(tmp_path):
+    for limiter in (
+        ThreadSafeRateLimiter(max_requests=1, window_seconds=0.2),
+        SQLiteRateLimiter(str(tmp_path / "ratelimit.db"), "moltbook", max_requests=1, window_seconds=0.2),
+    ):
+        assert limiter.acquire(timeout=0) is True
+        started = time.monotonic()
+        assert limiter.acquire(timeout=0.05) is False
+        assert time.monotonic() - started < 0.05
+        assert limiter.acquire(timeout=1.0) is True
+        assert limiter.get_stats()["requests_in_window"] == 1
+
+        limiter.throttle(retry_after=30)
+        assert limiter.acquire(timeout=1.0) is False
@@ -0,0 +1,200 @@
+import time
+from unittest.mock import patch
+
+import requests
+
+from grazer import GrazerClient, HttpTransport, ResponseCache, SQLiteResponseCache, cli
+from grazer.transport import RetryPolicy
+from grazer.cache import cache_key
+
+
+def _response(body, status=200):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body.encode()
+    resp.headers["Content-Type"] = "application/json"
+    resp.url = "https://bottube.ai/api/videos"
+    return resp
+
+
+def test_client_serves_repeated_discovery_from_cache():
+    client = GrazerClient(cache=ResponseCache(ttl=60))
+    body = '{"videos": [{"id": "v1", "title": "cached", "agent_name": "sophia"}]}'
+
+    with patch.object(requests.Session, "request", return_value=_response(body)) as send:
+        first = client.discover_bottube(limit=5)
+        second = client.discover_bottube(limit=5)
+
+    assert send.call_count == 1
+    assert first == second
+    assert second[0]["agent"] == "sophia"
+    stats = client.cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_cache_key_covers_method_url_params_and_auth():
+    base = cache_key("GET", "https://bottube.ai/api/videos", params={"limit": 5})
+
+    assert base == cache_key("get", "https://bottube.ai/api/videos?limit=5")
+    assert base != cache_key("GET", "https://bottube.ai/api/videos", params={"limit": 6})
+    assert base != cache_key("POST", "https://bottube.ai/api/videos", params={"limit": 5})
+    assert base != cache_key(
+        "GET", "https://bottube.ai/api/videos", params={"limit": 5}, headers={"authorization": "Bearer a"}
+    )
+    assert "Bearer" not in cache_key("GET", "https://x.test", headers={"Authorization": "Bearer secret"})
+
+
+def test_only_successful_gets_are_cached():
+    transport = HttpTransport(cache=ResponseCache(), retry=RetryPolicy(max_attempts=1))
+    session = transport.session()
+
+    with patch.object(requests.Session, "request", return_value=_response("{}", status=503)) as send:
+        session.get("https://bottube.ai/api/videos")
+        session.get("https://bottube.ai/api/videos")
+        session.post("https://bottube.ai/api/videos")
+        session.post("https://bottube.ai/api/videos")
+
+    assert send.call_count == 4
+    assert len(transport.cache) == 0
+
+
+def test_per_platform_ttls_and_lru_bound():
+    cache = ResponseCache(ttl=60, platform_ttls={"nostr": 0, "arxiv": 0.05}, max_entries=2)
+
+    cache.set("nostr-key", {"body": 1}, "nostr")
+    cache.set("arxiv-key", {"body": 2}, "arxiv")
+    assert cache.get("nostr-key") is None
+    assert cache.get("arxiv-key") == ({"body": 2}, False)
+
+    time.sleep(0.06)
+    assert cache.get("arxiv-key") is None
+
+    cache.set("a", {}, "bottube")
+    cache.set("b", {}, "bottube")
+    cache.get("a")
+    cache.set("c", {}, "bottube")
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_stale_entries_are_served_while_refreshing_in_background():
+    cache = ResponseCache(ttl=0.05, stale_while_revalidate=30)
+    transport = HttpTransport(cache=cache)
+    session = transport.session()
+    responses = iter([_response('{"version": 1}'), _response('{"version": 2}')])
+
+    with patch.object(requests.Session, "request", side_effect=lambda *a, **k: next(responses)):
+        assert session.get("https://bottube.ai/api/videos").json() == {"version": 1}
+        time.sleep(0.06)
+        assert session.get("https://bottube.ai/api/videos").json() == {"version": 1}
+
+        deadline = time.monotonic() + 2
+        while transport._refreshing and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert session.get("https://bottube.ai/api/videos").json() == {"version": 2}
+    assert cache.get_stats()["stale_hits"] == 1
+
+
+def test_sqlite_cache_survives_between_clients(tmp_path):
+    path = str(tmp_path / "cache.db")
+    body = '{"videos": [{"id": "v1", "title": "from disk"}]}'
+
+    with patch.object(requests.Session, "request", return_value=_response(body)) as send:
+        GrazerClient(cache=SQLiteResponseCache(path)).discover_bottube(limit=3)
+        second = GrazerClient(cache=SQLiteResponseCache(path))
+        videos = second.discover_bottube(limit=3)
+
+    assert send.call_count == 1
+    assert videos[0]["title"] == "from disk"
+    assert second.cache.get_stats()["hits"] == 1
+
+
+def test_sqlite_cache_uses_wal_and_expires_entries(tmp_path):
+    cache = SQLiteResponseCache(str(tmp_path / "cache.db"), ttl=0.05)
+    cache.set("key", {"status_code": 200, "content": b"body"}, "bottube")
+
+    assert cache._db.connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert cache.get("key") == ({"status_code": 200, "content": b"body"}, False)
+    time.sleep(0.06)
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_evicts_least_recently_used_past_max_bytes(tmp_path):
+    cache = SQLiteResponseCache(str(tmp_path / "cache.db"), max_bytes=2500)
+    for key in ("a", "b"):
+        cache.set(key, {"content": b"x" * 1000}, "bottube")
+    cache.get("a")
+    cache.set("c", {"content": b"x" * 1000}, "bottube")
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get_stats()["bytes"] <= 2500
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_discover_all_serves_normalized_items_from_cache(tmp_path, offline_client):
+    path = str(tmp_path / "cache.db")
+    first = offline_client({"arxiv": [{"title": "paper"}]}, cache=SQLiteResponseCache(path))
+    second = offline_client(cache=SQLiteResponseCache(path))
+
+    first.discover_all(limit=5)
+    results = second.discover_all(limit=5)
+
+    assert results["arxiv"] == [{"title": "paper"}]
+    second.discover_arxiv.assert_not_called()
+    second.discover_colony.assert_not_called()
+
+
+def test_discover_all_items_are_keyed_by_credential(offline_client):
+    cache = ResponseCache(ttl=60)
+    alice = offline_client({"moltbook": [{"title": "alice feed"}]}, moltbook_key="alice", cache=cache)
+    bob = offline_client({"moltbook": [{"title": "bob feed"}]}, moltbook_key="bob", cache=cache)
+
+    alice.discover_all(limit=5)
+    results = bob.discover_all(limit=5)
+
+    assert results["moltbook"] == [{"title": "bob feed"}]
+    bob.discover_moltbook.assert_called_once()
+    bob.discover_arxiv.assert_not_called()
+
+
+def test_items_lookups_are_counted_apart_from_http_lookups(tmp_path):
+    for cache in (ResponseCache(ttl=60), SQLiteResponseCache(str(tmp_path / "cache.db"), ttl=60)):
+        cache.set("key", {"status_code": 200, "content": b"body"}, "bottube")
+        cache.set_items("bottube", [{"title": "item"}], "bottube")
+        cache.get("key")
+        cache.get_items("bottube")
+        cache.get_items("moltbook")
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 0, 1.0)
+        assert (stats["items_hits"], stats["items_misses"]) == (1, 1)
+
+
+def test_discover_all_renormalizes_stale_items(offline_client):
+    client = offline_client({"arxiv": [{"title": "paper"}]}, cache=ResponseCache(ttl=0.05, stale_while_revalidate=30))
+
+    client.discover_all(limit=5)
+    client.discover_all(limit=5)
+    assert client.discover_arxiv.call_count == 1
+
+    time.sleep(0.06)
+    results = client.discover_all(limit=5)
+
+    assert results["arxiv"] == [{"title": "paper"}]
+    assert client.discover_arxiv.call_count == 2
+
+
+def test_cli_builds_disk_cache_from_config(tmp_path):
+    config = {"cache": {"path": str(tmp_path / "cache.db"), "ttl_seconds": 30, "max_mb": 1}}
+
+    client = cli._make_client(config)
+
+    assert isinstance(client.cache, SQLiteResponseCache)
+    assert client.cache.ttl == 30
+    assert client.cache.max_bytes == 1024 * 1024
+    assert cli._make_client({}).cache is None
+    assert cli._make_client(config, cache=None).cache is None
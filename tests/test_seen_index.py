@@ -0,0 +1,55 @@
+from unittest.mock import patch
+
+from grazer import SeenIndex, SQLiteSeenIndex
+
+
+def test_seen_index_reports_items_new_until_observed():
+    index = SeenIndex(ttl=60)
+
+    assert index.observe([["url:a"], ["url:b", "content:x"], ["url:a"]]) == [True, True, True]
+    assert index.observe([["url:a"], ["url:c", "content:x"], ["url:d"]]) == [False, False, True]
+    assert len(index) == 5
+    assert index.get_stats()["repeats"] == 2
+
+
+def test_seen_index_forgets_keys_after_ttl():
+    index = SeenIndex(ttl=10)
+    with patch("grazer.seen._time.time", return_value=1000.0):
+        index.observe([["url:a"]])
+    with patch("grazer.seen._time.time", return_value=1005.0):
+        assert index.observe([["url:a"]]) == [False]
+    with patch("grazer.seen._time.time", return_value=1016.0):
+        assert index.observe([["url:a"]]) == [True]
+
+
+def test_sqlite_seen_index_persists_across_instances(tmp_path):
+    path = str(tmp_path / "nested" / "seen.db")
+    first = SQLiteSeenIndex(path, ttl=60)
+    first.observe([["url:a"], ["content:b"]])
+
+    second = SQLiteSeenIndex(path, ttl=60)
+
+    assert second.observe([["url:a"], ["content:c"], ["content:b", "url:z"]]) == [False, True, False]
+    assert len(second) == 4
+    with patch("grazer.seen._time.time", return_value=10 ** 12):
+        assert second.observe([["url:a"]]) == [True]
+    assert len(second) == 1
+
+
+def test_discover_all_only_new_drops_items_from_earlier_sweeps(tmp_path, offline_client):
+    index = SQLiteSeenIndex(str(tmp_path / "seen.db"))
+    video = {"title": "Shared", "url": "https://bottube.ai/watch/1?utm_source=feed"}
+    paper = {"title": "Attention", "authors": "vaswani", "url": "https://arxiv.org/abs/1706.03762"}
+    client = offline_client({"bottube": [video], "arxiv": [paper]}, seen_index=index)
+
+    first = client.discover_all(limit=1, only_new=True)
+    client.discover_bottube.return_value = [video, {"title": "Fresh", "url": "https://bottube.ai/watch/2"}]
+    client.discover_moltbook.return_value = [{"title": "Mirror", "url": "https://www.bottube.ai/watch/1/"}]
+    second = client.discover_all(limit=1, only_new=True, deduplicate=True)
+
+    assert first["bottube"] == [video] and first["_seen"] == {}
+    assert [item["title"] for item in second["bottube"]] == ["Fresh"]
+    assert second["moltbook"] == [] and second["arxiv"] == []
+    assert second["_seen"] == {"bottube": 1, "moltbook": 1, "arxiv": 1}
+    assert len(second["_canonical"]) == 1
+    assert "_seen" not in client.discover_all(limit=1)
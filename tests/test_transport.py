@@ -0,0 +1,302 @@
+import io
+import time
+from collections import deque
+from unittest.mock import Mock, patch
+
+import requests
+
+from grazer import GrazerClient, HttpTransport
+from grazer import arxiv_grazer
+from grazer.arxiv_grazer import ArxivGrazer
+from grazer.ratelimit import RateLimiterRegistry
+from grazer.transport import RetryPolicy
+
+
+def test_client_and_plugins_share_one_connection_pool():
+    client = GrazerClient(bottube_key="key")
+    sessions = [
+        client.session,
+        client._clawhub.session,
+        client._bottube.session,
+        client._arxiv.session,
+        client._youtube.session,
+        client._podcast.session,
+        client._bluesky.session,
+        client._farcaster.session,
+        client._semantic_scholar.session,
+        client._openreview.session,
+        client._mastodon.session,
+        client._nostr.session,
+    ]
+
+    adapters = {id(session.get_adapter("https://example.com")) for session in sessions}
+    assert adapters == {id(client.transport.adapter)}
+    # Plugins keep their own default headers.
+    assert client._bottube.session.headers["Authorization"] == "Bearer key"
+    assert "Authorization" not in client.session.headers
+
+
+def test_plugin_requests_are_rate_limited_and_metered():
+    client = GrazerClient()
+    ok = Mock(status_code=200, headers={})
+
+    with patch.object(requests.Session, "request", return_value=ok):
+        client._arxiv.session.get("http://export.arxiv.org/api/query", timeout=5)
+        client._mastodon.session.get("https://mastodon.social/api/v1/timelines/public", timeout=5)
+
+    stats = client.transport.get_stats()
+    assert stats["arxiv"]["requests"] == 1
+    assert stats["arxiv"]["rate_limit"]["max_requests"] == 1
+    assert stats["mastodon"]["rate_limit"]["requests_in_window"] == 1
+    assert stats["mastodon"]["errors"] == 0
+
+
+def test_transport_counts_errors_and_throttling():
+    transport = HttpTransport(
+        rate_limiters=RateLimiterRegistry(hosts={"api.example.com": "example"}),
+        retry=RetryPolicy(max_attempts=1),
+    )
+    session = transport.session({"User-Agent": "test"})
+
+    with patch.object(requests.Session, "request", return_value=Mock(status_code=429, headers={})):
+        session.get("https://api.example.com/a")
+    with patch.object(requests.Session, "request", side_effect=requests.ConnectionError("down")):
+        try:
+            session.get("https://api.example.com/b")
+        except requests.ConnectionError:
+            pass
+
+    stats = transport.get_stats()["example"]
+    assert stats["requests"] == 2
+    assert stats["errors"] == 1
+    assert stats["throttled"] == 1
+
+
+def test_closing_a_plugin_session_keeps_the_shared_pool_open():
+    transport = HttpTransport()
+    ArxivGrazer(transport=transport).session.close()
+
+    with patch.object(transport.adapter, "close") as close:
+        transport.session().close()
+
+    close.assert_not_called()
+
+
+def _response(status, body="", headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body.encode()
+    resp.raw = io.BytesIO(resp._content)
+    resp.headers.update(headers or {})
+    return resp
+
+
+ATOM_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/abs/2401.00001v1</id>
+    <title>Cached Paper</title>
+    <summary>Abstract</summary>
+    <published>2024-01-01T00:00:00Z</published>
+    <author><name>Ada</name></author>
+  </entry>
+</feed>"""
+
+
+def test_feed_revalidates_with_validators_and_reuses_parsed_result_on_304():
+    transport = HttpTransport()
+    arxiv = ArxivGrazer(transport=transport)
+    fresh = _response(200, ATOM_FEED, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+    parse = Mock(wraps=arxiv_grazer._parse_atom_entries)
+
+    with patch.object(requests.Session, "request", side_effect=[fresh, _response(304)]) as send, \
+            patch.object(arxiv_grazer, "_parse_atom_entries", parse):
+        first = arxiv.discover(query="cache", limit=5)
+        second = arxiv.discover(query="cache", limit=5)
+
+    assert first == second
+    assert second[0]["title"] == "Cached Paper"
+    assert parse.call_count == 1
+    revalidation = send.call_args_list[1].kwargs["headers"]
+    assert revalidation["If-None-Match"] == '"v1"'
+    assert revalidation["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert transport.get_stats()["export.arxiv.org"]["not_modified"] == 1
+
+
+def test_conditional_cache_is_keyed_on_params_and_credentials():
+    transport = HttpTransport()
+    session = transport.session()
+    fresh = _response(200, '{"videos": [1]}', {"ETag": '"a"'})
+
+    with patch.object(requests.Session, "request", return_value=fresh) as send:
+        session.get_parsed("https://bottube.ai/api/videos", lambda r: r.json(), params={"limit": 1})
+        session.get_parsed("https://bottube.ai/api/videos", lambda r: r.json(), params={"limit": 2})
+        session.get_parsed(
+            "https://bottube.ai/api/videos", lambda r: r.json(),
+            params={"limit": 1}, headers={"Authorization": "Bearer other"},
+        )
+        session.get_parsed("https://bottube.ai/api/videos", lambda r: r.json(), params={"limit": 1})
+
+    sent = [call.kwargs.get("headers") or {} for call in send.call_args_list]
+    assert ["If-None-Match" in headers for headers in sent] == [False, False, False, True]
+
+
+def test_cached_feed_results_are_not_shared_with_callers():
+    transport = HttpTransport()
+    session = transport.session()
+    responses = [_response(200, '{"videos": [{"id": 1}]}', {"ETag": '"a"'}), _response(304), _response(304)]
+
+    with patch.object(requests.Session, "request", side_effect=responses):
+        session.get_parsed("https://bottube.ai/api/videos", lambda r: r.json())["videos"][0]["id"] = 99
+        session.get_parsed("https://bottube.ai/api/videos", lambda r: r.json())["videos"].clear()
+        third = session.get_parsed("https://bottube.ai/api/videos", lambda r: r.json())
+
+    assert third == {"videos": [{"id": 1}]}
+
+
+def _status(code):
+    return _response(code, "{}")
+
+
+def test_transient_failures_of_gets_are_retried_with_backoff():
+    transport = HttpTransport(
+        rate_limiters=RateLimiterRegistry(hosts={"api.example.com": "example"}),
+        retry=RetryPolicy(max_attempts=3, backoff_base=0.01),
+    )
+    session = transport.session()
+    outcomes = [requests.ConnectionError("reset"), _status(503), _status(200)]
+
+    with patch.object(requests.Session, "request", side_effect=outcomes) as send:
+        resp = session.get("https://api.example.com/feed")
+
+    assert resp.status_code == 200
+    assert send.call_count == 3
+    stats = transport.get_stats()["example"]
+    assert stats["retries"] == 2
+    assert stats["rate_limit"]["requests_in_window"] == 3
+
+
+def test_discarded_retry_responses_are_closed():
+    transport = HttpTransport(retry=RetryPolicy(max_attempts=3, backoff_base=0.01))
+    session = transport.session()
+    outcomes = [_status(502), _status(503), _status(200)]
+    for resp in outcomes:
+        resp.close = Mock()
+
+    with patch.object(requests.Session, "request", side_effect=outcomes):
+        resp = session.get("https://api.example.com/feed", stream=True)
+
+    assert resp is outcomes[2]
+    assert [r.close.call_count for r in outcomes] == [1, 1, 0]
+
+
+def test_posts_are_retried_only_with_idempotency_key():
+    transport = HttpTransport(retry=RetryPolicy(max_attempts=3, backoff_base=0.01))
+    session = transport.session()
+
+    with patch.object(requests.Session, "request", return_value=_status(502)) as send:
+        assert session.post("https://api.example.com/posts", json={}).status_code == 502
+        assert send.call_count == 1
+
+        session.post("https://api.example.com/posts", json={}, headers={"Idempotency-Key": "k1"})
+        assert send.call_count == 4
+
+
+def test_retries_stop_at_attempt_limit_and_deadline():
+    transport = HttpTransport(retry=RetryPolicy(max_attempts=5, backoff_base=0.2, backoff_cap=0.2))
+    session = transport.session()
+
+    with patch.object(requests.Session, "request", return_value=_status(504)) as send, \
+            patch("grazer.transport.random.uniform", side_effect=lambda low, high: high):
+        transport.deadline.at = time.monotonic() + 0.3
+        try:
+            assert session.get("https://api.example.com/slow").status_code == 504
+        finally:
+            transport.deadline.at = None
+
+    assert send.call_count == 2
+
+
+def test_client_errors_and_probes_are_not_retried():
+    client = GrazerClient(retry=RetryPolicy(max_attempts=3, backoff_base=0.01))
+
+    with patch.object(requests.Session, "request", return_value=_status(404)) as send:
+        client._rate_limited_get("https://www.moltbook.com/api/v1/posts")
+    assert send.call_count == 1
+
+    with patch.object(requests.Session, "request", return_value=_status(503)) as send:
+        client.platform_status(["moltbook"])
+    assert send.call_count == 1
+
+
+def _hedging_transport(**kwargs):
+    return HttpTransport(
+        rate_limiters=RateLimiterRegistry(hosts={"api.semanticscholar.org": "semantic_scholar"}, **kwargs),
+        hedge_platforms=["semantic_scholar"],
+    )
+
+
+def _learn_latency(transport, seconds, count=20):
+    transport._latencies["semantic_scholar"] = deque([seconds] * count)
+
+
+def test_slow_request_is_hedged_at_p95_and_fastest_response_wins():
+    transport = _hedging_transport()
+    session = transport.session()
+    _learn_latency(transport, 0.05)
+    slow = _status(200)
+    slow.close = Mock()
+    fast = _status(200)
+    calls = []
+
+    def send(*args, **kwargs):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            time.sleep(0.5)
+            return slow
+        return fast
+
+    with patch.object(requests.Session, "request", side_effect=send):
+        started = time.monotonic()
+        resp = session.get("https://api.semanticscholar.org/graph/v1/paper/search")
+        elapsed = time.monotonic() - started
+        time.sleep(0.6)
+
+    assert resp is fast
+    assert elapsed < 0.3
+    assert calls[1] - calls[0] >= 0.04
+    slow.close.assert_called_once()
+    stats = transport.get_stats()["semantic_scholar"]
+    assert (stats["hedged"], stats["hedge_wins"]) == (1, 1)
+    assert stats["rate_limit"]["requests_in_window"] == 2
+
+
+def test_hedging_is_opt_in_and_waits_for_enough_samples():
+    transport = _hedging_transport()
+    assert transport.hedge_delay("semantic_scholar") is None
+    _learn_latency(transport, 0.2, count=19)
+    assert transport.hedge_delay("semantic_scholar") is None
+    _learn_latency(transport, 0.2)
+    assert transport.hedge_delay("semantic_scholar") == 0.2
+    assert transport.hedge_delay("mastodon") is None
+
+    assert GrazerClient().transport.hedge_platforms == frozenset()
+    client = GrazerClient(hedge_platforms=["semantic_scholar", "openreview", "mastodon"])
+    assert client.transport.hedge_platforms == {"semantic_scholar", "openreview", "mastodon"}
+
+
+def test_hedge_is_skipped_when_rate_budget_is_exhausted():
+    transport = _hedging_transport(budgets={"semantic_scholar": {"max_requests": 1, "window_seconds": 60}})
+    session = transport.session()
+    _learn_latency(transport, 0.01)
+
+    def send(*args, **kwargs):
+        time.sleep(0.1)
+        return _status(200)
+
+    with patch.object(requests.Session, "request", side_effect=send) as mock_send:
+        session.get("https://api.semanticscholar.org/graph/v1/paper/search")
+
+    assert mock_send.call_count == 1
+    assert transport.get_stats()["semantic_scholar"]["hedged"] == 0